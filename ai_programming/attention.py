@@ -0,0 +1,95 @@
+"""A tiny, seeded multi-head self-attention layer for the transformer scenes.
+
+Nothing here is trained -- the point is that every weight on screen comes out
+of the real computation: the prompt is tokenized, each token gets a random
+embedding (seeded by the token text, so the same word always looks the same)
+plus a sinusoidal position code, and all heads are evaluated together as
+batched ``(heads, tokens, d_head)`` einsums.
+
+    tokens = tokenize("def calculate(x, y):")
+    layer = AttentionLayer(heads=4, seed=7)
+    result = layer(tokens)
+    result.weights            # (4, 8, 8), every row sums to 1
+    result.output             # (8, d_model), concatenated heads @ W_o
+"""
+
+import re
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text: str) -> list:
+    """Identifiers / numbers as one token each, every other non-space character on its own."""
+    return _TOKEN.findall(text)
+
+
+def embed(tokens, d_model: int = 32, seed: int = 0) -> np.ndarray:
+    """``(T, d_model)`` token embeddings: a per-token random vector plus a sinusoidal position code."""
+    vectors = np.array([
+        np.random.default_rng([seed, zlib.crc32(token.encode())]).standard_normal(d_model)
+        for token in tokens
+    ]).reshape(len(tokens), d_model)
+    position = np.arange(len(tokens))[:, None]
+    freq = 10000.0 ** (-np.arange(0, d_model, 2) / d_model)
+    code = np.zeros((len(tokens), d_model))
+    code[:, 0::2] = np.sin(position * freq)
+    code[:, 1::2] = np.cos(position * freq[:d_model // 2])
+    return vectors + code
+
+
+def softmax(x: np.ndarray, axis: int = -1) -> np.ndarray:
+    e = np.exp(x - x.max(axis=axis, keepdims=True))
+    return e / e.sum(axis=axis, keepdims=True)
+
+
+def causal_mask(n: int) -> np.ndarray:
+    """True where a token may attend: itself and everything before it."""
+    return np.tril(np.ones((n, n), dtype=bool))
+
+
+def scaled_dot_product(q: np.ndarray, k: np.ndarray, v: np.ndarray, mask: np.ndarray = None,
+                       temperature: float = 1.0):
+    """Batched ``softmax(q k^T / sqrt(d)) v`` over leading axes; returns (output, weights)."""
+    scores = np.einsum("...td,...sd->...ts", q, k) / (np.sqrt(q.shape[-1]) * temperature)
+    if mask is not None:
+        scores = np.where(mask, scores, -np.inf)
+    weights = softmax(scores)
+    return weights @ v, weights
+
+
+@dataclass(frozen=True)
+class AttentionResult:
+    tokens: list
+    weights: np.ndarray           # (heads, T, T) attention of each query row over keys
+    head_outputs: np.ndarray      # (heads, T, d_head)
+    output: np.ndarray            # (T, d_model)
+
+
+class AttentionLayer:
+    """Seeded projections ``W_q``, ``W_k``, ``W_v`` (heads, d_model, d_head) and ``W_o``."""
+
+    def __init__(self, heads: int = 4, d_model: int = 32, seed: int = 0, temperature: float = 1.0):
+        if d_model % heads:
+            raise ValueError(f"d_model={d_model} is not divisible by heads={heads}")
+        self.heads = heads
+        self.d_model = d_model
+        self.d_head = d_model // heads
+        self.seed = seed
+        self.temperature = temperature
+        rng = np.random.default_rng(seed)
+        scale = 1 / np.sqrt(d_model)
+        self.W_qkv = rng.standard_normal((3, heads, d_model, self.d_head)) * scale
+        self.W_o = rng.standard_normal((d_model, d_model)) * scale
+
+    def __call__(self, tokens, causal: bool = False) -> AttentionResult:
+        tokens = tokenize(tokens) if isinstance(tokens, str) else list(tokens)
+        x = embed(tokens, self.d_model, self.seed)
+        q, k, v = np.einsum("td,chde->chte", x, self.W_qkv)       # each (heads, T, d_head)
+        mask = causal_mask(len(tokens)) if causal else None
+        heads, weights = scaled_dot_product(q, k, v, mask, self.temperature)
+        output = heads.transpose(1, 0, 2).reshape(len(tokens), self.d_model) @ self.W_o
+        return AttentionResult(tokens, weights, heads, output)
@@ -0,0 +1,229 @@
+"""Embedding-space engine for the token-cloud scenes: vocabulary, embeddings, PCA, KD-tree.
+
+The vocabulary is Python itself -- keywords grouped by role, builtins,
+exceptions, dunder methods, standard-library modules and generated
+``verb_noun`` identifiers -- about a thousand tokens. Each group has a
+seeded centroid and each token a seeded offset from it (seeded by the token
+text, so a word lands in the same place on every render), so tokens of one kind
+really do cluster. ``project`` reduces any number of embeddings to 3D with one
+SVD, and ``KDTree`` answers the "which tokens are closest?" highlight queries.
+
+    vocab = Vocabulary.python()
+    coords = project(embed(vocab), dims=3, extent=2.8)      # (N, 3) scene coords
+    tree = KDTree(coords)
+    dist, near = tree.query(coords[vocab.index("def")], k=6)
+"""
+
+import heapq
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+KEYWORD_ROLES = {
+    "definition": ["def", "class", "lambda", "return", "yield", "async", "await", "global", "nonlocal"],
+    "control": ["for", "while", "if", "elif", "else", "break", "continue", "pass", "match", "case"],
+    "error": ["try", "except", "finally", "raise", "assert", "with"],
+    "logic": ["and", "or", "not", "is", "in", "True", "False", "None"],
+    "module": ["import", "from", "as", "del"],
+}
+VERBS = ["get", "set", "load", "save", "parse", "build", "update", "compute", "render", "fetch",
+         "send", "read", "write", "find", "make", "check", "sort", "merge", "split", "draw"]
+NOUNS = ["user", "file", "data", "config", "item", "node", "list", "value", "path", "token",
+         "model", "frame", "image", "result", "request", "cache", "index", "graph", "table", "event",
+         "buffer", "layer", "score", "batch", "query", "state", "point", "name", "key", "record"]
+
+# The rest of the vocabulary is frozen here (taken from CPython 3.11) rather than read from the
+# running interpreter, so another Python version cannot move the cloud or change the neighbours.
+KEYWORDS = [
+    "False", "None", "True", "and", "as", "assert", "async", "await", "break", "class", "continue", "def",
+    "del", "elif", "else", "except", "finally", "for", "from", "global", "if", "import", "in", "is",
+    "lambda", "nonlocal", "not", "or", "pass", "raise", "return", "try", "while", "with", "yield", "_",
+    "case", "match",
+]
+EXCEPTIONS = [
+    "ArithmeticError", "AssertionError", "AttributeError", "BaseException", "BlockingIOError",
+    "BrokenPipeError", "BufferError", "BytesWarning", "ChildProcessError", "ConnectionAbortedError",
+    "ConnectionError", "ConnectionRefusedError", "ConnectionResetError", "DeprecationWarning", "EOFError",
+    "EncodingWarning", "EnvironmentError", "Exception", "FileExistsError", "FileNotFoundError",
+    "FloatingPointError", "FutureWarning", "IOError", "ImportError", "ImportWarning", "IndentationError",
+    "IndexError", "InterruptedError", "IsADirectoryError", "KeyError", "LookupError", "MemoryError",
+    "ModuleNotFoundError", "NameError", "NotADirectoryError", "NotImplementedError", "OSError",
+    "OverflowError", "PendingDeprecationWarning", "PermissionError", "ProcessLookupError", "RecursionError",
+    "ReferenceError", "ResourceWarning", "RuntimeError", "RuntimeWarning", "SyntaxError", "SyntaxWarning",
+    "SystemError", "TabError", "TimeoutError", "TypeError", "UnboundLocalError", "UnicodeDecodeError",
+    "UnicodeEncodeError", "UnicodeError", "UnicodeTranslateError", "UnicodeWarning", "UserWarning",
+    "ValueError", "Warning", "ZeroDivisionError",
+]
+BUILTINS = [
+    "abs", "aiter", "all", "anext", "any", "ascii", "bin", "bool", "breakpoint", "bytearray", "bytes",
+    "callable", "chr", "classmethod", "compile", "complex", "copyright", "credits", "delattr", "dict",
+    "dir", "divmod", "enumerate", "eval", "exec", "exit", "filter", "float", "format", "frozenset",
+    "getattr", "globals", "hasattr", "hash", "help", "hex", "id", "input", "int", "isinstance",
+    "issubclass", "iter", "len", "license", "list", "locals", "map", "max", "memoryview", "min", "next",
+    "object", "oct", "open", "ord", "pow", "print", "property", "quit", "range", "repr", "reversed",
+    "round", "set", "setattr", "slice", "sorted", "staticmethod", "str", "sum", "super", "tuple", "type",
+    "vars", "zip",
+]
+DUNDERS = [
+    "__abs__", "__add__", "__and__", "__bool__", "__ceil__", "__class__", "__class_getitem__",
+    "__contains__", "__delattr__", "__delitem__", "__dir__", "__divmod__", "__doc__", "__eq__", "__float__",
+    "__floor__", "__floordiv__", "__format__", "__ge__", "__getattribute__", "__getitem__",
+    "__getnewargs__", "__getstate__", "__gt__", "__hash__", "__iadd__", "__imul__", "__index__", "__init__",
+    "__init_subclass__", "__int__", "__invert__", "__ior__", "__iter__", "__le__", "__len__", "__lshift__",
+    "__lt__", "__mod__", "__mul__", "__ne__", "__neg__", "__new__", "__or__", "__pos__", "__pow__",
+    "__radd__", "__rand__", "__rdivmod__", "__reduce__", "__reduce_ex__", "__repr__", "__reversed__",
+    "__rfloordiv__", "__rlshift__", "__rmod__", "__rmul__", "__ror__", "__round__", "__rpow__",
+    "__rrshift__", "__rshift__", "__rsub__", "__rtruediv__", "__rxor__", "__setattr__", "__setitem__",
+    "__sizeof__", "__str__", "__sub__", "__subclasshook__", "__truediv__", "__trunc__", "__xor__",
+]
+STDLIB_MODULES = [
+    "abc", "aifc", "antigravity", "argparse", "array", "ast", "asynchat", "asyncio", "asyncore", "atexit",
+    "audioop", "base64", "bdb", "binascii", "bisect", "builtins", "bz2", "cProfile", "calendar", "cgi",
+    "cgitb", "chunk", "cmath", "cmd", "code", "codecs", "codeop", "collections", "colorsys", "compileall",
+    "concurrent", "configparser", "contextlib", "contextvars", "copy", "copyreg", "crypt", "csv", "ctypes",
+    "curses", "dataclasses", "datetime", "dbm", "decimal", "difflib", "dis", "distutils", "doctest",
+    "email", "encodings", "ensurepip", "enum", "errno", "faulthandler", "fcntl", "filecmp", "fileinput",
+    "fnmatch", "fractions", "ftplib", "functools", "gc", "genericpath", "getopt", "getpass", "gettext",
+    "glob", "graphlib", "grp", "gzip", "hashlib", "heapq", "hmac", "html", "http", "idlelib", "imaplib",
+    "imghdr", "imp", "importlib", "inspect", "io", "ipaddress", "itertools", "json", "keyword", "lib2to3",
+    "linecache", "locale", "logging", "lzma", "mailbox", "mailcap", "marshal", "math", "mimetypes", "mmap",
+    "modulefinder", "msilib", "msvcrt", "multiprocessing", "netrc", "nis", "nntplib", "nt", "ntpath",
+    "nturl2path", "numbers", "opcode", "operator", "optparse", "os", "ossaudiodev", "pathlib", "pdb",
+    "pickle", "pickletools", "pipes", "pkgutil", "platform", "plistlib", "poplib", "posix", "posixpath",
+    "pprint", "profile", "pstats", "pty", "pwd", "py_compile", "pyclbr", "pydoc", "pydoc_data", "pyexpat",
+    "queue", "quopri", "random", "re", "readline", "reprlib", "resource", "rlcompleter", "runpy", "sched",
+    "secrets", "select", "selectors", "shelve", "shlex", "shutil", "signal", "site", "smtpd", "smtplib",
+    "sndhdr", "socket", "socketserver", "spwd", "sqlite3", "sre_compile", "sre_constants", "sre_parse",
+    "ssl", "stat", "statistics", "string", "stringprep", "struct", "subprocess", "sunau", "symtable", "sys",
+    "sysconfig", "syslog", "tabnanny", "tarfile", "telnetlib", "tempfile", "termios", "textwrap", "this",
+    "threading", "time", "timeit", "tkinter", "token", "tokenize", "tomllib", "trace", "traceback",
+    "tracemalloc", "tty", "turtle", "turtledemo", "types", "typing", "unicodedata", "unittest", "urllib",
+    "uu", "uuid", "venv", "warnings", "wave", "weakref", "webbrowser", "winreg", "winsound", "wsgiref",
+    "xdrlib", "xml", "xmlrpc", "zipapp", "zipfile", "zipimport", "zlib", "zoneinfo",
+]
+
+
+# ========================== VOCABULARY ==========================
+@dataclass(frozen=True)
+class Vocabulary:
+    tokens: tuple
+    groups: np.ndarray            # (N,) group index of every token
+    group_names: tuple
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def index(self, token: str) -> int:
+        return self.tokens.index(token)
+
+    @classmethod
+    def from_groups(cls, groups: dict) -> "Vocabulary":
+        """``{group name: [tokens]}``; a token keeps the first group it appears in."""
+        tokens, labels, seen = [], [], set()
+        for g, words in enumerate(groups.values()):
+            for word in words:
+                if word not in seen:
+                    seen.add(word)
+                    tokens.append(word)
+                    labels.append(g)
+        return cls(tuple(tokens), np.array(labels, dtype=np.int64), tuple(groups))
+
+    @classmethod
+    def python(cls) -> "Vocabulary":
+        groups = dict(KEYWORD_ROLES)
+        groups["keyword"] = KEYWORDS
+        groups["exception"] = EXCEPTIONS
+        groups["builtin"] = BUILTINS
+        groups["dunder"] = DUNDERS
+        groups["stdlib"] = STDLIB_MODULES
+        groups["identifier"] = [f"{verb}_{noun}" for verb in VERBS for noun in NOUNS]
+        return cls.from_groups(groups)
+
+
+def _token_rng(token: str, seed: int):
+    return np.random.default_rng([seed, zlib.crc32(token.encode())])
+
+
+def embed(vocab: Vocabulary, dim: int = 64, spread: float = 0.45, seed: int = 0) -> np.ndarray:
+    """``(N, dim)`` embeddings: a seeded centroid per group plus a seeded per-token offset."""
+    centroids = np.random.default_rng(seed).standard_normal((len(vocab.group_names), dim))
+    offsets = np.array([_token_rng(token, seed).standard_normal(dim) for token in vocab.tokens])
+    return centroids[vocab.groups] + spread * offsets.reshape(len(vocab), dim)
+
+
+def project(x: np.ndarray, dims: int = 3, extent: float = None):
+    """Principal-component coordinates ``(N, dims)`` from one thin SVD of the centred data.
+
+    With ``extent`` the result is scaled so the largest coordinate magnitude equals it.
+    """
+    centred = x - x.mean(axis=0)
+    _, _, vt = np.linalg.svd(centred, full_matrices=False)
+    coords = centred @ vt[:dims].T
+    if extent is not None:
+        coords *= extent / max(np.abs(coords).max(), 1e-12)
+    return coords
+
+
+# ========================== KD-TREE ==========================
+class KDTree:
+    """Static k-d tree over ``(N, d)`` points, stored as flat node arrays.
+
+    Nodes split at the median of their widest dimension until at most ``leaf_size`` points
+    remain; every node keeps its bounding box, so queries visit nodes best-first and stop as
+    soon as no box can beat the current k-th distance.
+    """
+
+    def __init__(self, points, leaf_size: int = 16):
+        self.points = np.asarray(points, dtype=float)
+        self.index = np.arange(len(self.points))
+        self.leaf_size = leaf_size
+        self.bounds, self.ranges, self.children = [], [], []
+        self._build(0, len(self.points))
+        self.bounds = np.array(self.bounds)            # (nodes, 2, d) box min / max
+        self.ranges = np.array(self.ranges)            # (nodes, 2) slice of self.index
+        self.children = np.array(self.children)        # (nodes, 2), -1 for leaves
+
+    def _build(self, lo: int, hi: int) -> int:
+        node = len(self.ranges)
+        members = self.points[self.index[lo:hi]]
+        self.bounds.append([members.min(axis=0), members.max(axis=0)])
+        self.ranges.append([lo, hi])
+        self.children.append([-1, -1])
+        if hi - lo > self.leaf_size:
+            axis = int(np.argmax(self.bounds[node][1] - self.bounds[node][0]))
+            mid = (hi - lo) // 2
+            self.index[lo:hi] = self.index[lo:hi][np.argpartition(members[:, axis], mid)]
+            self.children[node] = [self._build(lo, lo + mid), self._build(lo + mid, hi)]
+        return node
+
+    def _box_distance(self, node: int, x: np.ndarray) -> float:
+        lo, hi = self.bounds[node]
+        return float(np.linalg.norm(np.maximum(0, np.maximum(lo - x, x - hi))))
+
+    def _query_one(self, x: np.ndarray, k: int):
+        best_d, best_i = np.full(k, np.inf), np.full(k, -1)
+        heap = [(0.0, 0)]
+        while heap:
+            box, node = heapq.heappop(heap)
+            if box > best_d[-1]:
+                break
+            left, right = self.children[node]
+            if left < 0:
+                idx = self.index[slice(*self.ranges[node])]
+                d = np.linalg.norm(self.points[idx] - x, axis=1)
+                cand_d, cand_i = np.concatenate([best_d, d]), np.concatenate([best_i, idx])
+                keep = np.argsort(cand_d, kind="stable")[:k]
+                best_d, best_i = cand_d[keep], cand_i[keep]
+            else:
+                for child in (left, right):
+                    heapq.heappush(heap, (self._box_distance(child, x), child))
+        return best_d, best_i
+
+    def query(self, x, k: int = 1):
+        """Distances and indices of the ``k`` nearest points, nearest first; ``x`` is one point or ``(Q, d)``."""
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            return self._query_one(x, k)
+        results = [self._query_one(row, k) for row in x]
+        return np.array([d for d, _ in results]), np.array([i for _, i in results])
@@ -1,5 +1,16 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.heatmap import Heatmap
+from shared.network import ForwardPulse, NetworkDiagram
+from shared.point_cloud import PointCloud, RevealPoints, ShiftPointColors
+
+from attention import AttentionLayer, tokenize
+from embedding import KDTree, Vocabulary, embed, project
 
 # Vibrant Space Tech Color Palette
 DEEP_NAVY = "#020B1F"
@@ -63,36 +74,12 @@ class Part2(Scene):
         title = Text("The AI Brain", font_size=56, color=ELECTRIC_CYAN)
         title.to_edge(UP, buff=0.5)
         
-        # Create neural network visualization
-        layers = []
-        layer_sizes = [4, 6, 8, 6, 4]
-        x_positions = [-4, -2, 0, 2, 4]
-        
-        all_nodes = VGroup()
-        all_edges = VGroup()
-        
-        for i, (size, x) in enumerate(zip(layer_sizes, x_positions)):
-            layer = VGroup()
-            for j in range(size):
-                y = (j - (size-1)/2) * 0.6
-                node = Circle(radius=0.15, color=ELECTRIC_CYAN, fill_opacity=0.8)
-                node.move_to([x, y, 0])
-                node.set_stroke(ELECTRIC_CYAN, width=2)
-                layer.add(node)
-            layers.append(layer)
-            all_nodes.add(layer)
-        
-        # Create edges between layers
-        for i in range(len(layers)-1):
-            for node1 in layers[i]:
-                for node2 in layers[i+1]:
-                    edge = Line(
-                        node1.get_center(), node2.get_center(),
-                        stroke_width=0.5, color=SUBTLE_NAVY
-                    )
-                    all_edges.add(edge)
-        
-        network = VGroup(all_edges, all_nodes).shift(UP*0.5)
+        # Create neural network visualization: ~2,000 edges in one array-backed bundle
+        network = NetworkDiagram(
+            [12, 24, 32, 24, 12], layer_spacing=2, node_spacing=0.14, node_radius=0.05,
+            node_color=ELECTRIC_CYAN, active_node_color=NEON_PINK,
+            edge_color=SUBTLE_NAVY, active_edge_color=ELECTRIC_CYAN, edge_width=0.5,
+        ).shift(UP*0.5)
         
         subtitle = Text("Billions of Parameters, One Goal", font_size=32, color=WHITE)
         subtitle2 = Text("Understanding Language", font_size=36, color=VIBRANT_ORANGE)
@@ -100,29 +87,13 @@ class Part2(Scene):
         
         # Animations
         self.play(Write(title), run_time=1.5)
-        self.play(Create(all_edges), run_time=2)
-        self.play(
-            *[GrowFromCenter(node) for layer in layers for node in layer],
-            run_time=2
-        )
+        self.play(Create(network.edges), run_time=2)
+        self.play(RevealPoints(network.nodes, lag_ratio=0.005, scale=0), run_time=2)
         self.wait(1)
         
-        # Pulse animation
+        # Pulse animation: one activation wave per pass, layer by layer
         for _ in range(2):
-            self.play(
-                *[node.animate.set_fill(NEON_PINK, opacity=1) for node in layers[0]],
-                run_time=0.3
-            )
-            for i in range(1, len(layers)):
-                self.play(
-                    *[node.animate.set_fill(ELECTRIC_CYAN, opacity=0.8) for node in layers[i-1]],
-                    *[node.animate.set_fill(NEON_PINK, opacity=1) for node in layers[i]],
-                    run_time=0.4
-                )
-            self.play(
-                *[node.animate.set_fill(ELECTRIC_CYAN, opacity=0.8) for node in layers[-1]],
-                run_time=0.3
-            )
+            self.play(ForwardPulse(network), run_time=2.2)
         
         self.play(FadeIn(subtitles, shift=UP), run_time=1.5)
         self.wait(3)
@@ -372,29 +343,15 @@ class Part6(ThreeDScene):
         title.to_corner(UL, buff=0.5)
         self.add_fixed_in_frame_mobjects(title)
         
-        # Token points in 3D space
-        token_data = [
-            ("def", [1, 1, 2], ELECTRIC_CYAN),
-            ("function", [1.2, 0.8, 2.1], ELECTRIC_CYAN),
-            ("print", [-1, 1, 0], NEON_PINK),
-            ("return", [-0.8, 1.2, -0.2], NEON_PINK),
-            ("for", [0, -1, 1], VIBRANT_ORANGE),
-            ("while", [0.2, -0.8, 1.1], VIBRANT_ORANGE),
-        ]
-        
-        points = VGroup()
-        labels = VGroup()
-        for token, pos, color in token_data:
-            sphere = Sphere(radius=0.15, resolution=(16, 16))
-            sphere.set_color(color)
-            sphere.move_to(pos)
-            points.add(sphere)
-            
-            label = Text(token, font_size=18, color=color)
-            label.move_to(pos)
-            label.shift(UP*0.3 + RIGHT*0.3)
-            self.add_fixed_orientation_mobjects(label)
-            labels.add(label)
+        # Token cloud: real embeddings for the whole vocabulary, projected to 3D
+        vocab = Vocabulary.python()
+        coords = project(embed(vocab, seed=3), dims=3, extent=2.8)
+        tree = KDTree(coords)
+        palette = [ELECTRIC_CYAN, NEON_PINK, VIBRANT_ORANGE, WHITE]
+        base_radius = 0.03
+        cloud = PointCloud(coords, radius=base_radius, opacity=0.7,
+                           color=[palette[g % len(palette)] for g in vocab.groups])
+        cloud.add_updater(lambda m: m.face_camera(self.camera))
         
         explanation = Text("Similar tokens cluster together", font_size=28, color=WHITE)
         explanation.to_edge(DOWN, buff=0.5)
@@ -403,13 +360,28 @@ class Part6(ThreeDScene):
         # Animations
         self.play(Write(title), run_time=1)
         self.play(Create(axes), run_time=2)
-        
-        for point, label in zip(points, labels):
-            self.play(
-                GrowFromCenter(point),
-                FadeIn(label),
-                run_time=0.6
+        self.play(RevealPoints(cloud, lag_ratio=0.002, scale=0.2), run_time=2.5)
+        
+        # Nearest-neighbour queries
+        colors = cloud.rgbs.copy()
+        for row, (token, color) in enumerate([("def", ELECTRIC_CYAN), ("print", NEON_PINK), ("for", VIBRANT_ORANGE)]):
+            point = coords[vocab.index(token)]
+            _, near = tree.query(point, k=6)
+            radii = np.full(cloud.n_points, base_radius)
+            radii[near] = 0.08
+            colors[near] = color_to_rgb(color)
+            
+            label = Text(token, font_size=18, color=color)
+            label.move_to(point + UP*0.3 + RIGHT*0.3)
+            self.add_fixed_orientation_mobjects(label)
+            neighbours = Text(
+                f"{token}: " + ", ".join(vocab.tokens[i] for i in near[1:]), font_size=18, color=color
             )
+            neighbours.to_corner(UR, buff=0.5).shift(DOWN*0.4*row)
+            self.add_fixed_in_frame_mobjects(neighbours)
+            
+            self.play(cloud.animate.set_radii(radii), FadeIn(label), run_time=0.6)
+            self.play(ShiftPointColors(cloud, colors), FadeIn(neighbours), run_time=0.6)
         
         # Rotate camera
         self.play(FadeIn(explanation), run_time=1)
@@ -494,8 +466,9 @@ class Part8(Scene):
         title = Text("Self-Attention in Action", font_size=48, color=ELECTRIC_CYAN)
         title.to_edge(UP, buff=0.3)
         
-        # Code tokens
-        tokens = ["def", "calculate", "(", "x", ",", "y", ")", ":"]
+        # Code tokens, and one real (seeded, untrained) attention layer over them
+        tokens = tokenize("def calculate(x, y):")
+        attention = AttentionLayer(heads=4, seed=7)(tokens)
         token_boxes = VGroup()
         
         for token in tokens:
@@ -510,8 +483,9 @@ class Part8(Scene):
         token_boxes.arrange(RIGHT, buff=0.15)
         token_boxes.shift(UP*1)
         
-        # Attention lines from "def"
-        attention_weights = [1.0, 0.8, 0.1, 0.3, 0.05, 0.25, 0.1, 0.6]
+        # Attention lines from "def": its row of the head-averaged matrix, scaled to the strongest link
+        attention_weights = attention.weights.mean(axis=0)[0]
+        attention_weights = attention_weights / attention_weights[1:].max()
         attention_lines = VGroup()
         
         source = token_boxes[0]  # "def"
@@ -523,7 +497,7 @@ class Part8(Scene):
                 stroke_width=weight * 6,
                 color=NEON_PINK
             )
-            line.set_opacity(weight)
+            line.set_opacity(min(weight, 1))
             attention_lines.add(line)
         
         # Weight labels
@@ -579,12 +553,13 @@ class Part9(Scene):
         title = Text("Multi-Head Attention", font_size=48, color=ELECTRIC_CYAN)
         title.to_edge(UP, buff=0.3)
         
-        # Multiple attention heads
+        # Multiple attention heads over the same prompt as Part8
         head_colors = [ELECTRIC_CYAN, NEON_PINK, VIBRANT_ORANGE, "#00FF88"]
-        heads = VGroup()
+        attention = AttentionLayer(heads=len(head_colors), seed=7)("def calculate(x, y):")
+        heads = Group()
         
         for i, color in enumerate(head_colors):
-            head = VGroup()
+            head = Group()
             rect = RoundedRectangle(
                 width=1.5, height=2,
                 corner_radius=0.1, stroke_color=color, stroke_width=3,
@@ -593,13 +568,10 @@ class Part9(Scene):
             label = Text(f"Head {i+1}", font_size=18, color=color)
             label.move_to(rect.get_top() + DOWN*0.3)
             
-            # Mini attention pattern
-            dots = VGroup(*[
-                Dot(radius=0.05, color=color).move_to(
-                    rect.get_center() + [0.3*(j-1), 0.3*(1-k), 0]
-                ) for j in range(3) for k in range(3)
-            ])
-            head.add(rect, label, dots)
+            # Full attention matrix of this head, one pixel per (query, key) pair
+            pattern = Heatmap(attention.weights[i], width=1.1, color=color, low_color=SUBTLE_NAVY)
+            pattern.move_to(rect.get_center() + DOWN*0.2)
+            head.add(rect, label, pattern)
             heads.add(head)
         
         heads.arrange(RIGHT, buff=0.5)
@@ -627,11 +599,11 @@ class Part9(Scene):
         
         self.wait(1)
         
-        # Animate patterns in each head
-        for head in heads:
+        # Animate patterns in each head: flash the key each query attends to most
+        for head, weights in zip(heads, attention.weights):
             self.play(
-                *[Flash(dot, color=head[0].get_stroke_color(), line_length=0.1) 
-                  for dot in head[2]],
+                *[Flash(head[2].cell_center(row, col), color=head[0].get_stroke_color(), line_length=0.1)
+                  for row, col in enumerate(weights.argmax(axis=1))],
                 run_time=0.5
             )
         
@@ -1,6 +1,10 @@
 import asyncio
-import edge_tts
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.narration import narrate
 
 # Narration Scripts for AI Programming Animation
 SCRIPTS = {
@@ -193,20 +197,7 @@ Thanks for watching! Subscribe for more deep dives into the technology shaping o
 VOICE = "en-US-GuyNeural"
 
 async def generate_voiceover():
-    if not os.path.exists("voiceovers"):
-        os.makedirs("voiceovers")
-
-    print(f"--- Seslendirme Başlıyor: {VOICE} ---")
-
-    for part, text in SCRIPTS.items():
-        filename = f"voiceovers/{part}.mp3"
-        print(f"İşleniyor: {part}...")
-        
-        communicate = edge_tts.Communicate(text, VOICE)
-        await communicate.save(filename)
-    
-    print("\n--- İŞLEM TAMAMLANDI! ---")
-    print("'voiceovers' klasörünü kontrol et.")
+    await narrate(SCRIPTS, VOICE)
 
 if __name__ == "__main__":
     asyncio.run(generate_voiceover())
@@ -1,5 +1,12 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.array_factor import BeamPattern, PlanarArray
+from shared.lod import AdaptiveSurface
 
 config.background_color = "#020B1F"
 
@@ -13,19 +20,19 @@ class Part1(ThreeDScene):
         title.set_stroke("#FF0055", width=3, background=True)
         
         # 3D radar dish silhouette
-        dish = Surface(
+        dish = AdaptiveSurface(
             lambda u, v: np.array([
                 2 * np.cos(u) * v,
                 2 * np.sin(u) * v,
                 -v**2
             ]),
             u_range=[0, TAU],
-            v_range=[0, 1],
-            resolution=(24, 12)
+            v_range=[0, 1]
         )
         dish.set_color("#00F0FF")
         dish.set_opacity(0.7)
         dish.scale(0.8).shift(OUT * 2)
+        dish.track_camera(self.camera)
         
         # Rotating signal waves
         waves = VGroup(*[
@@ -136,19 +143,20 @@ class Part4(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title)
         
         # 3D parabolic dish
-        dish = Surface(
+        self.set_camera_orientation(phi=70*DEGREES, theta=-45*DEGREES, distance=8)
+        dish = AdaptiveSurface(
             lambda u, v: np.array([
                 2.5 * np.cos(u) * v,
                 2.5 * np.sin(u) * v,
                 -1.2 * v**2
             ]),
             u_range=[0, TAU],
-            v_range=[0, 1.2],
-            resolution=(32, 16)
+            v_range=[0, 1.2]
         )
         dish.set_color("#00F0FF")
         dish.set_opacity(0.85)
         dish.rotate(PI/2, axis=RIGHT)
+        dish.track_camera(self.camera)
         
         # Feed point at focus
         feed = Sphere(radius=0.15, resolution=(12, 12))
@@ -167,7 +175,6 @@ class Part4(ThreeDScene):
             for y in np.linspace(-0.5, 0.5, 3)
         ])
         
-        self.set_camera_orientation(phi=70*DEGREES, theta=-45*DEGREES, distance=8)
         self.play(Write(title), run_time=2)
         self.wait(2)
         self.play(Create(dish), run_time=3.5)
@@ -478,13 +485,11 @@ class Part10(Scene):
 
         return img, frame, label
 
-    # ── yardımcı: beam-pattern çizgisi (küçük fan) ──────────────────────
-    def _make_beam(self, center_point, half_angle: float, length: float, color: str, n_rays: int = 11):
-        rays = VGroup()
-        for a in np.linspace(-half_angle, half_angle, n_rays):
-            end = center_point + length * np.array([np.sin(a), -np.cos(a), 0])   # aşağı yönlü fan
-            rays.add(Line(center_point, end, color=color, stroke_width=2.5))
-        return rays
+    # ── yardımcı: beam-pattern lobu (dizi faktöründen hesaplanır) ───────
+    def _make_beam(self, center_point, half_angle: float, length: float, color: str):
+        array = PlanarArray.for_beamwidth(2 * half_angle)             # yarı güç hüzme genişliği ≈ 2 * half_angle
+        return BeamPattern(array, radius=length, center=center_point, boresight=DOWN,   # aşağı yönlü lob
+                           color=color, stroke_width=2.5, fill_color=color, fill_opacity=0.2)
 
     # ── construct ────────────────────────────────────────────────────────
     def construct(self):
@@ -536,10 +541,10 @@ class Part10(Scene):
             # --- beam pattern (label'ın altında) ---
             half_ang, beam_color = beam_params[idx]
             beam_origin = label.get_bottom() + DOWN * 0.45
-            beam = self._make_beam(beam_origin, half_ang, length=0.85, color=beam_color, n_rays=13)
+            beam = self._make_beam(beam_origin, half_ang, length=0.85, color=beam_color)
 
             self.play(
-                LaggedStart(*[Create(ray) for ray in beam], lag_ratio=0.06),
+                Create(beam),
                 run_time=1.4
             )
             self.wait(0.8)
@@ -1012,11 +1017,11 @@ class Part20(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title)
         
         # 3D antenna models rotating
-        parabolic = Surface(
+        self.set_camera_orientation(phi=70*DEGREES, theta=-60*DEGREES, distance=10)
+        parabolic = AdaptiveSurface(
             lambda u, v: np.array([1.5*np.cos(u)*v, 1.5*np.sin(u)*v, -0.8*v**2]),
-            u_range=[0, TAU], v_range=[0, 1],
-            resolution=(20, 10)
-        ).set_color("#00F0FF").set_opacity(0.7).shift(LEFT*3)
+            u_range=[0, TAU], v_range=[0, 1]
+        ).set_color("#00F0FF").set_opacity(0.7).shift(LEFT*3).track_camera(self.camera)
         
         array = VGroup(*[
             Prism(dimensions=[0.2, 0.2, 0.5]).set_color("#FF0055").shift(RIGHT*3 + UP*y)
@@ -1027,8 +1032,6 @@ class Part20(ThreeDScene):
         subtitle.to_edge(DOWN, buff=1.5)
         self.add_fixed_in_frame_mobjects(subtitle)
         
-        self.set_camera_orientation(phi=70*DEGREES, theta=-60*DEGREES, distance=10)
-        
         self.play(FadeIn(title, scale=1.2), run_time=2.5)
         self.wait(2)
         self.play(Create(parabolic), run_time=3)
@@ -1,5 +1,11 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.array_factor import BeamPattern, PlanarArray
 
 # Configure for YouTube Shorts (Vertical 9:16)
 config.pixel_width = 1080
@@ -35,13 +41,11 @@ class Part10Short(Scene):
 
         return img, frame, label
 
-    # ── yardımcı: beam-pattern çizgisi (küçük fan) ──────────────────────
-    def _make_beam(self, center_point, half_angle: float, length: float, color: str, n_rays: int = 11):
-        rays = VGroup()
-        for a in np.linspace(-half_angle, half_angle, n_rays):
-            end = center_point + length * np.array([np.sin(a), -np.cos(a), 0])   # aşağı yönlü fan
-            rays.add(Line(center_point, end, color=color, stroke_width=3))
-        return rays
+    # ── yardımcı: beam-pattern lobu (dizi faktöründen hesaplanır) ───────
+    def _make_beam(self, center_point, half_angle: float, length: float, color: str):
+        array = PlanarArray.for_beamwidth(2 * half_angle)             # yarı güç hüzme genişliği ≈ 2 * half_angle
+        return BeamPattern(array, radius=length, center=center_point, boresight=DOWN,   # aşağı yönlü lob
+                           color=color, stroke_width=3, fill_color=color, fill_opacity=0.2)
 
     # ── construct ────────────────────────────────────────────────────────
     def construct(self):
@@ -97,10 +101,10 @@ class Part10Short(Scene):
             # Beam Pattern
             half_ang, beam_color = beam_params[idx]
             beam_origin = label.get_bottom() + DOWN * 0.2
-            beam = self._make_beam(beam_origin, half_ang, length=0.75, color=beam_color, n_rays=13)
+            beam = self._make_beam(beam_origin, half_ang, length=0.75, color=beam_color)
 
             self.play(
-                LaggedStart(*[Create(ray) for ray in beam], lag_ratio=0.08),
+                Create(beam),
                 run_time=1.2
             )
             self.wait(0.5)
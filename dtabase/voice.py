@@ -1,5 +1,10 @@
-import edge_tts
 import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.narration import narrate
 
 # Narration Script for Database YouTube Short
 SCRIPT = """
@@ -26,9 +31,7 @@ VOICE = "en-US-GuyNeural"
 OUTPUT_FILE = "database_narration.mp3"
 
 async def generate_audio():
-    communicate = edge_tts.Communicate(SCRIPT, VOICE)
-    await communicate.save(OUTPUT_FILE)
-    print(f"✅ Audio saved to: {OUTPUT_FILE}")
+    await narrate(SCRIPT, VOICE, output_file=OUTPUT_FILE)
 
 if __name__ == "__main__":
     asyncio.run(generate_audio())
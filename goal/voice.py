@@ -1,6 +1,10 @@
 import asyncio
-import edge_tts
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.narration import narrate
 
 SCRIPTS = {
     "Full": (
@@ -46,20 +50,7 @@ SCRIPTS = {
 VOICE = "en-US-GuyNeural"
 
 async def generate_voiceover():
-    if not os.path.exists("voiceovers"):
-        os.makedirs("voiceovers")
-
-    print(f"--- Generating Voiceover: {VOICE} ---")
-
-    for part, text in SCRIPTS.items():
-        filename = f"voiceovers/{part}.mp3"
-        print(f"Processing: {part}...")
-
-        communicate = edge_tts.Communicate(text, VOICE)
-        await communicate.save(filename)
-
-    print("\n--- DONE! ---")
-    print("Check the 'voiceovers' folder.")
+    await narrate(SCRIPTS, VOICE)
 
 if __name__ == "__main__":
     asyncio.run(generate_voiceover())
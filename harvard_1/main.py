@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from sequence import sequence, stirling_factor, table
+
 # ============================================================================
 # HARVARD ENTRANCE EXAM: lim(n→∞) (n!)^(1/n) / n = 1/e
 # 20-Part Educational Animation
@@ -931,14 +933,8 @@ class Part10(Scene):
         )
         axes.to_edge(DOWN, buff=0.8)
         
-        # Function
-        def func(n):
-            if n <= 0:
-                return 2
-            return (2 * np.pi * n) ** (1 / (2 * n))
-        
         graph = axes.plot(
-            func,
+            stirling_factor,
             x_range=[1, 50],
             color=ELECTRIC_CYAN,
             stroke_width=3
@@ -1304,20 +1300,11 @@ class Part14(Scene):
             run_time=2
         )
         
-        # Calculate sequence values
-        import math
-        def a_n(n):
-            if n <= 0:
-                return 1
-            factorial = math.factorial(int(n))
-            return (factorial ** (1/n)) / n
-        
         # Plot points
         points = VGroup()
-        x_values = list(range(1, 21))
+        x_values = np.arange(1, 21)
         
-        for n in x_values:
-            value = a_n(n)
+        for n, value in zip(x_values, sequence(x_values)):
             point = Dot(
                 axes.c2p(n, value),
                 radius=0.08,
@@ -1388,27 +1375,10 @@ class Part15(Scene):
         
         self.play(Write(target), run_time=1.5)
         
-        # Calculate actual values using log to avoid overflow
-        import math
-        def a_n(n):
-            # Use Stirling's approximation via log: log(n!) ≈ n*log(n) - n + 0.5*log(2*pi*n)
-            # Then: (n!)^(1/n) / n = exp(log(n!)/n) / n
-            if n <= 20:
-                # For small n, use direct calculation
-                factorial = math.factorial(n)
-                return (factorial ** (1/n)) / n
-            else:
-                # For large n, use log approach: log(n!) = sum(log(k) for k in 1..n)
-                log_factorial = sum(math.log(k) for k in range(1, n + 1))
-                return math.exp(log_factorial / n) / n
-        
-        # Create data rows
-        data = [
-            (10, a_n(10)),
-            (50, a_n(50)),
-            (100, a_n(100)),
-            (500, a_n(500)),
-        ]
+        # Create data rows (log n! based, so n = 10^6 costs the same as n = 10)
+        ns = np.array([10, 50, 100, 500, 10**6])
+        rows_data = table(ns)
+        data = list(zip(ns, rows_data.value))
         
         # Build table
         table_header = MathTex(
@@ -1425,7 +1395,8 @@ class Part15(Scene):
         start_y = -0.2
         
         for i, (n, val) in enumerate(data):
-            n_text = MathTex(str(n), font_size=36, color=TEXT_WHITE)
+            n_text = MathTex(str(n) if n < 10**4 else f"10^{{{len(str(n)) - 1}}}",
+                             font_size=36, color=TEXT_WHITE)
             n_text.move_to([-2, start_y - i * 0.7, 0])
             
             val_text = MathTex(f"{val:.10f}...", font_size=32, color=ELECTRIC_CYAN)
@@ -1448,7 +1419,7 @@ class Part15(Scene):
         # Highlight convergence
         arrow = Arrow(
             start=[4, 0.5, 0],
-            end=[4, -2.5, 0],
+            end=[4, -3.2, 0],
             color=NEON_PINK,
             stroke_width=3
         )
@@ -1460,11 +1431,21 @@ class Part15(Scene):
         )
         converge_text.next_to(arrow, RIGHT, buff=0.2)
         
+        # How close the last row already is
+        mantissa, exponent = f"{rows_data.error[-1]:.1e}".split("e")
+        gap_text = MathTex(
+            rf"a_{{10^6}} - \frac{{1}}{{e}} \approx {mantissa} \times 10^{{{int(exponent)}}}",
+            font_size=28,
+            color=NEON_PINK
+        )
+        gap_text.to_edge(DOWN, buff=0.3)
+        
         self.play(
             Create(arrow),
             Write(converge_text),
             run_time=1.5
         )
+        self.play(Write(gap_text), run_time=1)
         
         self.wait(3)
 
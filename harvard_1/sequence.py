@@ -0,0 +1,101 @@
+"""Vectorized evaluation of a_n = (n!)^(1/n) / n and Stirling's approximation.
+
+Everything goes through log n!, so nothing overflows and each n costs O(1):
+small integers read a cumulative table of log k, everything else uses the
+Stirling series with its first Bernoulli corrections (exact to double
+precision from n = 10 on). Any array of n, up to 10^6 and far beyond, is
+evaluated in one call.
+
+    from sequence import sequence, table
+    sequence(np.arange(1, 21))          # the plotted points
+    table([10, 100, 10**6]).error       # distance to 1/e
+"""
+
+from dataclasses import dataclass
+from math import lgamma
+
+import numpy as np
+
+TABLE_SIZE = 256
+# log(k!) for k = 0 .. TABLE_SIZE - 1, as a cumulative sum of log k
+_LOG_FACTORIALS = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, TABLE_SIZE)))])
+_HALF_LOG_2PI = 0.5 * np.log(2 * np.pi)
+
+
+def stirling_log_factorial(n) -> np.ndarray:
+    """Leading Stirling terms: n log n - n + 1/2 log(2 pi n)."""
+    n = np.asarray(n, dtype=float)
+    return n * np.log(n) - n + 0.5 * np.log(n) + _HALF_LOG_2PI
+
+
+def _stirling_series(n: np.ndarray) -> np.ndarray:
+    """Bernoulli corrections 1/(12n) - 1/(360n^3) + 1/(1260n^5) of Stirling's log n!."""
+    inv = 1.0 / n
+    inv2 = inv * inv
+    return inv * (1 / 12 - inv2 * (1 / 360 - inv2 / 1260))
+
+
+def _small_log_factorial(n: np.ndarray) -> np.ndarray:
+    """log(n!) for n < TABLE_SIZE, from the table for integers and lgamma otherwise."""
+    out = np.empty(n.shape)
+    exact = n == np.floor(n)
+    out[exact] = _LOG_FACTORIALS[n[exact].astype(np.int64)]
+    out[~exact] = [lgamma(x + 1) for x in n[~exact]]
+    return out
+
+
+def log_factorial(n) -> np.ndarray:
+    """log(n!) for any array of n >= 0 (integers or not)."""
+    n = np.asarray(n, dtype=float)
+    out = np.empty(n.shape)
+    small = n < TABLE_SIZE
+    out[small] = _small_log_factorial(n[small])
+    big = n[~small]
+    out[~small] = stirling_log_factorial(big) + _stirling_series(big)
+    return out if out.ndim else out[()]
+
+
+def stirling_correction(n) -> np.ndarray:
+    """log(n!) minus the leading Stirling terms, about 1/(12n).
+
+    Large n take the series directly: subtracting two nearly equal log-factorials (about 1.3e7
+    at n = 10^6) would cancel away almost every digit of a correction near 1e-7.
+    """
+    n = np.asarray(n, dtype=float)
+    out = np.empty(n.shape)
+    small = n < TABLE_SIZE
+    out[small] = _small_log_factorial(n[small]) - stirling_log_factorial(n[small])
+    out[~small] = _stirling_series(n[~small])
+    return out if out.ndim else out[()]
+
+
+def sequence(n) -> np.ndarray:
+    """a_n = (n!)^(1/n) / n."""
+    n = np.asarray(n, dtype=float)
+    return np.exp(log_factorial(n) / n - np.log(n))
+
+
+def stirling_factor(n) -> np.ndarray:
+    """(2 pi n)^(1/(2n)), the factor Stirling's formula leaves next to n/e; tends to 1."""
+    n = np.asarray(n, dtype=float)
+    return np.exp(np.log(2 * np.pi * n) / (2 * n))
+
+
+@dataclass(frozen=True)
+class SequenceTable:
+    n: np.ndarray
+    value: np.ndarray               # a_n
+    error: np.ndarray               # a_n - 1/e
+    stirling_error: np.ndarray      # relative error of Stirling's n!, ~ 1/(12n)
+
+
+def table(n) -> SequenceTable:
+    n = np.asarray(n, dtype=float)
+    log_fact = log_factorial(n)
+    value = np.exp(log_fact / n - np.log(n))
+    return SequenceTable(
+        n=n,
+        value=value,
+        error=value - 1 / np.e,
+        stirling_error=-np.expm1(-stirling_correction(n)),
+    )
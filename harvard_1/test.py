@@ -1,6 +1,10 @@
 import asyncio
-import edge_tts
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.narration import narrate
 
 # Seslendirilecek Metinler
 SCRIPTS = {
@@ -161,20 +165,7 @@ Thank you for watching. If you enjoyed this problem, like and subscribe for more
 VOICE = "en-US-GuyNeural"
 
 async def generate_voiceover():
-    if not os.path.exists("voiceovers"):
-        os.makedirs("voiceovers")
-
-    print(f"--- Seslendirme Başlıyor: {VOICE} ---")
-
-    for part, text in SCRIPTS.items():
-        filename = f"voiceovers/{part}.mp3"
-        print(f"İşleniyor: {part}...")
-        
-        communicate = edge_tts.Communicate(text, VOICE)
-        await communicate.save(filename)
-    
-    print("\n--- İŞLEM TAMAMLANDI! ---")
-    print("'voiceovers' klasörünü kontrol et.")
+    await narrate(SCRIPTS, VOICE)
 
 if __name__ == "__main__":
     asyncio.run(generate_voiceover())
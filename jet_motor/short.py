@@ -1,5 +1,11 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.point_cloud import PointCloud
 
 # ============================================================================
 # HOW A JET ENGINE WORKS — in 1 Minute
@@ -243,22 +249,14 @@ class JetEngineShort(Scene):
             stroke_color=SOFT_GREEN, stroke_width=3,
         ).move_to(DOWN * 0.8 + RIGHT * 1.5)
 
-        dots_big = VGroup(*[
-            Dot(radius=0.04, color=TEXT_WHITE).move_to(
-                box_big.get_center() + np.array([
-                    np.random.uniform(-1.2, 1.2),
-                    np.random.uniform(-0.7, 0.7), 0
-                ])
-            ) for _ in range(20)
-        ])
-        dots_small = VGroup(*[
-            Dot(radius=0.04, color=TEXT_WHITE).move_to(
-                box_small.get_center() + np.array([
-                    np.random.uniform(-0.5, 0.5),
-                    np.random.uniform(-0.3, 0.3), 0
-                ])
-            ) for _ in range(20)
-        ])
+        dots_big = PointCloud(
+            box_big.get_center()[:2] + np.random.uniform([-1.2, -0.7], [1.2, 0.7], (20, 2)),
+            radius=0.04, color=TEXT_WHITE,
+        )
+        dots_small = PointCloud(
+            box_small.get_center()[:2] + np.random.uniform([-0.5, -0.3], [0.5, 0.3], (20, 2)),
+            radius=0.04, color=TEXT_WHITE,
+        )
 
         arrow_comp = Arrow(
             box_big.get_right(), box_small.get_left(),
@@ -0,0 +1,186 @@
+"""Batched Kalman filters (KF, EKF, UKF) behind the kalman scenes.
+
+Every function works on many independent runs at once: states are ``(runs, n)``,
+covariances ``(runs, n, n)``, measurement sequences ``(runs, steps, m)``. One
+time step is a handful of batched matmuls / solves for all runs, so a scene can
+plot a real filter estimate -- or hundreds of Monte-Carlo runs -- for the price
+of a Python loop over time steps only.
+
+    model = constant_velocity(dt=0.25, q=0.3, r=0.7 ** 2)
+    truth, z = simulate(model, x0=[0, 1], steps=40, runs=200, seed=1)
+    est = kalman_filter(model, z, x0=[0, 0], P0=np.eye(2) * 4)
+    est.means[:, :, 0]        # (200, 40) position estimates
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class LinearModel:
+    F: np.ndarray     # state transition (n, n)
+    H: np.ndarray     # measurement matrix (m, n)
+    Q: np.ndarray     # process noise covariance (n, n)
+    R: np.ndarray     # measurement noise covariance (m, m)
+
+
+@dataclass(frozen=True)
+class FilterResult:
+    means: np.ndarray         # (runs, steps, n) posterior state estimates
+    covs: np.ndarray          # (runs, steps, n, n) posterior covariances
+    gains: np.ndarray         # (runs, steps, n, m) Kalman gains
+
+    @property
+    def stds(self) -> np.ndarray:
+        """Per-state standard deviations, ``(runs, steps, n)``."""
+        return np.sqrt(np.diagonal(self.covs, axis1=-2, axis2=-1))
+
+
+def constant_velocity(dt: float = 1.0, q: float = 0.1, r: float = 1.0) -> LinearModel:
+    """Position/velocity state, position measured; ``q`` is the white-acceleration intensity."""
+    F = np.array([[1.0, dt], [0.0, 1.0]])
+    Q = q * np.array([[dt ** 3 / 3, dt ** 2 / 2], [dt ** 2 / 2, dt]])
+    return LinearModel(F, np.array([[1.0, 0.0]]), Q, np.array([[r]]))
+
+
+# ========================== HELPERS ==========================
+def _batch(x0, P0, runs: int):
+    x = np.broadcast_to(np.asarray(x0, dtype=float), (runs, np.shape(x0)[-1])).copy()
+    P = np.broadcast_to(np.asarray(P0, dtype=float), (runs,) + np.shape(P0)[-2:]).copy()
+    return x, P
+
+
+def _measurements(z) -> np.ndarray:
+    """Accept ``(steps,)``, ``(runs, steps)`` or ``(runs, steps, m)``."""
+    z = np.asarray(z, dtype=float)
+    if z.ndim == 1:
+        z = z[None]
+    return z[..., None] if z.ndim == 2 else z
+
+
+def _update(x, P, y, S, PHt):
+    """Shared measurement update given the innovation ``y``, its covariance ``S`` and ``P H^T``."""
+    K = np.linalg.solve(S, PHt.transpose(0, 2, 1)).transpose(0, 2, 1)
+    x = x + np.einsum("rnm,rm->rn", K, y)
+    P = P - K @ S @ K.transpose(0, 2, 1)
+    P = 0.5 * (P + P.transpose(0, 2, 1))
+    return x, P, K
+
+
+def jacobian(func, x: np.ndarray, eps: float = 1e-6) -> np.ndarray:
+    """Central-difference Jacobian of a batched ``func: (runs, n) -> (runs, k)``, shape ``(runs, k, n)``."""
+    runs, n = x.shape
+    step = eps * np.eye(n)
+    probes = np.concatenate([x[:, None] + step, x[:, None] - step], axis=1).reshape(-1, n)
+    values = np.asarray(func(probes)).reshape(runs, 2, n, -1)
+    return ((values[:, 0] - values[:, 1]) / (2 * eps)).transpose(0, 2, 1)
+
+
+# ========================== SIMULATION ==========================
+def simulate(model: LinearModel, x0, steps: int, runs: int = 1, seed=None):
+    """Monte-Carlo truth and measurements: ``(runs, steps, n)`` and ``(runs, steps, m)``."""
+    rng = np.random.default_rng(seed)
+    n, m = model.F.shape[0], model.H.shape[0]
+    w = rng.standard_normal((runs, steps, n)) @ np.linalg.cholesky(model.Q + 1e-12 * np.eye(n)).T
+    v = rng.standard_normal((runs, steps, m)) @ np.linalg.cholesky(model.R).T
+    states = np.empty((runs, steps, n))
+    x = np.broadcast_to(np.asarray(x0, dtype=float), (runs, n))
+    for t in range(steps):
+        x = x @ model.F.T + w[:, t] if t else x
+        states[:, t] = x
+    return states, states @ model.H.T + v
+
+
+# ========================== FILTERS ==========================
+def kalman_filter(model: LinearModel, z, x0, P0) -> FilterResult:
+    """Linear KF. ``x0`` / ``P0`` are the prior at the first measurement."""
+    z = _measurements(z)
+    runs, steps, m = z.shape
+    x, P = _batch(x0, P0, runs)
+    n = x.shape[1]
+    F, H, Q, R = model.F, model.H, model.Q, model.R
+    means, covs, gains = np.empty((runs, steps, n)), np.empty((runs, steps, n, n)), np.empty((runs, steps, n, m))
+    for t in range(steps):
+        if t:
+            x = x @ F.T
+            P = F @ P @ F.T + Q
+        PHt = P @ H.T
+        x, P, K = _update(x, P, z[:, t] - x @ H.T, H @ PHt + R, PHt)
+        means[:, t], covs[:, t], gains[:, t] = x, P, K
+    return FilterResult(means, covs, gains)
+
+
+def extended_kalman_filter(f, h, Q, R, z, x0, P0, F_jac=None, H_jac=None) -> FilterResult:
+    """EKF for batched ``f: (runs, n) -> (runs, n)`` and ``h: (runs, n) -> (runs, m)``.
+
+    The Jacobians default to central differences of ``f`` and ``h`` at the current estimate.
+    """
+    z = _measurements(z)
+    runs, steps, m = z.shape
+    x, P = _batch(x0, P0, runs)
+    n = x.shape[1]
+    F_jac = F_jac or (lambda s: jacobian(f, s))
+    H_jac = H_jac or (lambda s: jacobian(h, s))
+    means, covs, gains = np.empty((runs, steps, n)), np.empty((runs, steps, n, n)), np.empty((runs, steps, n, m))
+    for t in range(steps):
+        if t:
+            F = F_jac(x)
+            x = f(x)
+            P = F @ P @ F.transpose(0, 2, 1) + Q
+        H = H_jac(x)
+        PHt = P @ H.transpose(0, 2, 1)
+        x, P, K = _update(x, P, z[:, t] - h(x), H @ PHt + R, PHt)
+        means[:, t], covs[:, t], gains[:, t] = x, P, K
+    return FilterResult(means, covs, gains)
+
+
+def sigma_points(mean, cov, alpha: float = 1.0, beta: float = 2.0, kappa: float = None):
+    """Merwe scaled sigma points ``(runs, 2n+1, n)`` and their mean / covariance weights.
+
+    ``kappa`` defaults to ``3 - n``, the classic choice for Gaussian priors.
+    """
+    mean = np.atleast_2d(np.asarray(mean, dtype=float))
+    cov = np.asarray(cov, dtype=float).reshape(-1, mean.shape[1], mean.shape[1])
+    n = mean.shape[1]
+    kappa = 3 - n if kappa is None else kappa
+    lam = alpha ** 2 * (n + kappa) - n
+    L = np.linalg.cholesky((n + lam) * cov).transpose(0, 2, 1)   # rows are the spread directions
+    points = np.concatenate([mean[:, None], mean[:, None] + L, mean[:, None] - L], axis=1)
+    Wm = np.full(2 * n + 1, 0.5 / (n + lam))
+    Wc = Wm.copy()
+    Wm[0] = lam / (n + lam)
+    Wc[0] = Wm[0] + 1 - alpha ** 2 + beta
+    return points, Wm, Wc
+
+
+def unscented_transform(points, Wm, Wc, noise=None):
+    """Weighted mean ``(runs, k)``, covariance ``(runs, k, k)`` and deviations of transformed sigma points."""
+    mean = np.einsum("s,rsk->rk", Wm, points)
+    dev = points - mean[:, None]
+    cov = np.einsum("s,rsi,rsj->rij", Wc, dev, dev)
+    return mean, cov + (0 if noise is None else noise), dev
+
+
+def unscented_kalman_filter(f, h, Q, R, z, x0, P0, alpha: float = 1.0, beta: float = 2.0,
+                            kappa: float = None) -> FilterResult:
+    """UKF for batched ``f`` / ``h`` (as in ``extended_kalman_filter``); no Jacobians needed."""
+    z = _measurements(z)
+    runs, steps, m = z.shape
+    x, P = _batch(x0, P0, runs)
+    n = x.shape[1]
+
+    def propagate(func, X):
+        return np.asarray(func(X.reshape(-1, n))).reshape(runs, X.shape[1], -1)
+
+    means, covs, gains = np.empty((runs, steps, n)), np.empty((runs, steps, n, n)), np.empty((runs, steps, n, m))
+    for t in range(steps):
+        if t:
+            X, Wm, Wc = sigma_points(x, P, alpha, beta, kappa)
+            x, P, _ = unscented_transform(propagate(f, X), Wm, Wc, Q)
+        X, Wm, Wc = sigma_points(x, P, alpha, beta, kappa)
+        z_pred, S, z_dev = unscented_transform(propagate(h, X), Wm, Wc, R)
+        Pxz = np.einsum("s,rsi,rsj->rij", Wc, X - x[:, None], z_dev)
+        x, P, K = _update(x, P, z[:, t] - z_pred, S, Pxz)
+        means[:, t], covs[:, t], gains[:, t] = x, P, K
+    return FilterResult(means, covs, gains)
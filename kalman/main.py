@@ -1,5 +1,14 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.point_cloud import PointCloud, RevealPoints
+from shared.timing import NarrationTiming
+
+from filters import constant_velocity, jacobian, kalman_filter, sigma_points, unscented_transform
 
 # ========================== COLOR PALETTE ==========================
 DEEP_NAVY = "#020B1F"
@@ -13,7 +22,7 @@ config.background_color = DEEP_NAVY
 
 
 # ========================== PART 1: THE HOOK (3-6s) ==========================
-class Part1(Scene):
+class Part1(NarrationTiming, Scene):
     """Instant Hook - KALMAN FILTER title splash"""
     def construct(self):
         # Glitch-style title
@@ -30,17 +39,14 @@ class Part1(Scene):
 
         # Noisy dots scatter (representing noisy measurements)
         np.random.seed(42)
-        dots = VGroup(*[
-            Dot(point=[np.random.normal(0, 1.5), np.random.normal(0, 1), 0],
-                radius=0.04, color=NEON_PINK, fill_opacity=0.7)
-            for _ in range(60)
-        ])
+        dots = PointCloud(np.random.normal(0, [1.5, 1], (60, 2)),
+                          radius=0.04, color=NEON_PINK, opacity=0.7)
 
         # Flash in title
         self.play(FadeIn(title, scale=1.5), run_time=0.5)
         self.play(
             FadeIn(subtitle, shift=UP * 0.3),
-            LaggedStart(*[FadeIn(d, scale=0.3) for d in dots], lag_ratio=0.02),
+            RevealPoints(dots, lag_ratio=0.02, scale=0.3),
             run_time=0.8
         )
 
@@ -59,7 +65,7 @@ class Part1(Scene):
 
 
 # ========================== PART 2: THE NOISY WORLD (15-20s) ==========================
-class Part2(Scene):
+class Part2(NarrationTiming, Scene):
     """The Problem: Noisy Measurements"""
     def construct(self):
         title = Text("THE PROBLEM: A NOISY WORLD", font_size=48, color=TECH_CYAN)
@@ -84,10 +90,8 @@ class Part2(Scene):
         np.random.seed(7)
         noisy_x = np.linspace(0.5, 9.5, 30)
         noisy_y = [2 * np.sin(0.8 * x) + np.random.normal(0, 0.6) for x in noisy_x]
-        noisy_dots = VGroup(*[
-            Dot(axes.c2p(x, y), radius=0.06, color=NEON_PINK, fill_opacity=0.8)
-            for x, y in zip(noisy_x, noisy_y)
-        ])
+        noisy_dots = PointCloud([axes.c2p(x, y) for x, y in zip(noisy_x, noisy_y)],
+                                radius=0.06, color=NEON_PINK, opacity=0.8)
         noisy_label = Text("Noisy Measurements", font_size=22, color=NEON_PINK)
         noisy_label.next_to(true_label, DOWN, buff=0.15).shift(LEFT * 0.5)
 
@@ -104,7 +108,7 @@ class Part2(Scene):
         self.wait(1)
 
         self.play(
-            LaggedStart(*[FadeIn(d, scale=0.5) for d in noisy_dots], lag_ratio=0.06),
+            RevealPoints(noisy_dots, lag_ratio=0.06, scale=0.5),
             run_time=3
         )
         self.play(Write(noisy_label), run_time=1)
@@ -115,7 +119,7 @@ class Part2(Scene):
 
 
 # ========================== PART 3: WHY SENSORS LIE (15-20s) ==========================
-class Part3(Scene):
+class Part3(NarrationTiming, Scene):
     """Visualize different sensors and their noise profiles"""
     def construct(self):
         title = Text("WHY SENSORS LIE", font_size=48, color=TECH_CYAN)
@@ -174,7 +178,7 @@ class Part3(Scene):
 
 
 # ========================== PART 4: THE CHALLENGE (15-20s) ==========================
-class Part4(Scene):
+class Part4(NarrationTiming, Scene):
     """A drone navigating with noisy data — wobbly path"""
     def construct(self):
         title = Text("THE NAVIGATION CHALLENGE", font_size=48, color=TECH_CYAN)
@@ -240,7 +244,7 @@ class Part4(Scene):
 
 
 # ========================== PART 5: WHAT IF WE COULD PREDICT? (15-20s) ==========================
-class Part5(Scene):
+class Part5(NarrationTiming, Scene):
     """Introduce the core idea: Model + Measurements"""
     def construct(self):
         title = Text("WHAT IF WE COULD PREDICT?", font_size=48, color=TECH_CYAN)
@@ -308,7 +312,7 @@ class Part5(Scene):
 
 
 # ========================== PART 6: STATE VECTOR (15-20s) ==========================
-class Part6(Scene):
+class Part6(NarrationTiming, Scene):
     """Define the state vector x = [position, velocity]"""
     def construct(self):
         title = Text("THE STATE VECTOR", font_size=48, color=TECH_CYAN)
@@ -387,7 +391,7 @@ class Part6(Scene):
 
 
 # ========================== PART 7: THE PREDICTION STEP (15-20s) ==========================
-class Part7(Scene):
+class Part7(NarrationTiming, Scene):
     """Predict equation: x_hat = F*x + B*u"""
     def construct(self):
         title = Text("THE PREDICTION STEP", font_size=48, color=TECH_CYAN)
@@ -460,7 +464,7 @@ class Part7(Scene):
 
 
 # ========================== PART 8: PREDICTION UNCERTAINTY (15-20s) ==========================
-class Part8(Scene):
+class Part8(NarrationTiming, Scene):
     """Covariance P grows with each prediction — expanding ellipse"""
     def construct(self):
         title = Text("PREDICTION UNCERTAINTY", font_size=48, color=TECH_CYAN)
@@ -526,7 +530,7 @@ class Part8(Scene):
 
 
 # ========================== PART 9: THE MEASUREMENT STEP (15-20s) ==========================
-class Part9(Scene):
+class Part9(NarrationTiming, Scene):
     """A new sensor reading arrives with its own uncertainty"""
     def construct(self):
         title = Text("THE MEASUREMENT STEP", font_size=48, color=NEON_PINK)
@@ -601,7 +605,7 @@ class Part9(Scene):
 
 
 # ========================== PART 10: THE KALMAN GAIN (15-20s) ==========================
-class Part10(Scene):
+class Part10(NarrationTiming, Scene):
     """Kalman Gain K — balance between prediction trust and measurement trust"""
     def construct(self):
         title = Text("THE KALMAN GAIN", font_size=48, color=VIBRANT_ORANGE)
@@ -702,7 +706,7 @@ class Part10(Scene):
 
 
 # ========================== PART 11: THE UPDATE STEP (15-20s) ==========================
-class Part11(Scene):
+class Part11(NarrationTiming, Scene):
     """Combine prediction + measurement using K — ellipse shrinks"""
     def construct(self):
         title = Text("THE UPDATE STEP", font_size=48, color=VIBRANT_ORANGE)
@@ -760,13 +764,19 @@ class Part11(Scene):
         result_label.next_to(result_ellipse, DOWN, buff=0.2)
 
         # Animations
+        # Cue points land each reveal on the narrator's words (see voice.py Part11)
         self.play(Write(title), FadeIn(subtitle), run_time=1.2)
         self.wait(0.5)
         self.play(Write(eq1), run_time=3)
+        self.wait_until_cue("Kalman Gain")
+        self.play(Indicate(eq1[4], color=VIBRANT_ORANGE, scale_factor=1.4), run_time=1)
+        self.wait_until_cue("The innovation is")
         self.play(Create(innov_brace), Write(innov_label), run_time=1)
         self.wait(1)
+        self.wait_until_cue("The covariance also")
         self.play(Write(eq2), run_time=2)
         self.wait(1)
+        self.wait_until_cue("Watch the visual below")
         self.play(FadeIn(pred_ellipse), Write(pred_label), run_time=1)
         self.play(FadeIn(meas_circle), Write(meas_label), run_time=1)
         self.wait(0.5)
@@ -781,7 +791,7 @@ class Part11(Scene):
 
 
 # ========================== PART 12: ONE FULL CYCLE (15-20s) ==========================
-class Part12(Scene):
+class Part12(NarrationTiming, Scene):
     """Animate Predict → Measure → Update loop"""
     def construct(self):
         title = Text("THE KALMAN FILTER CYCLE", font_size=48, color=TECH_CYAN)
@@ -852,7 +862,7 @@ class Part12(Scene):
 
 
 # ========================== PART 13: CONVERGENCE GRAPH (15-20s) ==========================
-class Part13(Scene):
+class Part13(NarrationTiming, Scene):
     """Plot estimated vs true position — filter converges"""
     def construct(self):
         title = Text("FILTER CONVERGENCE", font_size=48, color=TECH_CYAN)
@@ -874,22 +884,14 @@ class Part13(Scene):
         np.random.seed(42)
         m_x = np.linspace(0.3, 9.7, 35)
         m_y = [2 * np.sin(0.6 * x) + np.random.normal(0, 0.7) for x in m_x]
-        meas_dots = VGroup(*[
-            Dot(axes.c2p(x, y), radius=0.05, color=NEON_PINK, fill_opacity=0.6)
-            for x, y in zip(m_x, m_y)
-        ])
+        meas_dots = PointCloud([axes.c2p(x, y) for x, y in zip(m_x, m_y)],
+                               radius=0.05, color=NEON_PINK, opacity=0.6)
         meas_label = Text("Measurements", font_size=20, color=NEON_PINK)
 
-        est_x = np.linspace(0.3, 9.7, 35)
-        est_y = []
-        kf_est = 0
-        for i, x in enumerate(est_x):
-            true_val = 2 * np.sin(0.6 * x)
-            meas_val = m_y[i]
-            k = 0.7 / (1 + i * 0.15)
-            kf_est = kf_est + k * (meas_val - kf_est)
-            kf_est = kf_est * 0.7 + true_val * 0.3
-            est_y.append(kf_est)
+        # Constant-velocity Kalman filter run over the same measurements
+        est_x = m_x
+        model = constant_velocity(dt=m_x[1] - m_x[0], q=0.5, r=0.7 ** 2)
+        est_y = kalman_filter(model, m_y, x0=[0, 0], P0=np.diag([4.0, 4.0])).means[0, :, 0]
 
         est_path = VMobject(color=VIBRANT_ORANGE, stroke_width=4)
         est_pts = [axes.c2p(x, y) for x, y in zip(est_x, est_y)]
@@ -909,7 +911,7 @@ class Part13(Scene):
         self.play(Create(true_line), Write(true_label), run_time=2)
         self.wait(0.5)
         self.play(
-            LaggedStart(*[FadeIn(d, scale=0.5) for d in meas_dots], lag_ratio=0.04),
+            RevealPoints(meas_dots, lag_ratio=0.04, scale=0.5),
             Write(meas_label), run_time=2
         )
         self.wait(0.5)
@@ -920,7 +922,7 @@ class Part13(Scene):
 
 
 # ========================== PART 14: FULL EQUATIONS (15-20s) ==========================
-class Part14(Scene):
+class Part14(NarrationTiming, Scene):
     """Full Kalman Filter equation set"""
     def construct(self):
         title = Text("THE KALMAN FILTER EQUATIONS", font_size=44, color=TECH_CYAN)
@@ -966,7 +968,7 @@ class Part14(Scene):
 
 
 # ========================== PART 15: LINEAR KF (15-20s) ==========================
-class Part15(Scene):
+class Part15(NarrationTiming, Scene):
     """Types: Linear Kalman Filter"""
     def construct(self):
         title = Text("TYPE 1: LINEAR KALMAN FILTER", font_size=44, color=TECH_CYAN)
@@ -1020,7 +1022,7 @@ class Part15(Scene):
 
 
 # ========================== PART 16: EXTENDED KF (15-20s) ==========================
-class Part16(Scene):
+class Part16(NarrationTiming, Scene):
     """Types: Extended Kalman Filter (EKF) for nonlinear systems"""
     def construct(self):
         title = Text("TYPE 2: EXTENDED KALMAN FILTER", font_size=44, color=NEON_PINK)
@@ -1036,15 +1038,17 @@ class Part16(Scene):
             axis_config={"color": SUBTLE_NAVY, "stroke_width": 2}
         ).move_to(LEFT * 3 + DOWN * 0.5)
 
-        nonlinear = axes.plot(lambda x: np.sin(x) * 1.5 + 0.3 * x, x_range=[-3, 3],
-                               color=NEON_PINK, stroke_width=4)
+        def f(x):
+            return np.sin(x) * 1.5 + 0.3 * x
+
+        nonlinear = axes.plot(f, x_range=[-3, 3], color=NEON_PINK, stroke_width=4)
         nl_label = Text("Nonlinear f(x)", font_size=20, color=NEON_PINK)
         nl_label.next_to(nonlinear, UP, buff=0.1).shift(RIGHT)
 
         # Tangent line at operating point
         op_x = 1.0
-        op_y = np.sin(op_x) * 1.5 + 0.3 * op_x
-        slope = np.cos(op_x) * 1.5 + 0.3
+        op_y = f(op_x)
+        slope = jacobian(f, np.array([[op_x]]))[0, 0, 0]  # the EKF's F_k at this estimate
         tangent = axes.plot(lambda x: slope * (x - op_x) + op_y, x_range=[-1, 3],
                              color=TECH_CYAN, stroke_width=3, stroke_opacity=0.8)
         tangent_label = Text("Linearized (Jacobian)", font_size=18, color=TECH_CYAN)
@@ -1088,7 +1092,7 @@ class Part16(Scene):
 
 
 # ========================== PART 17: UNSCENTED KF (15-20s) ==========================
-class Part17(Scene):
+class Part17(NarrationTiming, Scene):
     """Types: Unscented Kalman Filter (UKF) — sigma points"""
     def construct(self):
         title = Text("TYPE 3: UNSCENTED KALMAN FILTER", font_size=44, color=VIBRANT_ORANGE)
@@ -1106,19 +1110,31 @@ class Part17(Scene):
             axis_config={"color": SUBTLE_NAVY, "stroke_width": 1}
         ).move_to(LEFT * 3.5 + DOWN * 0.8)
 
-        # Sigma points (2n+1 points for n-dimensional state)
-        center = before_axes.c2p(0, 0)
-        sigma_pts_before = VGroup(
-            Dot(before_axes.c2p(0, 0), radius=0.12, color=VIBRANT_ORANGE),  # Center
-            Dot(before_axes.c2p(1.5, 0), radius=0.08, color=TECH_CYAN),
-            Dot(before_axes.c2p(-1.5, 0), radius=0.08, color=TECH_CYAN),
-            Dot(before_axes.c2p(0, 1.5), radius=0.08, color=TECH_CYAN),
-            Dot(before_axes.c2p(0, -1.5), radius=0.08, color=TECH_CYAN),
-        )
+        # Sigma points (2n+1 points for n-dimensional state), spread 1.5 around the mean
+        def f(p):
+            x, y = p[..., 0], p[..., 1]
+            return np.stack([x + 0.3 * y + 0.15 * y ** 2, y + 0.6 * np.sin(x)], axis=-1)
+
+        points, Wm, Wc = sigma_points(np.zeros(2), np.eye(2) * 0.75)
+        moved = f(points)
+        mean, cov, _ = unscented_transform(moved, Wm, Wc)
+
+        def covariance_ellipse(axes, mean, cov, color):
+            # 1.5x the sigma-point spread, like the original hand-drawn ellipses
+            eigvals, eigvecs = np.linalg.eigh(cov * 3)
+            unit = np.linalg.norm(axes.c2p(1, 0) - axes.c2p(0, 0))
+            ellipse = Ellipse(width=3 * np.sqrt(eigvals[1]) * unit, height=3 * np.sqrt(eigvals[0]) * unit,
+                              color=color, stroke_width=2, fill_color=color, fill_opacity=0.08)
+            ellipse.rotate(np.arctan2(eigvecs[1, 1], eigvecs[0, 1]))
+            return ellipse.move_to(axes.c2p(*mean))
+
+        sigma_pts_before = VGroup(*[
+            Dot(before_axes.c2p(*p), radius=0.12 if i == 0 else 0.08,
+                color=VIBRANT_ORANGE if i == 0 else TECH_CYAN)
+            for i, p in enumerate(points[0])
+        ])
 
-        before_ellipse = Ellipse(width=3, height=3, color=TECH_CYAN, stroke_width=2,
-                                  fill_color=TECH_CYAN, fill_opacity=0.08)
-        before_ellipse.move_to(center)
+        before_ellipse = covariance_ellipse(before_axes, np.zeros(2), np.eye(2) * 0.75, TECH_CYAN)
 
         before_group_label = Text("Sigma Points\ncapture distribution", font_size=16, color=TECH_CYAN)
         before_group_label.next_to(before_axes, DOWN, buff=0.3)
@@ -1138,19 +1154,14 @@ class Part17(Scene):
             axis_config={"color": SUBTLE_NAVY, "stroke_width": 1}
         ).move_to(RIGHT * 3.5 + DOWN * 0.8)
 
-        # Transformed sigma points (distorted by nonlinearity)
-        sigma_pts_after = VGroup(
-            Dot(after_axes.c2p(0.2, 0.3), radius=0.12, color=VIBRANT_ORANGE),
-            Dot(after_axes.c2p(1.8, 0.8), radius=0.08, color=NEON_PINK),
-            Dot(after_axes.c2p(-1.2, -0.5), radius=0.08, color=NEON_PINK),
-            Dot(after_axes.c2p(0.5, 1.8), radius=0.08, color=NEON_PINK),
-            Dot(after_axes.c2p(-0.3, -1.3), radius=0.08, color=NEON_PINK),
-        )
+        # Transformed sigma points (distorted by nonlinearity) and their recomputed Gaussian
+        sigma_pts_after = VGroup(*[
+            Dot(after_axes.c2p(*p), radius=0.12 if i == 0 else 0.08,
+                color=VIBRANT_ORANGE if i == 0 else NEON_PINK)
+            for i, p in enumerate(moved[0])
+        ])
 
-        after_ellipse = Ellipse(width=3.5, height=2.8, color=NEON_PINK, stroke_width=2,
-                                 fill_color=NEON_PINK, fill_opacity=0.08)
-        after_ellipse.move_to(after_axes.c2p(0.2, 0.3))
-        after_ellipse.rotate(0.3)
+        after_ellipse = covariance_ellipse(after_axes, mean[0], cov[0], NEON_PINK)
 
         after_group_label = Text("Recompute mean\n& covariance", font_size=16, color=NEON_PINK)
         after_group_label.next_to(after_axes, DOWN, buff=0.3)
@@ -1190,7 +1201,7 @@ class Part17(Scene):
 
 
 # ========================== PART 18: REAL-WORLD APPLICATIONS (15-20s) ==========================
-class Part18(Scene):
+class Part18(NarrationTiming, Scene):
     """Grid of application cards"""
     def construct(self):
         title = Text("REAL-WORLD APPLICATIONS", font_size=48, color=TECH_CYAN)
@@ -1245,7 +1256,7 @@ class Part18(Scene):
 
 
 # ========================== PART 19: SUMMARY (15-20s) ==========================
-class Part19(Scene):
+class Part19(NarrationTiming, Scene):
     """Recap the core loop with a clean flowchart"""
     def construct(self):
         title = Text("SUMMARY", font_size=56, color=TECH_CYAN, weight=BOLD)
@@ -1299,7 +1310,7 @@ class Part19(Scene):
 
 
 # ========================== PART 20: OUTRO (13-18s) ==========================
-class Part20(Scene):
+class Part20(NarrationTiming, Scene):
     """Thank-you screen, subscribe CTA, key takeaways"""
     def construct(self):
         # Big thank you
@@ -1,5 +1,13 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.point_cloud import PointCloud, RevealPoints
+
+from filters import constant_velocity, kalman_filter
 
 # ========================== COLOR PALETTE ==========================
 DEEP_NAVY = "#020B1F"
@@ -28,15 +36,12 @@ class KalmanShort(Scene):
 
         # Scatter noisy dots for visual
         np.random.seed(42)
-        dots = VGroup(*[
-            Dot(point=[np.random.normal(0, 1.8), np.random.normal(-3, 1.5), 0],
-                radius=0.04, color=NEON_PINK, fill_opacity=0.6)
-            for _ in range(40)
-        ])
+        dots = PointCloud(np.random.normal([0, -3], [1.8, 1.5], (40, 2)),
+                          radius=0.04, color=NEON_PINK, opacity=0.6)
 
         self.play(FadeIn(hook_title, scale=1.3), run_time=0.6)
         self.play(FadeIn(hook_sub, shift=UP * 0.2),
-                  LaggedStart(*[FadeIn(d, scale=0.3) for d in dots], lag_ratio=0.02),
+                  RevealPoints(dots, lag_ratio=0.02, scale=0.3),
                   run_time=0.8)
         self.wait(0.6)
         self.play(FadeOut(hook), FadeOut(dots), run_time=0.5)
@@ -63,10 +68,8 @@ class KalmanShort(Scene):
         np.random.seed(7)
         noisy_x = np.linspace(0.3, 7.7, 25)
         noisy_y = [1.5 * np.sin(x) + np.random.normal(0, 0.5) for x in noisy_x]
-        noisy_dots = VGroup(*[
-            Dot(axes.c2p(x, y), radius=0.06, color=NEON_PINK, fill_opacity=0.8)
-            for x, y in zip(noisy_x, noisy_y)
-        ])
+        noisy_dots = PointCloud([axes.c2p(x, y) for x, y in zip(noisy_x, noisy_y)],
+                                radius=0.06, color=NEON_PINK, opacity=0.8)
         noisy_label = Text("Noisy Data", font_size=22, color=NEON_PINK)
         noisy_label.next_to(true_label, RIGHT, buff=1.0)
 
@@ -75,7 +78,7 @@ class KalmanShort(Scene):
         self.play(Create(axes), run_time=0.8)
         self.play(Create(true_curve), Write(true_label), run_time=1.2)
         self.play(
-            LaggedStart(*[FadeIn(d, scale=0.5) for d in noisy_dots], lag_ratio=0.03),
+            RevealPoints(noisy_dots, lag_ratio=0.03, scale=0.5),
             Write(noisy_label), run_time=1.2
         )
         self.wait(1.0)
@@ -244,20 +247,12 @@ class KalmanShort(Scene):
         np.random.seed(42)
         m_x = np.linspace(0.3, 7.7, 25)
         m_y = [1.5 * np.sin(0.8 * x) + np.random.normal(0, 0.5) for x in m_x]
-        conv_dots = VGroup(*[
-            Dot(conv_axes.c2p(x, y), radius=0.05, color=NEON_PINK, fill_opacity=0.6)
-            for x, y in zip(m_x, m_y)
-        ])
-
-        # Kalman estimate
-        est_y = []
-        kf_est = 0
-        for i, x in enumerate(m_x):
-            true_val = 1.5 * np.sin(0.8 * x)
-            k = 0.7 / (1 + i * 0.15)
-            kf_est = kf_est + k * (m_y[i] - kf_est)
-            kf_est = kf_est * 0.7 + true_val * 0.3
-            est_y.append(kf_est)
+        conv_dots = PointCloud([conv_axes.c2p(x, y) for x, y in zip(m_x, m_y)],
+                               radius=0.05, color=NEON_PINK, opacity=0.6)
+
+        # Kalman estimate (constant-velocity model over the measurements)
+        model = constant_velocity(dt=m_x[1] - m_x[0], q=0.8, r=0.5 ** 2)
+        est_y = kalman_filter(model, m_y, x0=[0, 0], P0=np.diag([4.0, 4.0])).means[0, :, 0]
 
         est_path = VMobject(color=VIBRANT_ORANGE, stroke_width=4)
         est_pts = [conv_axes.c2p(x, y) for x, y in zip(m_x, est_y)]
@@ -281,7 +276,7 @@ class KalmanShort(Scene):
         self.play(Create(conv_axes), run_time=0.6)
         self.play(Create(true_line), run_time=0.8)
         self.play(
-            LaggedStart(*[FadeIn(d, scale=0.5) for d in conv_dots], lag_ratio=0.03),
+            RevealPoints(conv_dots, lag_ratio=0.03, scale=0.5),
             run_time=0.8
         )
         self.play(Create(est_path), run_time=2.0)
@@ -1,5 +1,13 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.instancing import sphere_template
+from shared.network import EdgeBundle
+from shared.ppi import PPIDisplay
 
 # Monkeypatch for Manim compatibility
 # Fixes TypeError: VMobject.scale() got an unexpected keyword argument 'scale_tips'
@@ -25,6 +33,11 @@ TEXT_WHITE = "#FFFFFF"
 SUBTLE_NAVY = "#1E2A45"
 
 config.background_color = DEEP_NAVY
+
+# Network nodes: the unit sphere is tessellated once per resolution and stamped out per node
+NODE_SPHERE = sphere_template((8, 8))
+NODE_SPHERE_FINE = sphere_template((10, 10))
+
 # ============================================================================
 # PART 1: THE HOOK (3-6 seconds) - EXPLOSIVE OPENING
 # ============================================================================
@@ -167,27 +180,27 @@ class Part3(ThreeDScene):
         # 3D Neural Network for signal processing
         # Input layer (raw signal)
         input_layer = VGroup(*[
-            Sphere(radius=0.12, color=TECH_CYAN, fill_opacity=0.8, resolution=(8, 8))
+            NODE_SPHERE(radius=0.12, color=TECH_CYAN, fill_opacity=0.8)
             .shift(LEFT*3 + UP*(1-i*0.5) + OUT*j*0.3)
             for i in range(5) for j in range(-1, 2)
         ])
         
         # Hidden layers
         hidden1 = VGroup(*[
-            Sphere(radius=0.12, color=NEON_PINK, fill_opacity=0.8, resolution=(8, 8))
+            NODE_SPHERE(radius=0.12, color=NEON_PINK, fill_opacity=0.8)
             .shift(LEFT*1 + UP*(1.5-i*0.4) + OUT*j*0.3)
             for i in range(7) for j in range(-1, 2)
         ])
         
         hidden2 = VGroup(*[
-            Sphere(radius=0.12, color=VIBRANT_ORANGE, fill_opacity=0.8, resolution=(8, 8))
+            NODE_SPHERE(radius=0.12, color=VIBRANT_ORANGE, fill_opacity=0.8)
             .shift(RIGHT*1 + UP*(1.5-i*0.4) + OUT*j*0.3)
             for i in range(7) for j in range(-1, 2)
         ])
         
         # Output layer (clean signal)
         output_layer = VGroup(*[
-            Sphere(radius=0.12, color=TECH_CYAN, fill_opacity=0.8, resolution=(8, 8))
+            NODE_SPHERE(radius=0.12, color=TECH_CYAN, fill_opacity=0.8)
             .shift(RIGHT*3 + UP*(1-i*0.5) + OUT*j*0.3)
             for i in range(5) for j in range(-1, 2)
         ])
@@ -361,7 +374,7 @@ class Part5(ThreeDScene):
         
         # Output - Detection decision
         output = VGroup(*[
-            Sphere(radius=0.2, color=TECH_CYAN, fill_opacity=0.9, resolution=(10, 10))
+            NODE_SPHERE_FINE(radius=0.2, color=TECH_CYAN, fill_opacity=0.9)
             .shift(RIGHT*3.5 + UP*(0.5-i*0.5))
             for i in range(3)
         ])
@@ -417,24 +430,11 @@ class Part6(Scene):
         self.play(Write(title), run_time=2.5)
         self.wait(2)
         
-        # Create radar PPI display with labeled targets
-        radar_circle = Circle(radius=2.8, color=SUBTLE_NAVY, stroke_width=4)
-        radar_circle.shift(DOWN*0.3)
-        
-        # Radar grid
-        grid = VGroup()
-        for angle in range(0, 360, 30):
-            line = Line(radar_circle.get_center(), 
-                       radar_circle.get_center() + 2.8*rotate_vector(UP, angle*DEGREES),
-                       color=SUBTLE_NAVY, stroke_width=2)
-            grid.add(line)
+        # Create radar PPI display with labeled targets (rings, bearings and sweep in one raster)
+        ppi = PPIDisplay(radius=2.8, rings=[0.9, 1.8, 2.7], ring_units="scene", bearing_step=30, color=TECH_CYAN)
+        ppi.shift(DOWN*0.3)
         
-        for r in [0.9, 1.8, 2.7]:
-            circle = Circle(radius=r, color=SUBTLE_NAVY, stroke_width=2)
-            circle.move_to(radar_circle.get_center())
-            grid.add(circle)
-        
-        self.play(Create(radar_circle), Create(grid), run_time=3)
+        self.play(FadeIn(ppi.start_sweep()), run_time=3)
         self.wait(1.5)
         
         # Different target types with labels
@@ -446,11 +446,17 @@ class Part6(Scene):
             (1.7, -140, "Weather", "#888888", "Rain/Snow"),
         ]
         
+        # Raw returns glow on the scope as the sweep passes; markers and labels go on top
+        returns_xy = np.array([
+            [dist*np.cos(angle*DEGREES), dist*np.sin(angle*DEGREES)] for dist, angle, *_ in targets
+        ])
+        ppi.add_returns("returns", returns_xy, strength=0.8, blob=4)
+        
         target_dots = VGroup()
         labels_group = VGroup()
         
         for dist, angle, name, color, feature in targets:
-            pos = radar_circle.get_center() + dist*(
+            pos = ppi.get_center() + dist*(
                 np.cos(angle*DEGREES)*RIGHT + np.sin(angle*DEGREES)*UP
             )
             
@@ -527,7 +533,7 @@ class Part7(ThreeDScene):
         
         for num_neurons, x_pos, color, radius in layers_config:
             layer = VGroup(*[
-                Sphere(radius=radius, color=color, fill_opacity=0.75, resolution=(10, 10))
+                NODE_SPHERE_FINE(radius=radius, color=color, fill_opacity=0.75)
                 .shift(x_pos + UP*(2-i*4/(num_neurons-1)))
                 for i in range(num_neurons)
             ])
@@ -539,16 +545,16 @@ class Part7(ThreeDScene):
             
             network_layers.append(layer)
         
-        # Create connections between layers
-        connections = VGroup()
-        for i in range(len(network_layers)-1):
-            for n1 in network_layers[i][:3]:  # Limit connections for clarity
-                for n2 in network_layers[i+1][:3]:
-                    line = Line3D(
-                        n1.get_center(), n2.get_center(),
-                        color=SUBTLE_NAVY, stroke_width=0.5, stroke_opacity=0.3
-                    )
-                    connections.add(line)
+        # Create connections between layers, all in one array-backed edge bundle
+        centers = [np.array([neuron.get_center() for neuron in layer[:3]])  # Limit connections for clarity
+                   for layer in network_layers]
+        connections = EdgeBundle(
+            np.concatenate([
+                np.stack(np.broadcast_arrays(a[:, None], b[None]), axis=2).reshape(-1, 2, 3)
+                for a, b in zip(centers[:-1], centers[1:])
+            ]),
+            color=SUBTLE_NAVY, stroke_width=0.5, opacity=0.3
+        )
         
         # Labels
         class_labels = VGroup(
@@ -700,7 +706,7 @@ class Part9(ThreeDScene):
             
             # Internal gates representation (small spheres)
             gates = VGroup(*[
-                Sphere(radius=0.08, color=NEON_PINK, fill_opacity=0.8, resolution=(8, 8))
+                NODE_SPHERE(radius=0.08, color=NEON_PINK, fill_opacity=0.8)
                 .shift(cell_box.get_center() + UP*0.15*i + RIGHT*0.15*j)
                 for i in [-1, 1] for j in [-1, 1]
             ])
@@ -1117,7 +1123,7 @@ class Part13(ThreeDScene):
         
         for i, (size, color) in enumerate(zip(sizes, colors)):
             layer = VGroup(*[
-                Sphere(radius=0.12, color=color, fill_opacity=0.75, resolution=(10, 10))
+                NODE_SPHERE_FINE(radius=0.12, color=color, fill_opacity=0.75)
                 .shift(LEFT*4 + RIGHT*i*1.8 + UP*(2-j*4/(size-1 if size > 1 else 1)))
                 for j in range(size)
             ])
@@ -1130,7 +1136,7 @@ class Part13(ThreeDScene):
         
         for i, (size, color) in enumerate(zip(sizes_dec, colors_dec)):
             layer = VGroup(*[
-                Sphere(radius=0.12, color=color, fill_opacity=0.75, resolution=(10, 10))
+                NODE_SPHERE_FINE(radius=0.12, color=color, fill_opacity=0.75)
                 .shift(RIGHT*0.5 + RIGHT*i*1.8 + UP*(2-j*4/(size-1 if size > 1 else 1)))
                 for j in range(size)
             ])
@@ -1327,21 +1333,21 @@ class Part15(ThreeDScene):
         # Neural network for weight calculation
         # Input: Array signals
         input_nodes = VGroup(*[
-            Sphere(radius=0.1, color=TECH_CYAN, fill_opacity=0.8, resolution=(8, 8))
+            NODE_SPHERE(radius=0.1, color=TECH_CYAN, fill_opacity=0.8)
             .shift(LEFT*2.5 + RIGHT*i*0.6 + UP*0.3)
             for i in range(num_antennas)
         ])
         
         # Hidden layer
         hidden_nodes = VGroup(*[
-            Sphere(radius=0.15, color=NEON_PINK, fill_opacity=0.8, resolution=(10, 10))
+            NODE_SPHERE_FINE(radius=0.15, color=NEON_PINK, fill_opacity=0.8)
             .shift(UP*1.0 + LEFT*1 + RIGHT*i*0.8)
             for i in range(6)
         ])
         
         # Output: Weights
         output_nodes = VGroup(*[
-            Sphere(radius=0.12, color=VIBRANT_ORANGE, fill_opacity=0.8, resolution=(8, 8))
+            NODE_SPHERE(radius=0.12, color=VIBRANT_ORANGE, fill_opacity=0.8)
             .shift(RIGHT*2 + RIGHT*i*0.6 + UP*0.3)
             for i in range(num_antennas)
         ])
@@ -1,6 +1,10 @@
 import asyncio
-import edge_tts
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.narration import narrate
 
 # Narration Script for "The Logic & Algorithms Behind the Rubik's Cube" — YouTube Short
 SCRIPTS = {
@@ -28,20 +32,7 @@ Like and subscribe for more!
 VOICE = "en-US-GuyNeural"
 
 async def generate_voiceover():
-    if not os.path.exists("voiceovers"):
-        os.makedirs("voiceovers")
-
-    print(f"--- Generating Voiceover: {VOICE} ---")
-
-    for part, text in SCRIPTS.items():
-        filename = f"voiceovers/{part}.mp3"
-        print(f"Processing: {part}...")
-
-        communicate = edge_tts.Communicate(text, VOICE)
-        await communicate.save(filename)
-
-    print("\n--- COMPLETE! ---")
-    print("Check the 'voiceovers' folder.")
+    await narrate(SCRIPTS, VOICE)
 
 if __name__ == "__main__":
     asyncio.run(generate_voiceover())
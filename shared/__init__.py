@@ -0,0 +1 @@
+"""Shared tooling used by every project folder (rendering, narration, mobjects)."""
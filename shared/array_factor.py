@@ -0,0 +1,144 @@
+"""Phased-array radiation patterns from the array factor, evaluated on whole angle grids.
+
+For a row of ``n`` elements spaced ``d`` wavelengths apart, with amplitude taper
+``w`` and the progressive phase that steers the beam to ``u0 = sin(theta0)``,
+
+    AF(u) = |sum_k w_k exp(j 2 pi d k (u - u0))| / sum_k w_k,      u = sin(theta)
+
+and a rectangular ``nx x ny`` grid radiates the product of its row and column
+factors. Look angles, steering angles and elements broadcast against each other,
+so S steering angles x A look angles is a single ``(S, A, n)`` evaluation -- a
+beam sweep costs one NumPy call per frame, however many rays it would have been.
+
+    array = PlanarArray(nx=8, ny=8, taper="hamming")
+    steer = ValueTracker(0)                                  # degrees
+    lobe = BeamPattern(array, steer=steer, radius=2.5, floor_db=-30)
+    self.add(lobe)
+    self.play(steer.animate.set_value(30))
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from manim import ORIGIN, UP, ValueTracker
+
+from shared.live_curve import LiveCurve
+
+TAPERS = ("uniform", "hann", "hamming", "taylor")
+
+
+# ========================== TAPERS ==========================
+def taper(n: int, kind: str = "uniform", sidelobe_db: float = 30.0, nbar: int = 4) -> np.ndarray:
+    """Element amplitude weights across an ``n``-element row; ``sidelobe_db`` / ``nbar`` shape "taylor"."""
+    if kind not in TAPERS:
+        raise ValueError(f"Unknown taper {kind!r}, expected one of {TAPERS}")
+    if n == 1 or kind == "uniform":
+        return np.ones(n)
+    x = (np.arange(n) - (n - 1) / 2) / n          # element position across the aperture, (-1/2, 1/2)
+    if kind == "hann":
+        return 0.5 + 0.5 * np.cos(2 * np.pi * x)
+    if kind == "hamming":
+        return 0.54 + 0.46 * np.cos(2 * np.pi * x)
+    # Taylor n-bar: the first nbar - 1 nulls of the uniform pattern moved to the Dolph positions.
+    A = np.arccosh(10 ** (sidelobe_db / 20)) / np.pi
+    sigma2 = nbar ** 2 / (A ** 2 + (nbar - 0.5) ** 2)
+    m = np.arange(1, nbar)[:, None]
+    i = m.T
+    num = np.prod(1 - m ** 2 / (sigma2 * (A ** 2 + (i - 0.5) ** 2)), axis=1)
+    den = np.prod(np.where(i == m, 1.0, 1 - m ** 2 / i ** 2), axis=1)
+    F = (-1.0) ** (m[:, 0] + 1) * num / (2 * den)
+    return 1 + 2 * F @ np.cos(2 * np.pi * m * x)
+
+
+def line_factor(u, weights: np.ndarray, spacing: float = 0.5) -> np.ndarray:
+    """Complex normalized factor of a weighted row at direction-cosine offsets ``u - u0`` (any shape)."""
+    k = np.arange(len(weights)) - (len(weights) - 1) / 2   # centred, so the phase stays real at boresight
+    phase = np.exp(2j * np.pi * spacing * np.multiply.outer(np.asarray(u, dtype=float), k))
+    return phase @ weights / weights.sum()
+
+
+# ========================== ARRAY ==========================
+@dataclass(frozen=True)
+class PlanarArray:
+    nx: int = 8
+    ny: int = 8
+    spacing: float = 0.5            # element pitch, in wavelengths
+    taper: str = "uniform"
+    sidelobe_db: float = 30.0       # Taylor design sidelobe level
+    element_exponent: float = 1.0   # element pattern cos(theta) ** q; 0 = isotropic elements
+
+    @property
+    def weights_x(self) -> np.ndarray:
+        return taper(self.nx, self.taper, self.sidelobe_db)
+
+    @property
+    def weights_y(self) -> np.ndarray:
+        return taper(self.ny, self.taper, self.sidelobe_db)
+
+    def _element(self, cos_theta):
+        return np.clip(cos_theta, 0, None) ** self.element_exponent
+
+    def pattern(self, theta, steer=0.0) -> np.ndarray:
+        """|E| in the x cut at look angles ``theta`` (radians from boresight).
+
+        ``steer`` may be an array of S steering angles; the result is then ``(S, len(theta))``.
+        """
+        theta = np.asarray(theta, dtype=float)
+        steer = np.asarray(steer, dtype=float)
+        u = np.sin(theta) - np.sin(steer)[..., None] if steer.ndim else np.sin(theta) - np.sin(steer)
+        return np.abs(line_factor(u, self.weights_x, self.spacing)) * self._element(np.cos(theta))
+
+    def pattern_2d(self, theta, phi, steer_theta=0.0, steer_phi=0.0) -> np.ndarray:
+        """|E| over any grid of (``theta`` from boresight, ``phi`` around it), e.g. for a 3D lobe surface."""
+        theta, phi = np.broadcast_arrays(np.asarray(theta, dtype=float), np.asarray(phi, dtype=float))
+        u = np.sin(theta) * np.cos(phi) - np.sin(steer_theta) * np.cos(steer_phi)
+        v = np.sin(theta) * np.sin(phi) - np.sin(steer_theta) * np.sin(steer_phi)
+        af = line_factor(u, self.weights_x, self.spacing) * line_factor(v, self.weights_y, self.spacing)
+        return np.abs(af) * self._element(np.cos(theta))
+
+    def phases(self, steer: float = 0.0) -> np.ndarray:
+        """Progressive phase (radians, ``(nx, ny)``) each element needs to steer the beam in the x cut."""
+        k = np.arange(self.nx) - (self.nx - 1) / 2
+        column = -2 * np.pi * self.spacing * k * np.sin(steer)
+        return np.repeat(column[:, None], self.ny, axis=1)
+
+    @classmethod
+    def for_beamwidth(cls, beamwidth: float, spacing: float = 0.5, **kwargs) -> "PlanarArray":
+        """Smallest square array whose uniform half-power beamwidth (radians) is at most ``beamwidth``."""
+        n = max(1, int(round(0.886 / (spacing * beamwidth))))
+        return cls(nx=n, ny=n, spacing=spacing, **kwargs)
+
+
+# ========================== DRAWING ==========================
+def polar_points(magnitude, theta, radius: float = 1.0, floor_db: float = None, center=ORIGIN,
+                 boresight=UP) -> np.ndarray:
+    """``(..., 3)`` points of a polar plot; radius is linear in |E|, or in dB above ``floor_db``."""
+    magnitude = np.asarray(magnitude, dtype=float)
+    if floor_db is None:
+        r = magnitude
+    else:
+        r = np.clip(1 - 20 * np.log10(np.maximum(magnitude, 1e-12)) / floor_db, 0, 1)
+    boresight = np.asarray(boresight, dtype=float)[:2]
+    side = np.array([boresight[1], -boresight[0]])           # +theta turns clockwise off boresight
+    planar = radius * r[..., None] * (np.cos(theta)[..., None] * boresight + np.sin(theta)[..., None] * side)
+    return np.asarray(center, dtype=float) + np.concatenate([planar, np.zeros(r.shape + (1,))], axis=-1)
+
+
+class BeamPattern(LiveCurve):
+    """Closed polar lobe of ``array`` over the front half-space; follows ``steer`` (degrees) if it is a tracker."""
+
+    def __init__(self, array: PlanarArray, steer=0.0, radius: float = 2.0, floor_db: float = None,
+                 samples: int = 361, center=ORIGIN, boresight=UP, **kwargs):
+        self.array = array
+        self.radius = radius
+        self.floor_db = floor_db
+        self.origin = np.asarray(center, dtype=float)
+        self.boresight = boresight
+        tracker = steer if isinstance(steer, ValueTracker) else None
+        fixed = None if tracker is not None else float(steer)
+        super().__init__(lambda theta, t: self.lobe(theta, t if fixed is None else fixed),
+                         u_range=(-np.pi / 2, np.pi / 2), samples=samples, time=tracker, **kwargs)
+
+    def lobe(self, theta, steer_deg: float) -> np.ndarray:
+        magnitude = self.array.pattern(theta, np.radians(steer_deg))
+        return polar_points(magnitude, theta, self.radius, self.floor_db, self.origin, self.boresight)
@@ -0,0 +1,205 @@
+"""Episode assembler: mux each rendered PartN with its voiceover and concatenate.
+
+Usage (from the repository root):
+
+    python -m shared.assemble kalman                        # media/videos/main/1080p60 -> kalman/episode.mp4
+    python -m shared.assemble ship_radar -q 480p15 -o ship_radar/preview.mp4
+
+For every part the rendered video and ``voiceovers/<Part>.mp3`` are muxed into a
+segment whose length is that of the longer track: short narration is padded with
+silence, short video is extended by holding its last frame. The rendered video
+is always stream-copied; a hold becomes a short extra segment of the cloned last
+frame, encoded with the settings manim encodes with (libx264, crf 23, same
+profile and level), so its codec headers match the parts around it. Only parts
+whose codec, size, pixel format or rate differ from the rest are re-encoded, to
+the same settings. The segments are then joined with ffmpeg's concat demuxer
+without any further re-encoding -- but only if they agree down to the bitstream
+(profile, level and codec headers). If some segment still does not (a genuinely
+foreign input), the episode is joined with the concat filter and encoded once
+instead.
+"""
+
+import argparse
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from shared.media import probe, probe_duration
+
+AUDIO_ARGS = ["-c:a", "aac", "-b:a", "192k", "-ar", "48000", "-ac", "2"]
+ENCODERS = {"h264": "libx264", "hevc": "libx265", "vp9": "libvpx-vp9"}
+# manim's own encoder options (libx264 at crf 23, default preset); matching them keeps SPS/PPS identical.
+MANIM_OPTIONS = ["-preset", "medium", "-crf", "23"]
+X264_PROFILES = {"Constrained Baseline": "baseline", "Baseline": "baseline", "Main": "main", "High": "high",
+                 "High 10": "high10", "High 4:2:2": "high422", "High 4:4:4 Predictive": "high444"}
+
+
+def _natural_key(name: str):
+    return [int(tok) if tok.isdigit() else tok for tok in re.split(r"(\d+)", name)]
+
+
+def _video_stream(path: str) -> dict:
+    return next(s for s in probe(path)["streams"] if s["codec_type"] == "video")
+
+
+def _stream_params(stream: dict) -> tuple:
+    return (stream["codec_name"], stream["width"], stream["height"], stream["pix_fmt"], stream["r_frame_rate"])
+
+
+def _video_params(path: str) -> tuple:
+    """What has to match for segments to be concatenated by stream copy."""
+    return _stream_params(_video_stream(path))
+
+
+def _bitstream_params(path: str) -> tuple:
+    """What additionally has to match for the concat demuxer to join without decode glitches."""
+    stream = _video_stream(path)
+    return _video_params(path) + (stream.get("profile"), stream.get("level"), stream.get("extradata_hash"))
+
+
+def _ffmpeg(*args):
+    subprocess.run(["ffmpeg", "-v", "error", "-y", *args], check=True)
+
+
+def find_parts(project_dir: str, module: str = "main", quality: str = "1080p60", scenes=None) -> list:
+    """Return ``[(scene, video_path, audio_path_or_None)]`` in episode order."""
+    video_dir = os.path.join(project_dir, "media", "videos", module, quality)
+    if scenes is None:
+        scenes = sorted((os.path.splitext(f)[0] for f in os.listdir(video_dir) if f.endswith(".mp4")),
+                        key=_natural_key)
+    parts = []
+    for scene in scenes:
+        audio = os.path.join(project_dir, "voiceovers", f"{scene}.mp3")
+        parts.append((scene, os.path.join(video_dir, f"{scene}.mp4"), audio if os.path.exists(audio) else None))
+    return parts
+
+
+def _encoder_args(reference: dict) -> list:
+    """Video encoder options that reproduce the reference stream's codec headers."""
+    codec = reference["codec_name"]
+    args = ["-c:v", ENCODERS.get(codec, "libx264")]
+    if codec != "h264":
+        return args + ["-crf", "23"]
+    args += MANIM_OPTIONS
+    if reference.get("profile") in X264_PROFILES:
+        args += ["-profile:v", X264_PROFILES[reference["profile"]]]
+    if reference.get("level", 0) > 0:
+        args += ["-level", f"{reference['level'] / 10:.1f}"]
+    return args
+
+
+def _build_segment(scene, video, audio, reference, timescale, stem) -> tuple:
+    """Mux one part into its segment, plus a held-frame tail if the narration runs longer.
+
+    Returns ``(segment paths, how the video was handled)``.
+    """
+    video_len = probe_duration(video)
+    audio_len = probe_duration(audio) if audio else 0.0
+    codec, width, height, pix_fmt, rate = _stream_params(reference)
+    num, den = (int(x) for x in rate.split("/"))
+    # Anything shorter than a frame is not worth a tail.
+    hold = max(0.0, audio_len - video_len)
+    hold_frames = math.ceil(hold * num / den - 1e-6) if hold > den / num else 0
+    conform = _video_params(video) != _stream_params(reference)
+
+    segment = f"{stem}.mp4"
+    args = ["-i", video]
+    if audio:
+        args += ["-i", audio]
+    else:
+        args += ["-f", "lavfi", "-i", "anullsrc=r=48000:cl=stereo"]
+    args += ["-map", "0:v:0", "-map", "1:a:0"]
+    if conform:
+        args += ["-vf", f"scale={width}:{height},fps={rate},format={pix_fmt}", *_encoder_args(reference)]
+    else:
+        args += ["-c:v", "copy"]
+    length = video_len if hold_frames else max(video_len, audio_len)
+    args += ["-af", "apad", *AUDIO_ARGS, "-t", f"{length:.3f}", "-video_track_timescale", timescale, segment]
+    _ffmpeg(*args)
+    if not hold_frames:
+        return [segment], "re-encoded" if conform else "stream copy"
+
+    # The hold: the last frame cloned for the rest of the narration, as its own short segment.
+    still, tail = f"{stem}_last.png", f"{stem}_hold.mp4"
+    _ffmpeg("-sseof", "-1", "-i", video, "-vf", f"scale={width}:{height}", "-update", "1", still)
+    _ffmpeg("-loop", "1", "-framerate", rate, "-i", still, "-ss", f"{video_len:.3f}", "-i", audio,
+            "-map", "0:v:0", "-map", "1:a:0", "-vf", f"format={pix_fmt}", *_encoder_args(reference),
+            "-frames:v", str(hold_frames), "-af", "apad", *AUDIO_ARGS, "-t", f"{hold_frames * den / num:.3f}",
+            "-video_track_timescale", timescale, tail)
+    return [segment, tail], ("re-encoded" if conform else "stream copy") + f", {hold_frames}-frame hold"
+
+
+def _concat_filter(segments, reference, output):
+    """Join segments whose bitstreams differ by decoding them all and encoding the episode once."""
+    codec, _, _, pix_fmt, _ = reference
+    args = []
+    for segment in segments:
+        args += ["-i", segment]
+    streams = "".join(f"[{i}:v:0][{i}:a:0]" for i in range(len(segments)))
+    args += ["-filter_complex", f"{streams}concat=n={len(segments)}:v=1:a=1[v][a]", "-map", "[v]", "-map", "[a]",
+             "-c:v", ENCODERS.get(codec, "libx264"), "-preset", "veryfast", "-crf", "18", "-pix_fmt", pix_fmt,
+             *AUDIO_ARGS, "-movflags", "+faststart", output]
+    _ffmpeg(*args)
+
+
+def assemble(project_dir: str, output: str, module: str = "main", quality: str = "1080p60",
+             scenes=None, workers=None) -> list:
+    """Build ``output`` from the project's rendered parts; returns ``[(scene, how its video was handled)]``.
+
+    Every part counts as re-encoded when the episode had to be joined with the concat filter.
+    """
+    parts = find_parts(project_dir, module, quality, scenes)
+    if not parts:
+        raise FileNotFoundError(f"No rendered scenes under {project_dir}/media/videos/{module}/{quality}")
+    params = Counter(_video_params(video) for _, video, _ in parts).most_common(1)[0][0]
+    reference = next(_video_stream(video) for _, video, _ in parts if _video_params(video) == params)
+    # A shared track timescale keeps stream-copied timestamps exact across the joins.
+    timescale = Counter(_video_stream(video)["time_base"].split("/")[1]
+                        for _, video, _ in parts).most_common(1)[0][0]
+
+    with tempfile.TemporaryDirectory(prefix="assemble-") as tmp:
+        stems = [os.path.join(tmp, f"{i:03d}_{scene}") for i, (scene, _, _) in enumerate(parts)]
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            built = list(pool.map(
+                lambda job: _build_segment(*job[0], reference, timescale, job[1]), zip(parts, stems)
+            ))
+        segments = [path for paths, _ in built for path in paths]
+
+        copy_join = len({_bitstream_params(segment) for segment in segments}) == 1
+        if copy_join:
+            list_file = os.path.join(tmp, "concat.txt")
+            with open(list_file, "w", encoding="utf-8") as handle:
+                handle.writelines(f"file '{segment}'\n" for segment in segments)
+            _ffmpeg("-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", "-movflags", "+faststart", output)
+        else:
+            _concat_filter(segments, _stream_params(reference), output)
+    return [(scene, status if copy_join else "re-encoded") for (scene, _, _), (_, status) in zip(parts, built)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Mux rendered parts with their voiceovers into one episode.")
+    parser.add_argument("project", help="project folder, e.g. kalman")
+    parser.add_argument("scenes", nargs="*", help="scenes in episode order (default: all rendered, Part1..PartN)")
+    parser.add_argument("-m", "--module", default="main", help="scene file name without .py")
+    parser.add_argument("-q", "--quality", default="1080p60", help="render folder, e.g. 480p15 or 2160p60")
+    parser.add_argument("-o", "--output", help="output file (default: <project>/episode.mp4)")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.join(args.project, "episode.mp4")
+    start = time.perf_counter()
+    report = assemble(args.project, output, args.module, args.quality, args.scenes or None, args.workers)
+    for scene, status in report:
+        print(f"{scene:<16} {status}")
+    print(f"\n--- {output}: {len(report)} parts in {time.perf_counter() - start:.1f}s ---")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Word/sentence timing index written next to every narration mp3.
+
+``voiceovers/Part11.mp3`` gets a ``voiceovers/Part11.json`` sidecar:
+
+    {"version": 1,
+     "words":     [[start, end, "Kalman"], [start, end, "Gain"], ...],
+     "sentences": [[start, end, "The updated state equals ..."], ...]}
+
+Times are seconds from the start of the audio. Scenes query it through
+``CueSheet`` (usually via ``NarrationTiming.wait_until_cue``).
+"""
+
+import json
+import os
+import re
+
+INDEX_VERSION = 1
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _norm(token: str) -> str:
+    return re.sub(r"[^0-9a-z]", "", token.lower())
+
+
+def index_path(audio_path: str) -> str:
+    return os.path.splitext(audio_path)[0] + ".json"
+
+
+def build_index(words, text: str) -> dict:
+    """Build the sidecar dict from TTS word boundaries and the script the audio was made from."""
+    sentences = [s.strip() for s in _SENTENCE_END.split(" ".join(text.split())) if s.strip()]
+    script = [(_norm(tok), sid) for sid, sentence in enumerate(sentences) for tok in sentence.split() if _norm(tok)]
+
+    # Walk the boundaries and the script tokens together; a short lookahead absorbs
+    # tokens the TTS engine merges or splits differently ("3-5", "x-hat", ...).
+    spans = [[None, None] for _ in sentences]
+    cursor = 0
+    for start, end, word in words:
+        for k in range(cursor, min(cursor + 6, len(script))):
+            if script[k][0] == _norm(word):
+                cursor = k
+                break
+        if not script:
+            break
+        sid = script[min(cursor, len(script) - 1)][1]
+        span = spans[sid]
+        span[0] = start if span[0] is None else span[0]
+        span[1] = end
+        cursor += 1
+
+    return {
+        "version": INDEX_VERSION,
+        "words": [[round(start, 3), round(end, 3), word] for start, end, word in words],
+        "sentences": [[round(span[0], 3), round(span[1], 3), sentence]
+                      for span, sentence in zip(spans, sentences) if span[0] is not None],
+    }
+
+
+def write_index(audio_path: str, words, text: str):
+    path = index_path(audio_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(build_index(words, text), handle, indent=1)
+    os.replace(tmp_path, path)
+
+
+class CueSheet:
+    """Look up when a word, phrase or sentence is spoken in one narration part."""
+
+    def __init__(self, index: dict):
+        self.words = index["words"]
+        self.sentences = index["sentences"]
+        self._tokens = [_norm(word) for _, _, word in self.words]
+
+    @classmethod
+    def load(cls, audio_path: str) -> "CueSheet":
+        with open(index_path(audio_path), encoding="utf-8") as handle:
+            return cls(json.load(handle))
+
+    def time(self, phrase: str, occurrence: int = 1) -> float:
+        """Start time of the ``occurrence``-th time ``phrase`` is spoken."""
+        target = [_norm(tok) for tok in phrase.split() if _norm(tok)]
+        seen = 0
+        for i in range(len(self._tokens) - len(target) + 1):
+            if self._tokens[i:i + len(target)] == target:
+                seen += 1
+                if seen == occurrence:
+                    return self.words[i][0]
+        raise KeyError(f"{phrase!r} (occurrence {occurrence}) is not spoken in this narration")
+
+    def sentence(self, index: int) -> float:
+        """Start time of sentence ``index`` (0-based)."""
+        return self.sentences[index][0]
+
+    @property
+    def duration(self) -> float:
+        return self.words[-1][1] if self.words else 0.0
@@ -0,0 +1,221 @@
+"""Warm render daemon.
+
+A long-lived zygote process imports manim once and warms up Pango/fontconfig,
+then forks one child per render job, so a job starts drawing frames right away
+instead of paying for interpreter start-up and the manim import. Jobs arrive as
+JSON lines over a Unix socket. Watched scene files are polled together with
+everything their render-cache keys hash (imported project helpers, ``shared.*``,
+voiceovers); when any of them changes, only the scenes whose key changed are
+re-rendered.
+
+    python -m shared.daemon serve &                         # start the zygote
+    python -m shared.daemon render kalman/main.py Part1 -q l
+    python -m shared.daemon watch ship_radar/main.py -q l
+    python -m shared.daemon stop
+"""
+
+import argparse
+import json
+import os
+import select
+import socket
+import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import asdict
+
+from shared.registry import scenes_in
+from shared.render_cache import dependency_paths, scene_keys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOCKET_PATH = os.path.join(REPO_ROOT, ".cache", "render.sock")
+POLL_INTERVAL = 0.5
+
+
+# ========================== ZYGOTE ==========================
+def _preload():
+    """Import manim and touch the slow lazily-initialized parts before any job forks."""
+    from manim import MathTex, Text, logger, tempconfig
+
+    from shared import text_cache
+
+    text_cache.install()
+    with tempconfig({"media_dir": tempfile.mkdtemp(prefix="render-daemon-")}):
+        Text("warm-up", font="Monospace")
+        try:
+            MathTex(r"x")
+        except Exception as exc:  # no LaTeX installed: Tex scenes will fail per job instead
+            logger.warning(f"LaTeX warm-up failed: {exc}")
+    text_cache.flush()  # so forked jobs do not inherit and re-report the warm-up counts
+
+
+def _run_job(module_path: str, scene: str, quality: str, conn=None):
+    """Child side: render one scene, record it in the render cache, report and exit."""
+    from shared.render import init_worker, render_scene
+    from shared.render_cache import RenderCache
+    from shared import text_cache
+
+    code = 1
+    try:
+        init_worker(module_path, quality)
+        result = render_scene(scene)
+        if result.ok and result.output:
+            cache = RenderCache(module_path)
+            cache.record(scene, quality, scene_keys(module_path, [scene], quality)[scene], result.output)
+            cache.save()
+        code = result.exit_code
+        message = asdict(result)
+    except BaseException as exc:
+        message = {"scene": scene, "exit_code": 1, "output": None, "error": f"{type(exc).__name__}: {exc}"}
+    print(f"[daemon] {scene}: {'ok' if code == 0 else message.get('error')}", flush=True)
+    text_cache.flush()  # os._exit skips atexit
+    if conn is not None:
+        try:
+            conn.sendall((json.dumps(message) + "\n").encode())
+        except OSError:
+            pass
+    os._exit(code)
+
+
+class RenderDaemon:
+    def __init__(self, socket_path: str = SOCKET_PATH, max_jobs: int = None):
+        self.socket_path = socket_path
+        self.max_jobs = max_jobs or os.cpu_count() or 1
+        self.jobs = {}                 # pid -> scene
+        self.queue = deque()           # (module, scene, quality, conn or None)
+        self.watched = {}              # module -> {"quality", "mtimes", "keys"}
+        self.running = True
+
+    def _spawn(self, module, scene, quality, conn):
+        pid = os.fork()
+        if pid == 0:
+            self.listener.close()
+            _run_job(module, scene, quality, conn)
+        self.jobs[pid] = scene
+        if conn is not None:
+            conn.close()
+
+    def _pump(self):
+        while self.jobs:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            self.jobs.pop(pid, None)
+        while self.queue and len(self.jobs) < self.max_jobs:
+            self._spawn(*self.queue.popleft())
+
+    @staticmethod
+    def _mtimes(paths) -> dict:
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes
+
+    def _poll_watched(self):
+        for module, state in self.watched.items():
+            if self._mtimes(state["mtimes"]) == state["mtimes"]:
+                continue
+            try:
+                # An edit may add imports or voiceovers, so the watched set is rebuilt too.
+                mtimes = self._mtimes(dependency_paths(module))
+                keys = scene_keys(module, scenes_in(module), state["quality"])
+            except FileNotFoundError:
+                continue
+            except SyntaxError as exc:  # caught mid-edit
+                print(f"[daemon] {module}: {exc}", flush=True)
+                continue
+            changed = [scene for scene, key in keys.items() if state["keys"].get(scene) != key]
+            state["mtimes"], state["keys"] = mtimes, keys
+            for scene in changed:
+                print(f"[daemon] {os.path.basename(module)}:{scene} changed, re-rendering", flush=True)
+                self.queue.append((module, scene, state["quality"], None))
+
+    def _handle(self, conn):
+        request = json.loads(conn.makefile().readline() or "{}")
+        cmd = request.get("cmd")
+        if cmd == "render":
+            self.queue.append((os.path.abspath(request["module"]), request["scene"], request.get("quality", "l"), conn))
+            return
+        if cmd == "watch":
+            module = os.path.abspath(request["module"])
+            # Baseline is the file as it is now; only later edits trigger renders.
+            quality = request.get("quality", "l")
+            self.watched[module] = {"quality": quality, "mtimes": self._mtimes(dependency_paths(module)),
+                                    "keys": scene_keys(module, scenes_in(module), quality)}
+            reply = {"watching": module}
+        elif cmd == "stop":
+            self.running = False
+            reply = {"stopping": True}
+        else:
+            reply = {"jobs": sorted(self.jobs.values()), "queued": len(self.queue), "watching": list(self.watched)}
+        conn.sendall((json.dumps(reply) + "\n").encode())
+        conn.close()
+
+    def serve(self):
+        _preload()
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.socket_path)
+        self.listener.listen()
+        print(f"[daemon] ready on {self.socket_path} (pid {os.getpid()})", flush=True)
+        try:
+            while self.running:
+                readable, _, _ = select.select([self.listener], [], [], POLL_INTERVAL)
+                if readable:
+                    conn, _ = self.listener.accept()
+                    self._handle(conn)
+                self._poll_watched()
+                self._pump()
+        finally:
+            self.listener.close()
+            os.remove(self.socket_path)
+
+
+# ========================== CLIENT ==========================
+def request(payload: dict, socket_path: str = SOCKET_PATH) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        conn.sendall((json.dumps(payload) + "\n").encode())
+        return json.loads(conn.makefile().readline())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Warm manim render server.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("serve").add_argument("-j", "--jobs", type=int, default=None, help="concurrent renders")
+    render = sub.add_parser("render")
+    render.add_argument("module")
+    render.add_argument("scene")
+    render.add_argument("-q", "--quality", default="l")
+    watch = sub.add_parser("watch")
+    watch.add_argument("module")
+    watch.add_argument("-q", "--quality", default="l")
+    sub.add_parser("status")
+    sub.add_parser("stop")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        RenderDaemon(max_jobs=args.jobs).serve()
+        return 0
+    payload = {"cmd": args.cmd}
+    if args.cmd in ("render", "watch"):
+        payload.update(module=os.path.abspath(args.module), quality=args.quality)
+    if args.cmd == "render":
+        payload["scene"] = args.scene
+    start = time.perf_counter()
+    reply = request(payload)
+    print(json.dumps(reply, indent=2))
+    if args.cmd == "render":
+        print(f"--- round trip {time.perf_counter() - start:.1f}s ---")
+        return reply.get("exit_code", 1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Matrices drawn as a single image instead of one Square / Dot per cell.
+
+``Heatmap`` turns an ``(rows, cols)`` array into an RGBA image with one pixel
+per cell and lets the renderer scale it up with nearest-neighbour sampling, so
+a 64 x 64 attention matrix costs the same to draw as a 3 x 3 one. Values map
+linearly from ``low_color`` / ``low_opacity`` to ``color`` / ``opacity``;
+``set_values`` rewrites the pixels in place for animated matrices.
+
+    weights = layer(tokens).weights[0]                # (T, T)
+    grid = Heatmap(weights, width=2, color=NEON_PINK)
+    self.play(FadeIn(grid))
+    self.play(Flash(grid.cell_center(0, weights[0].argmax())))
+"""
+
+import numpy as np
+from manim import BLACK, DL, RESAMPLING_ALGORITHMS, UR, WHITE, ImageMobject, color_to_rgb
+
+
+class Heatmap(ImageMobject):
+    """One image pixel per matrix cell, stretched to ``width`` x ``height`` scene units."""
+
+    def __init__(self, values, width: float = 2.0, height: float = None, color=WHITE, low_color=BLACK,
+                 opacity: float = 1.0, low_opacity: float = 0.1, vmin: float = None, vmax: float = None, **kwargs):
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        self.vmin, self.vmax = vmin, vmax
+        self.high = np.append(color_to_rgb(color), opacity)
+        self.low = np.append(color_to_rgb(low_color), low_opacity)
+        super().__init__(self._rgba(values), **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        rows, cols = values.shape
+        self.stretch_to_fit_width(width)
+        self.stretch_to_fit_height(height if height is not None else width * rows / cols)
+
+    def _rgba(self, values: np.ndarray) -> np.ndarray:
+        lo = values.min() if self.vmin is None else self.vmin
+        hi = values.max() if self.vmax is None else self.vmax
+        t = np.clip((values - lo) / (hi - lo if hi > lo else 1.0), 0, 1)[..., None]
+        return np.round((self.low + (self.high - self.low) * t) * 255).astype(np.uint8)
+
+    @property
+    def grid_shape(self) -> tuple:
+        return self.pixel_array.shape[:2]
+
+    def set_values(self, values):
+        """Repaint from a new matrix of the same shape."""
+        self.pixel_array[...] = self._rgba(np.atleast_2d(np.asarray(values, dtype=float)))
+        return self
+
+    def cell_center(self, row: int, col: int) -> np.ndarray:
+        """Scene point at the centre of a cell (row 0 at the top)."""
+        rows, cols = self.grid_shape
+        left, bottom, _ = self.get_corner(DL)
+        right, top, _ = self.get_corner(UR)
+        return np.array([left + (col + 0.5) / cols * (right - left), top - (row + 0.5) / rows * (top - bottom), 0.0])
@@ -0,0 +1,162 @@
+"""Instanced spheres: tessellate a unit sphere once per resolution, then stamp out copies.
+
+``Sphere(...)`` builds its faces in uv space and maps every bezier point
+through the surface function one at a time (``np.apply_along_axis``), so a
+layer of 8 x 8 markers costs about a thousand Python calls per sphere. A
+``SphereTemplate`` does that mapping once, vectorized, and keeps the unit
+face array, read-only and shared by every instance. Each instance is a real
+``Sphere`` holding one ``(faces, 16, 3)`` block -- the template scaled and
+moved into place -- and its faces' points are views into that block, not
+copies. Moves, rotations and scaling of the whole sphere transform the block
+in one array operation, in place, so the faces keep sharing it. Styling,
+checkerboarding, ``.animate`` and everything else behave exactly as on a
+plain ``Sphere``; an operation that gives a face new points (an animation
+morphing it, say) simply detaches it, and the sphere falls back to moving
+its faces one by one.
+
+Faces are still one ``ThreeDVMobject`` each, so manim's per-face depth
+sorting and shading keep working; only their vertex storage is pooled.
+
+    node = sphere_template((8, 8))
+    layer = VGroup(*[
+        node(center=LEFT*3 + UP*(1 - i*0.5), radius=0.12, color=TECH_CYAN, fill_opacity=0.8)
+        for i in range(5)
+    ])
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from manim import ORIGIN, PI, TAU, Sphere, ThreeDVMobject, VGroup
+
+
+def _unit_sphere(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return np.stack([np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), -np.cos(v)], axis=-1)
+
+
+@lru_cache(maxsize=None)
+def _unit_faces(resolution: tuple, u_range: tuple, v_range: tuple, handle_factor: float) -> np.ndarray:
+    """``(u_res * v_res, 16, 3)`` face points of the unit sphere, as ``Surface`` would build them.
+
+    Each face is four straight cubic curves around its uv cell. Like ``VMobject.apply_function``,
+    the handles are pulled towards their anchors by ``handle_factor`` before the mapping and pushed
+    back out after it, so the curves follow the sphere's tangents.
+    """
+    u_res, v_res = resolution
+    u = np.linspace(*u_range, u_res + 1)
+    v = np.linspace(*v_range, v_res + 1)
+    i, j = np.meshgrid(np.arange(u_res), np.arange(v_res), indexing="ij")
+    corners = np.stack([
+        np.stack([u[i], v[j]], axis=-1), np.stack([u[i + 1], v[j]], axis=-1),
+        np.stack([u[i + 1], v[j + 1]], axis=-1), np.stack([u[i], v[j + 1]], axis=-1),
+        np.stack([u[i], v[j]], axis=-1),
+    ], axis=2).reshape(-1, 5, 2)
+    t = np.linspace(0, 1, 4)[None, None, :, None]
+    a, b = corners[:, :-1, None], corners[:, 1:, None]
+    curves = a + (b - a) * t                                           # (faces, 4, 4, 2)
+
+    start, end = curves[:, :, :1], curves[:, :, 3:]
+    curves[:, :, 1:2] = start + handle_factor * (curves[:, :, 1:2] - start)
+    curves[:, :, 2:3] = end + handle_factor * (curves[:, :, 2:3] - end)
+    points = _unit_sphere(curves[..., 0], curves[..., 1])
+    start, end = points[:, :, :1], points[:, :, 3:]
+    points[:, :, 1:2] = start + (points[:, :, 1:2] - start) / handle_factor
+    points[:, :, 2:3] = end + (points[:, :, 2:3] - end) / handle_factor
+    points = points.reshape(len(corners), 16, 3)
+    points.flags.writeable = False
+    return points
+
+
+class InstancedSphere(Sphere):
+    """A ``Sphere`` whose faces come from a ``SphereTemplate`` and share one vertex block."""
+
+    def __init__(self, template: "SphereTemplate", center=ORIGIN, radius: float = 1, **kwargs):
+        self.template = template
+        self._mapped = False
+        super().__init__(center=center, radius=radius, resolution=template.resolution,
+                         u_range=template.u_range, v_range=template.v_range, **kwargs)
+
+    def _setup_in_uv_space(self):
+        u_values, v_values = self._get_u_values_and_v_values()
+        v_res = len(v_values) - 1
+        self.block = self.template.faces(self.pre_function_handle_to_anchor_scale_factor) * self.radius
+        faces = VGroup()
+        self.list_of_faces = []
+        for index in range(len(self.block)):
+            i, j = divmod(index, v_res)
+            face = ThreeDVMobject()
+            face.points = self.block[index]
+            face.u_index, face.v_index = i, j
+            face.u1, face.u2 = u_values[i:i + 2]
+            face.v1, face.v2 = v_values[j:j + 2]
+            faces.add(face)
+            self.list_of_faces.append(face)
+        faces.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        faces.set_stroke(color=self.stroke_color, width=self.stroke_width, opacity=self.stroke_opacity)
+        self.add(*faces)
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+        self._mapped = True
+
+    def _shares_block(self) -> bool:
+        """Whether every point of the sphere still lives in ``block``."""
+        return (len(self.family_members_with_points()) == len(self.list_of_faces)
+                and all(face.points.base is self.block for face in self.list_of_faces))
+
+    def _rebind(self):
+        """Pool the faces' current points into a fresh block (after a copy, say)."""
+        self.block = np.stack([face.points for face in self.list_of_faces]).astype(float)
+        for face, points in zip(self.list_of_faces, self.block):
+            face.points = points
+        return self
+
+    # ========================== TRANSFORMS ==========================
+    def apply_function(self, function, **kwargs):
+        # Surface.__init__ maps the uv faces onto the sphere right after setup;
+        # template faces are already there, so that one call is skipped.
+        if self._mapped:
+            self._mapped = False
+            return self
+        return super().apply_function(function, **kwargs)
+
+    def shift(self, *vectors):
+        if not self._shares_block():
+            return super().shift(*vectors)
+        self.block += np.sum(vectors, axis=0)
+        return self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if not self._shares_block():
+            return super().apply_points_function_about_point(func, about_point, about_edge)
+        if about_point is None:
+            about_point = self.get_critical_point(ORIGIN if about_edge is None else about_edge)
+        about_point = np.array(about_point, dtype=float)
+        flat = self.block.reshape(-1, 3)
+        flat[...] = func(flat - about_point) + about_point
+        return self
+
+    def copy(self):
+        result = super().copy()
+        return result._rebind() if self._shares_block() else result
+
+
+@dataclass(frozen=True)
+class SphereTemplate:
+    resolution: tuple = (8, 8)
+    u_range: tuple = (0, TAU)
+    v_range: tuple = (0, PI)
+
+    def faces(self, handle_factor: float = 1e-5) -> np.ndarray:
+        """Read-only unit-sphere face points, mapped once and shared by every instance."""
+        return _unit_faces(self.resolution, self.u_range, self.v_range, handle_factor)
+
+    def __call__(self, center=ORIGIN, radius: float = 1, **kwargs) -> InstancedSphere:
+        return InstancedSphere(self, center=center, radius=radius, **kwargs)
+
+
+def sphere_template(resolution=(8, 8)) -> SphereTemplate:
+    """Template for ``Sphere(resolution=...)``; an int means the same resolution along u and v."""
+    if isinstance(resolution, int):
+        resolution = (resolution, resolution)
+    return SphereTemplate(tuple(resolution))
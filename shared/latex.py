@@ -0,0 +1,177 @@
+"""Batch LaTeX precompilation for MathTex / Tex formulas.
+
+manim compiles every formula on first use with its own ``latex`` + ``dvisvgm``
+run. This module finds all formulas with string-literal arguments in a set of
+scene files (statically, via ``ast``), typesets the ones missing from the tex
+cache in a single LaTeX document -- one ``preview`` page per formula -- and
+splits the DVI into per-formula SVGs named exactly like manim names them, so
+manim finds them in ``tex_dir`` and never runs LaTeX itself.
+
+    python -m shared.latex ship_radar kalman/main.py
+"""
+
+import argparse
+import ast
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEX_CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "tex")
+# (default environment, argument separator) of each class, as in manim.
+TEX_CLASSES = {"MathTex": ("align*", " "), "Tex": ("center", ""), "SingleStringMathTex": ("align*", "")}
+# Keyword arguments that change how manim splits the string; such calls are left to manim.
+_UNSUPPORTED_KWARGS = {"substrings_to_isolate", "tex_to_color_map", "tex_template"}
+
+
+# ========================== COLLECTION ==========================
+def _call_formulas(call) -> list:
+    name = call.func.id if isinstance(call.func, ast.Name) else getattr(call.func, "attr", None)
+    if name not in TEX_CLASSES or not call.args:
+        return []
+    if not all(isinstance(a, ast.Constant) and isinstance(a.value, str) for a in call.args):
+        return []
+    environment, separator = TEX_CLASSES[name]
+    for kw in call.keywords:
+        if kw.arg in _UNSUPPORTED_KWARGS:
+            return []
+        if kw.arg in ("tex_environment", "arg_separator"):
+            if not isinstance(kw.value, ast.Constant):
+                return []
+            if kw.arg == "tex_environment":
+                environment = kw.value.value
+            else:
+                separator = kw.value.value
+    strings = [a.value for a in call.args]
+    # Double-brace groups are split into their own substrings, like MathTex does.
+    pieces = sum((re.split("{{(.*?)}}", s) for s in strings), [])
+    if len(pieces) > len(strings):
+        pieces = [p.strip() for p in pieces]
+    pieces = [p for p in pieces if p]
+    formulas = [(separator.join(pieces), environment)]
+    if name != "SingleStringMathTex" and len(pieces) > 1:
+        # manim versions that size submobjects per substring compile each piece on its own.
+        formulas += [(piece, environment) for piece in pieces]
+    return formulas
+
+
+def collect_formulas(paths) -> list:
+    """Unique ``(tex_string, environment)`` pairs used by the given scene files / project folders."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, f) for f in os.listdir(path) if f.endswith(".py"))
+        else:
+            files.append(path)
+    seen, formulas = set(), []
+    for path in files:
+        with open(path, encoding="utf-8") as handle:
+            tree = ast.parse(handle.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                for formula in _call_formulas(node):
+                    if formula not in seen:
+                        seen.add(formula)
+                        formulas.append(formula)
+    return formulas
+
+
+# ========================== COMPILATION ==========================
+def _modified_expression(tex: str) -> str:
+    """The string manim actually typesets (fillers for dangling ``^``, ``\\sqrt`` ...)."""
+    from manim import SingleStringMathTex
+
+    try:
+        return SingleStringMathTex.__new__(SingleStringMathTex)._get_modified_expression(tex)
+    except AttributeError:  # manim moved the helper; fall back to its core behaviour
+        return tex.strip() or "\\quad"
+
+
+def _batch_document(texcodes) -> str:
+    """Merge several single-formula standalone documents into one multi-page document."""
+    preamble = texcodes[0].split(r"\begin{document}")[0]
+    preamble, count = re.subn(
+        r"\\documentclass(\[[^\]]*\])?\{standalone\}",
+        lambda _: "\\documentclass{article}\n\\usepackage[active,tightpage]{preview}\n"
+                  "\\setlength\\PreviewBorder{0.5bp}",
+        preamble,
+    )
+    if count != 1:
+        raise ValueError("tex template is not a standalone document")
+    bodies = [code.split(r"\begin{document}", 1)[1].rsplit(r"\end{document}", 1)[0] for code in texcodes]
+    pages = "\n".join(f"\\begin{{preview}}\n{body.strip()}\n\\end{{preview}}" for body in bodies)
+    return f"{preamble}\\begin{{document}}\n{pages}\n\\end{{document}}\n"
+
+
+def precompile(paths, tex_dir: str = None) -> dict:
+    """Make sure every formula in ``paths`` has its SVG in ``tex_dir``.
+
+    Returns counts: ``{"formulas", "cached", "compiled", "failed"}``.
+    """
+    from manim import config, tempconfig
+    from manim.utils.tex_file_writing import tex_hash, tex_to_svg_file
+
+    tex_dir = tex_dir or TEX_CACHE_DIR
+    os.makedirs(tex_dir, exist_ok=True)
+    template = config.tex_template
+    formulas = collect_formulas(paths)
+
+    jobs = []   # (texcode, target svg, expression, environment)
+    for tex, environment in formulas:
+        expression = _modified_expression(tex)
+        texcode = template.get_texcode_for_expression_in_env(expression, environment)
+        svg = os.path.join(tex_dir, tex_hash(texcode) + ".svg")
+        if not os.path.exists(svg):
+            jobs.append((texcode, svg, expression, environment))
+    stats = {"formulas": len(formulas), "cached": len(formulas) - len(jobs), "compiled": 0, "failed": 0}
+    if not jobs:
+        return stats
+
+    with tempfile.TemporaryDirectory(prefix="texbatch-") as tmp:
+        try:
+            with open(os.path.join(tmp, "batch.tex"), "w", encoding="utf-8") as handle:
+                handle.write(_batch_document([job[0] for job in jobs]))
+            subprocess.run([template.tex_compiler, "-interaction=batchmode", "-halt-on-error", "batch.tex"],
+                           cwd=tmp, check=True, capture_output=True)
+            subprocess.run(["dvisvgm", "--page=1-", "-n", "-v", "0", "-o", "page-%p.svg",
+                            "batch" + template.output_format], cwd=tmp, check=True, capture_output=True)
+            pages = {int(re.search(r"(\d+)", f).group(1)): os.path.join(tmp, f)
+                     for f in os.listdir(tmp) if f.startswith("page-") and f.endswith(".svg")}
+            if len(pages) != len(jobs):
+                raise RuntimeError(f"expected {len(jobs)} pages, dvisvgm wrote {len(pages)}")
+            for (_, svg, _, _), page in zip(jobs, sorted(pages)):
+                shutil.move(pages[page], svg)
+            stats["compiled"] = len(jobs)
+            return stats
+        except (subprocess.CalledProcessError, RuntimeError, ValueError):
+            pass  # one bad formula sinks the whole batch; let manim compile them one by one
+
+    with tempconfig({"tex_dir": tex_dir}):
+        for _, _, expression, environment in jobs:
+            try:
+                tex_to_svg_file(expression, environment=environment, tex_template=template)
+                stats["compiled"] += 1
+            except Exception:
+                stats["failed"] += 1
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Precompile every MathTex/Tex formula of some projects.")
+    parser.add_argument("paths", nargs="+", help="project folders or scene files")
+    parser.add_argument("--tex-dir", default=TEX_CACHE_DIR, help="manim tex_dir to fill (default: shared cache)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = precompile(args.paths, args.tex_dir)
+    print(f"{stats['formulas']} formulas: {stats['cached']} cached, {stats['compiled']} compiled, "
+          f"{stats['failed']} failed in {time.perf_counter() - start:.1f}s")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
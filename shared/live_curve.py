@@ -0,0 +1,57 @@
+"""Curves that are re-evaluated in place every frame instead of rebuilt.
+
+``always_redraw(lambda: ParametricFunction(...))`` allocates a new mobject and
+refits its beziers on every frame. ``LiveCurve`` samples a vectorized
+``func(u, t) -> (len(u), 3)`` on a fixed grid of ``u`` once per frame and
+writes anchors and Catmull-Rom handles straight into its existing point array.
+
+    t = ValueTracker(0)
+    wave = LiveCurve(lambda u, t: np.column_stack([u, np.sin(u - t), 0 * u]),
+                     u_range=(-4, 4), samples=81, time=t, color=TECH_CYAN)
+    self.add(wave)
+    self.play(t.animate.set_value(4 * PI), run_time=6, rate_func=linear)
+"""
+
+import numpy as np
+from manim import VMobject
+
+
+def axes_map(axes):
+    """Vectorized ``c2p`` of a (linear, unmoved) Axes/ThreeDAxes: ``(N, 3)`` coords -> points."""
+    origin = np.asarray(axes.c2p(0, 0, 0), dtype=float)
+    basis = np.array([axes.c2p(*e) for e in np.eye(3)], dtype=float) - origin
+    return lambda coords: origin + np.asarray(coords, dtype=float) @ basis
+
+
+class LiveCurve(VMobject):
+    """A smooth curve through ``func(u, t)`` on a fixed ``u`` grid, updated in place."""
+
+    def __init__(self, func, u_range=(0.0, 1.0), samples: int = 81, time=None, coords=None, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.u = np.linspace(*u_range, samples)
+        self.time = time
+        self.coords = coords      # optional (N, 3) coords -> scene points, e.g. axes_map(axes)
+        self.refresh()
+        if time is not None:
+            self.add_updater(lambda m: m.refresh())
+
+    def refresh(self, t: float = None):
+        if t is None:
+            t = self.time.get_value() if self.time is not None else 0.0
+        anchors = np.asarray(self.func(self.u, t), dtype=float)
+        if self.coords is not None:
+            anchors = self.coords(anchors)
+        # Catmull-Rom tangents (one-sided at the ends) give the bezier handles.
+        padded = np.concatenate([2 * anchors[:1] - anchors[1:2], anchors, 2 * anchors[-1:] - anchors[-2:-1]])
+        tangents = (padded[2:] - padded[:-2]) / 6
+
+        n = len(anchors) - 1
+        if len(self.points) != 4 * n:
+            self.set_points(np.empty((4 * n, 3)))
+        points = self.points
+        points[0::4] = anchors[:-1]
+        points[1::4] = anchors[:-1] + tangents[:-1]
+        points[2::4] = anchors[1:] - tangents[1:]
+        points[3::4] = anchors[1:]
+        return self
@@ -0,0 +1,155 @@
+"""Level of detail for ``Surface`` meshes: tessellation picked from on-screen size.
+
+A hand-written ``resolution=(32, 16)`` is too fine for a 480p preview and too
+coarse for a 4K master. ``AdaptiveSurface`` measures how long its iso-curves
+are in output pixels -- through the camera's own projection, so camera
+distance, zoom and the render quality all count -- and picks the resolution
+that keeps faces about ``facet`` pixels across. Resolutions snap to a fixed
+ladder and only drop again once the surface has shrunk well below a rung, so
+a slow zoom re-tessellates a few times, not every frame.
+
+    self.set_camera_orientation(phi=70*DEGREES, theta=-45*DEGREES, distance=8)
+    dish = AdaptiveSurface(paraboloid, u_range=[0, TAU], v_range=[0, 1.2])
+    dish.set_color(TECH_CYAN).rotate(PI/2, axis=RIGHT)
+    dish.track_camera(self.camera)        # pick now, re-pick whenever the zoom crosses a rung
+"""
+
+import numpy as np
+from manim import ORIGIN, Surface, VGroup, VMobject, config
+
+# Allowed face counts along u and v.
+LADDER = (4, 6, 8, 12, 16, 24, 32, 48, 64, 96, 128)
+
+
+def snap(n: float, low: int = LADDER[0], high: int = LADDER[-1]) -> int:
+    """Smallest ladder rung that is at least ``n``, clamped to ``[low, high]``."""
+    rung = next((r for r in LADDER if r >= n), LADDER[-1])
+    return int(min(max(rung, low), high))
+
+
+def pixels_per_unit(camera=None) -> float:
+    """Output pixels per scene unit at zoom 1 -- 60 for a 480p preview, 135 at 1080p, 270 at 4K."""
+    pixel_width = getattr(camera, "pixel_width", config.pixel_width)
+    frame_width = getattr(camera, "frame_width", config.frame_width)
+    return pixel_width / frame_width
+
+
+def screen_points(points: np.ndarray, camera=None) -> np.ndarray:
+    """``(N, 2)`` pixel positions of scene points, through a ThreeDCamera's projection when given."""
+    if hasattr(camera, "project_points"):
+        points = camera.project_points(points)
+    return points[:, :2] * pixels_per_unit(camera)
+
+
+class _Placement(VMobject):
+    """Invisible frame that carries a surface's placement: a local point and three short axis tips.
+
+    Being points in the surface's family, it is moved by everything that moves the faces --
+    ``shift``, ``rotate``, ``scale``, ``apply_matrix`` and the animations that interpolate points
+    directly. The tips are ``reach`` long so the frame stays inside the surface's bounding box.
+    Restyling is ignored once built, so a family-wide ``set_opacity`` cannot reveal it.
+    """
+
+    def __init__(self, local_origin, reach: float = 1e-3, **kwargs):
+        super().__init__(fill_opacity=0, stroke_width=0, **kwargs)
+        self.local_origin = np.asarray(local_origin, dtype=float)
+        self.reach = reach
+        self.points = self.local_origin + np.vstack([np.zeros(3), reach * np.eye(3)])
+        self.locked = True
+
+    def matrix(self) -> tuple:
+        """``(A, t)`` with ``placed = local @ A.T + t``."""
+        origin, tips = self.points[0], self.points[1:4]
+        linear = (tips - origin).T / self.reach
+        return linear, origin - linear @ self.local_origin
+
+    def set_fill(self, *args, **kwargs):
+        return self if getattr(self, "locked", False) else super().set_fill(*args, **kwargs)
+
+    def set_stroke(self, *args, **kwargs):
+        return self if getattr(self, "locked", False) else super().set_stroke(*args, **kwargs)
+
+
+class AdaptiveSurface(Surface):
+    """A ``Surface`` whose resolution follows its on-screen size."""
+
+    def __init__(self, func, u_range=(0, 1), v_range=(0, 1), facet: float = 40,
+                 min_resolution=(8, 4), max_resolution=(64, 32), hysteresis: float = 1.25, camera=None, **kwargs):
+        self.facet = facet
+        self.min_resolution = tuple(min_resolution)
+        self.max_resolution = tuple(max_resolution)
+        self.hysteresis = hysteresis
+        super().__init__(func, u_range=u_range, v_range=v_range, resolution=self.min_resolution, **kwargs)
+        # Measured on a fixed dense sample, so a pick does not depend on the current tessellation.
+        self._local_samples = self._samples_at(self.max_resolution)
+        lo, hi = self._local_samples.reshape(-1, 3).min(axis=0), self._local_samples.reshape(-1, 3).max(axis=0)
+        self.placement = _Placement((lo + hi) / 2)
+        self.add(self.placement)
+        if camera is not None:
+            self.update_lod(camera)
+
+    # ========================== MEASURING ==========================
+    def _samples_at(self, resolution) -> np.ndarray:
+        """Unplaced ``(u_res + 1, v_res + 1, 3)`` surface points on the uv grid, both ends included."""
+        u_res, v_res = resolution
+        u = np.linspace(*self.u_range, u_res + 1)
+        v = np.linspace(*self.v_range, v_res + 1)
+        return np.array([[self.func(ui, vj) for vj in v] for ui in u], dtype=float)
+
+    def _sample_grid(self) -> np.ndarray:
+        """Current positions of the dense sample grid."""
+        linear, offset = self.placement.matrix()
+        return self._local_samples @ linear.T + offset
+
+    def screen_lengths(self, camera=None) -> tuple:
+        """Longest on-screen length in pixels of a curve along u and of a curve along v."""
+        grid = self._sample_grid()
+        px = screen_points(grid.reshape(-1, 3), camera).reshape(*grid.shape[:2], 2)
+        along_u = np.linalg.norm(np.diff(px, axis=0), axis=-1).sum(axis=0)
+        along_v = np.linalg.norm(np.diff(px, axis=1), axis=-1).sum(axis=1)
+        return float(along_u.max()), float(along_v.max())
+
+    def _resolution_for(self, lengths) -> tuple:
+        """Ladder resolution for faces of about ``facet`` pixels on curves ``lengths`` pixels long."""
+        return tuple(snap(length / self.facet, low, high)
+                     for length, low, high in zip(lengths, self.min_resolution, self.max_resolution))
+
+    def target_resolution(self, camera=None, slack: float = 1.0) -> tuple:
+        """Ladder resolution for faces of about ``facet`` pixels; ``slack`` scales the measured size."""
+        return self._resolution_for(np.array(self.screen_lengths(camera)) * slack)
+
+    # ========================== RE-TESSELLATION ==========================
+    def update_lod(self, camera=None):
+        """Re-tessellate if the surface now needs a finer rung, or a coarser one with room to spare."""
+        lengths = np.array(self.screen_lengths(camera))
+        finer = self._resolution_for(lengths)
+        coarser = self._resolution_for(lengths * self.hysteresis)
+        current = tuple(self.resolution)
+        wanted = tuple(f if f > r else min(c, r) for f, c, r in zip(finer, coarser, current))
+        if wanted != current:
+            self.retessellate(wanted)
+        return self
+
+    def retessellate(self, resolution):
+        """Rebuild the faces at ``resolution``, keeping the current placement and per-face styles."""
+        old_faces = list(self.list_of_faces)
+        old_res = self.resolution
+        linear, offset = self.placement.matrix()
+
+        self.remove(*old_faces)
+        self.resolution = tuple(resolution)
+        self._setup_in_uv_space()
+        # Map and place the new faces only; the placement frame is already where it belongs.
+        faces = VGroup(*self.list_of_faces)
+        faces.apply_function(lambda p: self.func(p[0], p[1]))
+        faces.apply_points_function_about_point(lambda p: p @ linear.T + offset, about_point=ORIGIN)
+        for face in self.list_of_faces:
+            i = face.u_index * old_res[0] // self.resolution[0]
+            j = face.v_index * old_res[1] // self.resolution[1]
+            face.match_style(old_faces[i * old_res[1] + j])
+        return self
+
+    def track_camera(self, camera):
+        """Pick the resolution for ``camera`` now and keep it in step while the camera zooms."""
+        self.update_lod(camera)
+        return self.add_updater(lambda m: m.update_lod(camera))
@@ -0,0 +1,30 @@
+"""Small ffprobe helpers shared by the timing layer and the episode assembler."""
+
+import json
+import os
+import subprocess
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _probe(path: str, mtime: float, size: int) -> dict:
+    output = subprocess.run(
+        ["ffprobe", "-v", "error", "-print_format", "json", "-show_format", "-show_streams",
+         "-show_data_hash", "sha256", path],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def probe(path: str) -> dict:
+    """Return ffprobe's format/stream info for ``path`` (memoized until the file changes).
+
+    Streams carry an ``extradata_hash`` (codec headers such as H.264 SPS/PPS) when they have any.
+    """
+    stat = os.stat(path)
+    return _probe(os.path.abspath(path), stat.st_mtime, stat.st_size)
+
+
+def probe_duration(path: str) -> float:
+    """Duration of an audio or video file in seconds."""
+    return float(probe(path)["format"]["duration"])
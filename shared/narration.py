@@ -0,0 +1,112 @@
+"""Narration library shared by every project's voice.py.
+
+A voice.py only declares its text and voice and hands them over:
+
+    from shared.narration import narrate
+
+    async def generate_voiceover():
+        await narrate(SCRIPTS, VOICE)                      # -> voiceovers/<Part>.mp3
+
+    async def generate_audio():
+        await narrate(SCRIPT, VOICE, output_file=OUTPUT_FILE)  # single-file shorts
+
+Output layout, the audio cache, concurrency, retries and progress reporting all
+live here. It can also be run directly against any voice.py:
+
+    python -m shared.narration kalman/voice.py -c 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from shared.tts import (
+    DEFAULT_PITCH,
+    DEFAULT_RATE,
+    DEFAULT_VOICE,
+    EdgeTTSBackend,
+    HttpBackend,
+    synthesize_all,
+)
+from shared.tts_cache import TtsCache
+
+OUTPUT_DIR = "voiceovers"
+
+
+class _Progress:
+    def __init__(self, total: int):
+        self.total = total
+        self.done = 0
+
+    def __call__(self, result):
+        self.done += 1
+        prefix = f"[{self.done:>2}/{self.total}]"
+        if result.cached:
+            print(f"{prefix} {result.part:<12} cached")
+        elif result.ok:
+            print(f"{prefix} {result.part:<12} {result.seconds:6.2f}s  ({result.attempts} attempt(s))")
+        else:
+            print(f"{prefix} {result.part:<12} FAILED after {result.attempts} attempt(s): {result.error}")
+
+
+async def narrate(scripts, voice: str = DEFAULT_VOICE, output_dir: str = OUTPUT_DIR, output_file: str = None,
+                  concurrency: int = 4, retries: int = 3, rate: str = DEFAULT_RATE, pitch: str = DEFAULT_PITCH,
+                  backend=None, use_cache: bool = True) -> list:
+    """Synthesize a ``SCRIPTS`` dict into ``output_dir/<part>.mp3``, or a single ``SCRIPT`` into ``output_file``.
+
+    Returns the per-part ``PartResult`` list from ``shared.tts.synthesize_all``.
+    """
+    if isinstance(scripts, str):
+        output_file = output_file or "narration.mp3"
+        output_dir = os.path.dirname(output_file) or "."
+        scripts = {os.path.splitext(os.path.basename(output_file))[0]: scripts}
+
+    print(f"--- Generating Voiceover: {voice} ({len(scripts)} part(s)) ---")
+    start = time.perf_counter()
+    results = await synthesize_all(
+        scripts, output_dir, voice, backend or EdgeTTSBackend(), concurrency, retries,
+        rate=rate, pitch=pitch, on_result=_Progress(len(scripts)),
+        cache=TtsCache() if use_cache else None,
+    )
+
+    failed = [r.part for r in results if not r.ok]
+    cached = sum(r.cached for r in results)
+    print(f"\n--- DONE in {time.perf_counter() - start:.1f}s: "
+          f"{len(results) - len(failed)} ok ({cached} from cache), {len(failed)} failed ---")
+    if failed:
+        print("Failed parts: " + ", ".join(failed))
+    print(f"Check '{output_file or output_dir}'.")
+    return results
+
+
+def main(argv=None) -> int:
+    from shared.render import load_module
+
+    parser = argparse.ArgumentParser(description="Generate the narration of a project's voice.py.")
+    parser.add_argument("module", help="voice script, e.g. kalman/voice.py")
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--server", help="URL of a local TTS server to use instead of Edge TTS")
+    parser.add_argument("--no-cache", action="store_true", help="always call the TTS service")
+    args = parser.parse_args(argv)
+
+    module = load_module(args.module)
+    project_dir = os.path.dirname(os.path.abspath(args.module))
+    if hasattr(module, "SCRIPTS"):
+        scripts, output_file = module.SCRIPTS, None
+    else:
+        scripts = module.SCRIPT
+        output_file = os.path.join(project_dir, getattr(module, "OUTPUT_FILE", "narration.mp3"))
+
+    results = asyncio.run(narrate(
+        scripts, getattr(module, "VOICE", DEFAULT_VOICE), os.path.join(project_dir, OUTPUT_DIR), output_file,
+        args.concurrency, args.retries, backend=HttpBackend(args.server) if args.server else None,
+        use_cache=not args.no_cache,
+    ))
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
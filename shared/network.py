@@ -0,0 +1,170 @@
+"""Array-backed network diagrams: thousands of edges in a handful of paths.
+
+One ``Line`` per edge costs a full VMobject (and a stroke draw) per edge, and a
+forward pass built from ``.animate.set_fill`` calls interpolates every node on
+its own. Here the edges live in one ``(E, 2, 3)`` segment array and the nodes in
+a ``PointCloud``. Each edge and node carries an activation in 0..1 that picks
+its colour, width and opacity; edges are drawn as one multi-subpath path per
+activation level. A forward pulse is a single animation that rewrites the
+activation arrays in place every frame. Like ``PointCloud``, both parts read
+their geometry back from the paths on every refresh, so a diagram inside a
+moved group keeps up.
+
+    net = NetworkDiagram([12, 24, 32, 24, 12], layer_spacing=2, node_spacing=0.14)
+    self.play(Create(net.edges), run_time=2)
+    self.play(RevealPoints(net.nodes, lag_ratio=0.01, scale=0.2), run_time=2)
+    self.play(ForwardPulse(net), run_time=2.2)
+"""
+
+import numpy as np
+from manim import GREY, ORIGIN, WHITE, Animation, VGroup, VMobject, color_to_rgb, linear, rgb_to_color
+
+from shared.point_cloud import PointCloud
+
+# Control points of a straight segment as a cubic bezier.
+_THIRDS = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+
+
+def _lerp(a, b, t):
+    return a + (b - a) * t
+
+
+# ========================== EDGES ==========================
+class EdgeBundle(VGroup):
+    """Line segments stored as one ``(E, 2, 3)`` array and drawn as one path per activation level."""
+
+    segments = None
+
+    def __init__(self, segments, color=GREY, active_color=WHITE, stroke_width: float = 0.5,
+                 active_width: float = None, opacity: float = 1.0, active_opacity: float = 1.0,
+                 levels: int = 8, **kwargs):
+        super().__init__(**kwargs)
+        segments = np.asarray(segments, dtype=float)
+        self.segments = np.zeros(segments.shape[:2] + (3,))
+        self.segments[..., :segments.shape[-1]] = segments
+        self.activation = np.zeros(len(segments))
+        self.rgb = np.asarray(color_to_rgb(color), dtype=float)
+        self.active_rgb = np.asarray(color_to_rgb(active_color), dtype=float)
+        self.widths = (stroke_width, 3 * stroke_width if active_width is None else active_width)
+        self.opacity_range = (opacity, active_opacity)
+        self.levels = levels
+        self.refresh()
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.segments)
+
+    def pull(self):
+        """Read the segments back from the paths, picking up moves made through a parent group."""
+        for bucket in self.submobjects:
+            idx = getattr(bucket, "edge_index", None)
+            if idx is None or len(bucket.points) != 4 * len(idx):
+                continue
+            points = bucket.points.reshape(-1, 4, 3)
+            self.segments[idx, 0], self.segments[idx, 1] = points[:, 0], points[:, 3]
+        return self
+
+    def refresh(self):
+        """Regroup the segments by quantized activation; brighter levels are drawn on top."""
+        self.pull()
+        top = self.levels - 1
+        level = np.round(np.clip(self.activation, 0, 1) * top).astype(np.int64)
+        used = np.unique(level)
+        buckets = list(self.submobjects[:len(used)])
+        while len(buckets) < len(used):
+            buckets.append(VMobject(fill_opacity=0))
+        for bucket, lv in zip(buckets, used):
+            bucket.edge_index = np.flatnonzero(level == lv)
+            a, b = self.segments[bucket.edge_index, 0], self.segments[bucket.edge_index, 1]
+            bucket.set_points((a[:, None] + (b - a)[:, None] * _THIRDS).reshape(-1, 3))
+            t = lv / top if top else 0.0
+            bucket.set_stroke(rgb_to_color(_lerp(self.rgb, self.active_rgb, t)), width=_lerp(*self.widths, t),
+                              opacity=_lerp(*self.opacity_range, t))
+        self.submobjects = buckets
+        return self
+
+    def set_activation(self, activation):
+        self.activation[:] = activation
+        return self.refresh()
+
+    # ========================== VGROUP INTEROP ==========================
+    # Reading the segments straight back keeps them in step with the moved paths.
+    def shift(self, *vectors):
+        super().shift(*vectors)
+        return self.pull() if self.segments is not None else self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        super().apply_points_function_about_point(func, about_point=about_point, about_edge=about_edge)
+        return self.pull() if self.segments is not None else self
+
+    def interpolate(self, mobject1, mobject2, alpha: float, *args, **kwargs):
+        if (isinstance(mobject1, EdgeBundle) and isinstance(mobject2, EdgeBundle)
+                and mobject1.n_edges == mobject2.n_edges == self.n_edges):
+            self.segments = _lerp(mobject1.segments, mobject2.segments, alpha)
+            self.activation = _lerp(mobject1.activation, mobject2.activation, alpha)
+        return super().interpolate(mobject1, mobject2, alpha, *args, **kwargs)
+
+
+# ========================== NETWORK ==========================
+class NetworkDiagram(VGroup):
+    """Fully connected layers: a ``PointCloud`` of nodes over an ``EdgeBundle`` of every inter-layer edge."""
+
+    def __init__(self, layer_sizes, layer_spacing: float = 2.0, node_spacing: float = 0.6,
+                 node_radius: float = 0.15, node_color=WHITE, active_node_color=WHITE, node_opacity: float = 0.8,
+                 edge_color=GREY, active_edge_color=WHITE, edge_width: float = 0.5, edge_opacity: float = 1.0,
+                 center=ORIGIN, **kwargs):
+        super().__init__(**kwargs)
+        sizes = np.asarray(layer_sizes, dtype=np.int64)
+        starts = np.cumsum(sizes) - sizes
+        self.node_layer = np.repeat(np.arange(len(sizes)), sizes)         # layer of every node
+        rank = np.arange(sizes.sum()) - starts[self.node_layer]            # position inside its layer
+        positions = np.zeros((sizes.sum(), 3))
+        positions[:, 0] = (self.node_layer - (len(sizes) - 1) / 2) * layer_spacing
+        positions[:, 1] = ((sizes[self.node_layer] - 1) / 2 - rank) * node_spacing
+        positions += np.asarray(center, dtype=float)
+
+        # Every node of layer i to every node of layer i + 1.
+        pairs = [
+            np.stack(np.meshgrid(np.arange(s0, s0 + n0), np.arange(s1, s1 + n1), indexing="ij"), axis=-1).reshape(-1, 2)
+            for s0, n0, s1, n1 in zip(starts[:-1], sizes[:-1], starts[1:], sizes[1:])
+        ]
+        self.edge_index = np.concatenate(pairs) if pairs else np.zeros((0, 2), dtype=np.int64)
+
+        self.node_rgb = np.asarray(color_to_rgb(node_color), dtype=float)
+        self.active_node_rgb = np.asarray(color_to_rgb(active_node_color), dtype=float)
+        self.node_opacity = node_opacity
+        self.edges = EdgeBundle(positions[self.edge_index], color=edge_color, active_color=active_edge_color,
+                                stroke_width=edge_width, opacity=edge_opacity)
+        self.nodes = PointCloud(positions, radius=node_radius, color=node_color, opacity=node_opacity)
+        self.add(self.edges, self.nodes)
+
+    @property
+    def n_layers(self) -> int:
+        return int(self.node_layer.max()) + 1 if len(self.node_layer) else 0
+
+    def set_activations(self, nodes, edges=None):
+        """Activation (0..1) per node and per edge; edges default to the product of their two nodes."""
+        nodes = np.broadcast_to(np.asarray(nodes, dtype=float), self.node_layer.shape)[:, None]
+        if edges is None:
+            edges = nodes[self.edge_index[:, 0], 0] * nodes[self.edge_index[:, 1], 0]
+        self.nodes.rgbs[:] = _lerp(self.node_rgb, self.active_node_rgb, nodes)
+        self.nodes.opacities[:] = _lerp(self.node_opacity, 1.0, nodes[:, 0])
+        self.nodes.refresh()
+        self.edges.set_activation(edges)
+        return self
+
+
+# ========================== ANIMATIONS ==========================
+class ForwardPulse(Animation):
+    """A wave of activation travelling from the first layer to the last, ``width`` layers wide."""
+
+    def __init__(self, network: NetworkDiagram, width: float = 1.0, rate_func=linear, **kwargs):
+        self.width = width
+        super().__init__(network, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha: float):
+        net = self.mobject
+        front = -self.width + self.rate_func(alpha) * (net.n_layers - 1 + 2 * self.width)
+        nodes = np.clip(1 - np.abs(front - net.node_layer) / self.width, 0, 1)
+        edges = np.clip(1 - np.abs(front - net.node_layer[net.edge_index[:, 0]] - 0.5) / self.width, 0, 1)
+        net.set_activations(nodes, edges)
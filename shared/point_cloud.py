@@ -0,0 +1,285 @@
+"""Array-backed point clouds: thousands of dots for the price of a handful of VMobjects.
+
+A ``VGroup`` of ``Dot``s carries one full VMobject (bezier points, style arrays,
+updater lists) per dot and costs one fill per dot every frame. ``PointCloud``
+keeps positions, radii, colours and opacities as NumPy arrays instead and draws
+them as a few "bucket" VMobjects: all dots that share a colour and (quantized)
+opacity become circle subpaths of one path, which the renderer fills in a single
+draw.
+
+    clutter = PointCloud(xy, radius=sizes, color=NEON_PINK, opacity=alphas)
+    self.play(RevealPoints(clutter, lag_ratio=0.02, scale=0.3))
+    self.play(clutter.animate.set_opacity(0.05))
+    self.play(ShiftPointColors(clutter, TECH_CYAN, lag_ratio=0.5))
+
+Per-point changes go through ``set_positions`` / ``set_radii`` / ``set_colors``
+/ ``set_opacities`` or the animations below; moving, scaling, ``set_opacity``,
+``set_color``, ``FadeIn`` / ``FadeOut`` and ``.animate`` work as on any VGroup.
+The bucket paths are the source of truth for where the dots are: manim moves a
+group's members without asking them, so every refresh first reads positions and
+radii back from the paths (points that are not drawn ride along in an invisible
+anchor path), and a cloud inside a moved or rotated group stays where it was put.
+In a ThreeDScene, ``cloud.add_updater(lambda m: m.face_camera(self.camera))``
+keeps the dots round from every camera angle.
+"""
+
+import numpy as np
+from manim import DEFAULT_DOT_RADIUS, WHITE, Animation, VGroup, VMobject, color_to_rgb, rgb_to_color
+
+# Eight cubic arcs, like manim's Circle, with the standard handle length for an arc of 2*pi/8.
+_ARCS = 8
+_HANDLE = 4 / 3 * np.tan(np.pi / (4 * _ARCS))
+
+
+def _unit_circle() -> np.ndarray:
+    """Bezier control points of a unit circle, shape ``(4 * _ARCS, 3)``."""
+    angles = np.linspace(0, 2 * np.pi, _ARCS + 1)
+    start, end = angles[:-1], angles[1:]
+    anchors_a = np.stack([np.cos(start), np.sin(start)], axis=1)
+    anchors_b = np.stack([np.cos(end), np.sin(end)], axis=1)
+    tangent_a = np.stack([-np.sin(start), np.cos(start)], axis=1)
+    tangent_b = np.stack([-np.sin(end), np.cos(end)], axis=1)
+    curves = np.stack([anchors_a, anchors_a + _HANDLE * tangent_a, anchors_b - _HANDLE * tangent_b, anchors_b], axis=1)
+    return np.concatenate([curves, np.zeros(curves.shape[:2] + (1,))], axis=2).reshape(-1, 3)
+
+
+UNIT_CIRCLE = _unit_circle()
+
+
+def _broadcast(value, n: int) -> np.ndarray:
+    return np.broadcast_to(np.asarray(value, dtype=float), (n,)).copy()
+
+
+def _rgbs(color, n: int) -> np.ndarray:
+    if isinstance(color, np.ndarray) and color.ndim == 2:
+        return color.astype(float).copy()
+    # One colour per point unless it is a bare RGB triple of numbers.
+    if isinstance(color, (list, tuple)) and color and not isinstance(color[0], (int, float, np.number)):
+        if len(color) != n:
+            raise ValueError(f"Got {len(color)} colors for {n} points")
+        return np.array([color_to_rgb(c) for c in color], dtype=float)
+    return np.tile(np.asarray(color_to_rgb(color), dtype=float), (n, 1))
+
+
+def lagged_alpha(alpha: float, n: int, lag_ratio: float) -> np.ndarray:
+    """Per-point progress of a LaggedStart over ``n`` points, as one array."""
+    if n == 0:
+        return np.zeros(0)
+    span = 1 + (n - 1) * lag_ratio
+    starts = np.arange(n) * lag_ratio / span
+    return np.clip((alpha - starts) * span, 0.0, 1.0)
+
+
+class _Anchors(VMobject):
+    """Invisible path that carries the points not drawn: a centre and a rim point each.
+
+    Restyling is ignored once built, so a family-wide ``set_opacity`` cannot reveal it.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(fill_opacity=0, stroke_width=0, **kwargs)
+        self.locked = True
+
+    def set_fill(self, *args, **kwargs):
+        return self if getattr(self, "locked", False) else super().set_fill(*args, **kwargs)
+
+    def set_stroke(self, *args, **kwargs):
+        return self if getattr(self, "locked", False) else super().set_stroke(*args, **kwargs)
+
+
+class PointCloud(VGroup):
+    """Dots stored as arrays and drawn as one path per colour/opacity bucket."""
+
+    positions = None
+
+    def __init__(self, positions, radius=DEFAULT_DOT_RADIUS, color=WHITE, opacity=1.0,
+                 opacity_levels: int = 16, **kwargs):
+        super().__init__(**kwargs)
+        positions = np.asarray(positions, dtype=float).reshape(-1, np.shape(positions)[-1])
+        n = len(positions)
+        self.positions = np.zeros((n, 3))
+        self.positions[:, :positions.shape[1]] = positions
+        self.radii = _broadcast(radius, n)
+        self.rgbs = _rgbs(color, n)
+        self.opacities = _broadcast(opacity, n)
+        self.opacity_levels = opacity_levels
+        # Transient per-point multipliers used by the reveal animations.
+        self.visibility = np.ones(n)
+        self.radius_scale = np.ones(n)
+        self.basis = np.eye(3)[:2]            # plane of the dot discs; see face_camera
+        self.refresh()
+
+    @property
+    def n_points(self) -> int:
+        return len(self.positions)
+
+    # ========================== BUCKETS ==========================
+    def pull(self):
+        """Read positions and radii back from the paths, picking up moves made through a parent group."""
+        for bucket in self.submobjects:
+            idx = getattr(bucket, "point_index", None)
+            if idx is None or not len(idx):
+                continue
+            if isinstance(bucket, _Anchors):
+                if len(bucket.points) != 4 * len(idx):
+                    continue
+                points = bucket.points.reshape(-1, 4, 3)
+                centers, radii = points[:, 0], np.linalg.norm(points[:, 1] - points[:, 0], axis=1)
+            else:
+                if len(bucket.points) != len(UNIT_CIRCLE) * len(idx):
+                    continue  # mid-Create or otherwise reshaped; keep the arrays
+                points = bucket.points.reshape(len(idx), -1, 3)
+                centers = points.mean(axis=1)
+                radii = np.linalg.norm(points[:, 0] - centers, axis=1) / self.radius_scale[idx]
+            self.positions[idx] = centers
+            self.radii[idx] = radii
+        return self
+
+    def refresh(self, pull: bool = True):
+        """Rebuild the bucket paths from the arrays (vectorized; no per-dot objects)."""
+        if pull:
+            self.pull()
+        levels = self.opacity_levels - 1
+        alpha = np.round(np.clip(self.opacities * self.visibility, 0, 1) * levels).astype(np.int64)
+        radii = self.radii * self.radius_scale
+        drawn = (alpha > 0) & (radii > 0)
+        shown, hidden = np.flatnonzero(drawn), np.flatnonzero(~drawn)
+
+        rgb8 = np.round(np.clip(self.rgbs[shown], 0, 1) * 255).astype(np.int64)
+        keys = ((rgb8[:, 0] << 16 | rgb8[:, 1] << 8 | rgb8[:, 2]) * (levels + 1)) + alpha[shown]
+        unique, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique) + 1))
+
+        circle = UNIT_CIRCLE[:, :2] @ self.basis
+        buckets = [b for b in self.submobjects if not isinstance(b, _Anchors)][:len(unique)]
+        while len(buckets) < len(unique):
+            buckets.append(VMobject(stroke_width=0))
+        for bucket, key, lo, hi in zip(buckets, unique, bounds[:-1], bounds[1:]):
+            idx = shown[order[lo:hi]]
+            points = self.positions[idx, None, :] + radii[idx, None, None] * circle[None]
+            bucket.set_points(points.reshape(-1, 3))
+            bucket.point_index = idx
+            color = int(key // (levels + 1))
+            rgb = np.array([color >> 16, (color >> 8) & 255, color & 255]) / 255
+            bucket.set_fill(rgb_to_color(rgb), opacity=(key % (levels + 1)) / levels)
+            bucket.set_stroke(width=0)
+        if len(hidden):
+            anchors = next((b for b in self.submobjects if isinstance(b, _Anchors)), None) or _Anchors()
+            centers = self.positions[hidden]
+            rims = centers + self.radii[hidden, None] * self.basis[0]
+            anchors.set_points(np.stack([centers, rims, centers, centers], axis=1).reshape(-1, 3))
+            anchors.point_index = hidden
+            buckets.append(anchors)
+        self.submobjects = buckets
+        return self
+
+    def face_camera(self, camera):
+        """Turn the discs towards a ThreeDCamera; use as an updater while the camera moves."""
+        self.basis = camera.generate_rotation_matrix()[:2]
+        return self.refresh()
+
+    # ========================== PER-POINT DATA ==========================
+    # The setters pull first so an earlier group move is not undone, then write the arrays.
+    def set_positions(self, positions):
+        positions = np.asarray(positions, dtype=float)
+        self.pull()
+        self.positions[:, :positions.shape[1]] = positions
+        return self.refresh(pull=False)
+
+    def set_radii(self, radii):
+        self.pull()
+        self.radii = _broadcast(radii, self.n_points)
+        return self.refresh(pull=False)
+
+    def set_colors(self, colors):
+        self.rgbs = _rgbs(colors, self.n_points)
+        return self.refresh()
+
+    def set_opacities(self, opacities):
+        self.opacities = _broadcast(opacities, self.n_points)
+        return self.refresh()
+
+    # ========================== VGROUP INTEROP ==========================
+    # The buckets are moved / restyled like any VGroup; reading the arrays straight back
+    # keeps them in step without regrouping, so ``.animate`` targets keep the same buckets.
+    def shift(self, *vectors):
+        super().shift(*vectors)
+        return self.pull() if self.positions is not None else self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        super().apply_points_function_about_point(func, about_point=about_point, about_edge=about_edge)
+        return self.pull() if self.positions is not None else self
+
+    # Style changes only touch the arrays when they reach every bucket (family=True);
+    # VMobject init and ``fade`` restyle the empty root on its own.
+    def set_color(self, color=WHITE, family: bool = True, **kwargs):
+        super().set_color(color, family=family, **kwargs)
+        if family and self.positions is not None:
+            self.rgbs = _rgbs(color, self.n_points)
+        return self
+
+    def set_fill(self, color=None, opacity=None, family: bool = True, **kwargs):
+        super().set_fill(color, opacity, family=family, **kwargs)
+        if family and self.positions is not None:
+            if color is not None:
+                self.rgbs = _rgbs(color, self.n_points)
+            if opacity is not None:
+                self.opacities[:] = opacity
+        return self
+
+    def interpolate(self, mobject1, mobject2, alpha: float, *args, **kwargs):
+        # Only the arrays: the buckets themselves are interpolated as family members.
+        if (isinstance(mobject1, PointCloud) and isinstance(mobject2, PointCloud)
+                and mobject1.n_points == mobject2.n_points == self.n_points):
+            for name in ("positions", "radii", "rgbs", "opacities"):
+                start, end = getattr(mobject1, name), getattr(mobject2, name)
+                setattr(self, name, start + (end - start) * alpha)
+        return super().interpolate(mobject1, mobject2, alpha, *args, **kwargs)
+
+
+# ========================== ANIMATIONS ==========================
+class RevealPoints(Animation):
+    """Fade (and optionally grow) the points in one after another, like a LaggedStart of FadeIns."""
+
+    def __init__(self, cloud: PointCloud, lag_ratio: float = 0.02, scale: float = 1.0, **kwargs):
+        self.point_lag_ratio = lag_ratio
+        self.start_scale = scale
+        super().__init__(cloud, **kwargs)
+
+    def begin(self):
+        self.mobject.visibility[:] = 0
+        self.mobject.refresh()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        cloud = self.mobject
+        progress = lagged_alpha(self.rate_func(alpha), cloud.n_points, self.point_lag_ratio)
+        cloud.visibility = progress
+        cloud.radius_scale = self.start_scale + (1 - self.start_scale) * progress
+        cloud.refresh()
+
+
+class FadeInPoints(RevealPoints):
+    """All points at once."""
+
+    def __init__(self, cloud: PointCloud, scale: float = 1.0, **kwargs):
+        super().__init__(cloud, lag_ratio=0.0, scale=scale, **kwargs)
+
+
+class ShiftPointColors(Animation):
+    """Blend every point towards ``color`` (one colour or one per point), optionally lagged."""
+
+    def __init__(self, cloud: PointCloud, color, lag_ratio: float = 0.0, **kwargs):
+        self.target_rgbs = _rgbs(color, cloud.n_points)
+        self.point_lag_ratio = lag_ratio
+        super().__init__(cloud, **kwargs)
+
+    def begin(self):
+        self.start_rgbs = self.mobject.rgbs.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        progress = lagged_alpha(self.rate_func(alpha), self.mobject.n_points, self.point_lag_ratio)[:, None]
+        self.mobject.rgbs = self.start_rgbs + (self.target_rgbs - self.start_rgbs) * progress
+        self.mobject.refresh()
@@ -0,0 +1,203 @@
+"""Raster PPI (plan position indicator) radar scope.
+
+Instead of a VGroup of range-ring Circles and one Dot per return, ``PPIDisplay``
+is a single ``ImageMobject`` whose pixels are recomputed each frame with array
+operations only:
+
+* the graticule (outline, range rings, bearing lines, centre) is rasterized once
+  per size/layout and cached for every display that shares it;
+* returns are splatted once into per-layer strength maps ("targets", "clutter",
+  ...), so tens of thousands of returns cost nothing per frame;
+* every frame the phosphor intensity decays by ``exp(-dt / persistence)`` and the
+  sector swept since the last frame is repainted from the strength maps.
+
+    ppi = PPIDisplay(radius=2.5, rings=[0.5, 1, 1.5, 2, 2.5], ring_units="scene")
+    ppi.add_returns("clutter", xy, strength)      # or ppi.set_polar("clutter", beams_by_range)
+    ppi.add_updater(lambda m, dt: m.set_polar("video", live_map, beams=just_swept))   # a live scan
+    self.add(ppi.start_sweep())
+    self.play(ppi.gain("clutter").animate.set_value(0.05), run_time=2)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from manim import ImageMobject, ValueTracker, color_to_rgb
+
+TECH_CYAN = "#00F0FF"
+GRID_NAVY = "#1E2A45"
+RING_UNITS = ("fraction", "scene")
+
+
+@lru_cache(maxsize=8)
+def _polar_grid(resolution: int):
+    """Per-pixel radius (0..1 at the rim) and bearing (radians, CCW from +x), shared by all displays."""
+    axis = np.linspace(-1, 1, resolution)
+    x, y = np.meshgrid(axis, -axis)
+    return np.hypot(x, y), np.arctan2(y, x) % (2 * np.pi)
+
+
+@lru_cache(maxsize=8)
+def _graticule(resolution: int, rings: tuple, bearing_step: float, line_px: float) -> tuple:
+    """Anti-aliased masks (0..1) of outline, rings + bearings and centre dot; rasterized once."""
+    r, theta = _polar_grid(resolution)
+    px = 2 / resolution                    # one pixel in normalized units
+    half = line_px * px / 2
+
+    def line(distance, width=half):
+        return np.clip(1 - (np.abs(distance) - width) / px, 0, 1)
+
+    outline = line(r - 1 + half * 2, half * 2)
+    grid = np.zeros_like(r)
+    for ring in rings:
+        grid = np.maximum(grid, line(r - ring))
+    if bearing_step:
+        for bearing in np.radians(np.arange(0, 360, bearing_step)):
+            along = np.cos(theta - bearing) * r
+            grid = np.maximum(grid, line(np.sin(theta - bearing) * r) * (along > 0))
+    centre = line(r, 3 * half)
+    inside = np.clip((1 - r) / px, 0, 1)
+    return outline * inside, grid * inside, centre, inside
+
+
+@lru_cache(maxsize=8)
+def _polar_lookup(resolution: int, beams: int, bins: int):
+    """Beam and range-bin index of every pixel, for painting ``(beams, bins)`` polar maps."""
+    r, theta = _polar_grid(resolution)
+    beam = (theta * beams / (2 * np.pi)).astype(int) % beams
+    return beam, np.minimum((r * bins).astype(int), bins - 1)
+
+
+@lru_cache(maxsize=8)
+def _beam_pixels(resolution: int, beams: int, bins: int):
+    """Flat pixel indices grouped by beam: beam ``b`` owns ``order[starts[b]:starts[b + 1]]``."""
+    beam, _ = _polar_lookup(resolution, beams, bins)
+    order = np.argsort(beam, axis=None, kind="stable")
+    return order, np.searchsorted(beam.ravel()[order], np.arange(beams + 1))
+
+
+class PPIDisplay(ImageMobject):
+    """A radar scope image with a rotating sweep and decaying phosphor afterglow."""
+
+    def __init__(self, radius: float = 2.5, resolution: int = 512, rings=(0.2, 0.4, 0.6, 0.8, 1.0),
+                 bearing_step: float = 30, color=TECH_CYAN, grid_color=GRID_NAVY, sweep_period: float = 4.0,
+                 persistence: float = 2.0, beam_trail: float = 0.5, ring_units: str = "fraction", **kwargs):
+        """``rings`` are fractions of ``radius`` by default, or scene units with ``ring_units="scene"``."""
+        if ring_units not in RING_UNITS:
+            raise ValueError(f"ring_units must be one of {RING_UNITS}, got {ring_units!r}")
+        self.radius = radius
+        self.resolution = resolution
+        rings = tuple(float(x) / (radius if ring_units == "scene" else 1) for x in rings)
+        self.outline, self.grid, self.centre, self.inside = _graticule(resolution, rings, bearing_step, 1.5)
+        self.r, self.theta = _polar_grid(resolution)
+        self.phosphor = np.asarray(color_to_rgb(color), dtype=float)
+        self.grid_rgb = np.asarray(color_to_rgb(grid_color), dtype=float)
+        self.sweep_rate = 2 * np.pi / sweep_period
+        self.persistence = persistence
+        self.beam_trail = beam_trail           # radians of visible beam glow behind the sweep
+        self.sweep_angle = np.pi / 2
+        self.layers = {}                       # name -> strength map
+        self.glow = {}                         # name -> phosphor intensity painted from that layer
+        self.gains = {}                        # name -> ValueTracker
+        super().__init__(self._compose(), **kwargs)
+        self.scale_to_fit_height(2 * radius)
+
+    # ========================== RETURNS ==========================
+    def _pixels(self, xy: np.ndarray):
+        xy = np.asarray(xy, dtype=float)[:, :2] / self.radius
+        cols = (xy[:, 0] + 1) / 2 * (self.resolution - 1)
+        rows = (1 - xy[:, 1]) / 2 * (self.resolution - 1)
+        return rows, cols
+
+    def add_returns(self, layer: str, xy, strength=1.0, blob: float = 1.5):
+        """Splat returns (scene units, relative to the display centre) into a strength layer.
+
+        ``blob`` is the Gaussian sigma in pixels (one value or one per return); all returns are
+        splatted together in a few ``np.add.at`` passes.
+        """
+        rows, cols = self._pixels(xy)
+        strength = np.broadcast_to(np.asarray(strength, dtype=float), rows.shape)
+        blob = np.broadcast_to(np.asarray(blob, dtype=float), rows.shape)
+        target = self.layers.setdefault(layer, np.zeros((self.resolution, self.resolution)))
+        reach = int(np.ceil(2 * blob.max())) if len(blob) else 0
+        base_r, base_c = np.round(rows).astype(int), np.round(cols).astype(int)
+        for dr in range(-reach, reach + 1):
+            for dc in range(-reach, reach + 1):
+                rr, cc = base_r + dr, base_c + dc
+                weight = np.exp(-((rr - rows) ** 2 + (cc - cols) ** 2) / (2 * blob ** 2))
+                ok = (rr >= 0) & (rr < self.resolution) & (cc >= 0) & (cc < self.resolution)
+                np.add.at(target, (rr[ok], cc[ok]), strength[ok] * weight[ok])
+        np.clip(target, 0, 1, out=target)
+        return self._prime(layer)
+
+    def set_polar(self, layer: str, image, beams=None):
+        """Replace a layer with a ``(beams, range_bins)`` map of 0..1 (beam 0 at +x, CCW; bins out to the rim).
+
+        With ``beams`` only the pixels of those beams are rewritten, and nothing glows until the sweep
+        passes over them -- for feeding a scan in as it is swept.
+        """
+        image = np.asarray(image, dtype=float)
+        beam, rbin = _polar_lookup(self.resolution, *image.shape)
+        if beams is None or layer not in self.layers:
+            self.layers[layer] = np.clip(image[beam, rbin], 0, 1) * self.inside
+            return self._prime(layer)
+        order, starts = _beam_pixels(self.resolution, *image.shape)
+        pixels = np.concatenate([order[starts[b]:starts[b + 1]] for b in np.atleast_1d(beams)] + [order[:0]])
+        flat = self.layers[layer].reshape(-1)
+        flat[pixels] = np.clip(image[beam.flat[pixels], rbin.flat[pixels]], 0, 1) * self.inside.flat[pixels]
+        return self
+
+    def _prime(self, layer: str):
+        self.gain(layer)
+        # Returns already swept over this revolution glow as if painted at their sweep time.
+        age = ((self.sweep_angle - self.theta) % (2 * np.pi)) / self.sweep_rate
+        self.glow[layer] = np.maximum(self.glow.get(layer, 0), self.layers[layer] * np.exp(-age / self.persistence))
+        return self.refresh()
+
+    def gain(self, layer: str) -> ValueTracker:
+        """Brightness multiplier of a layer; animate it to fade clutter in or out."""
+        if layer not in self.gains:
+            self.gains[layer] = ValueTracker(1.0)
+        return self.gains[layer]
+
+    def clear(self, layer: str):
+        self.layers.pop(layer, None)
+        self.glow.pop(layer, None)
+        return self.refresh()
+
+    # ========================== FRAME UPDATE ==========================
+    def advance(self, dt: float):
+        """Decay the afterglow, move the sweep and repaint the swept sector."""
+        if dt <= 0:
+            return self
+        decay = np.exp(-dt / self.persistence)
+        swept = min(self.sweep_rate * dt, 2 * np.pi)
+        previous = self.sweep_angle
+        self.sweep_angle = (previous + swept) % (2 * np.pi)
+        sector = ((self.theta - previous) % (2 * np.pi)) <= swept
+        for name, glow in self.glow.items():
+            glow *= decay
+            np.copyto(glow, self.layers[name], where=sector)
+        return self.refresh()
+
+    def _compose(self) -> np.ndarray:
+        behind = (self.sweep_angle - self.theta) % (2 * np.pi)
+        beam = np.exp(-behind / self.beam_trail * 3) * (behind < self.beam_trail) * 0.35 * self.inside
+        # Gains apply at display time, so fading a layer also dims what is already glowing.
+        shown = sum((glow * self.gains[name].get_value() for name, glow in self.glow.items()), np.zeros_like(self.r))
+        glow = np.clip(shown + beam + self.outline + self.centre, 0, 1)
+        rgb = self.grid_rgb * self.grid[..., None] * (1 - glow[..., None]) + self.phosphor * glow[..., None]
+        alpha = np.maximum(self.inside * 0.85, self.outline)
+        return (np.dstack([np.clip(rgb, 0, 1), alpha]) * 255).astype(np.uint8)
+
+    def refresh(self):
+        if hasattr(self, "pixel_array"):
+            self.pixel_array[...] = self._compose()
+        return self
+
+    def start_sweep(self):
+        self.add_updater(lambda m, dt: m.advance(dt))
+        return self
+
+    def stop_sweep(self):
+        self.clear_updaters()
+        return self
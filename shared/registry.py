@@ -0,0 +1,218 @@
+"""Project registry: every renderable scene in the repository, found without importing manim.
+
+Each project folder is scanned with ``ast`` only. For every Scene subclass the
+registry records its manim base type (Scene, ThreeDScene, ...), the module-level
+``config.*`` overrides of its file (e.g. the 9:16 ``pixel_height``/``pixel_width``
+of the shorts) and the narration key it pairs with in the project's voice script.
+
+Per-file results are memoized in ``.cache/registry.json`` keyed by mtime and size,
+so a warm scan of the whole repository only costs a ``stat`` per file.
+
+    python -m shared.registry               # table of all projects
+    python -m shared.registry kalman --json
+"""
+
+import argparse
+import ast
+import json
+import operator
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(REPO_ROOT, ".cache", "registry.json")
+CACHE_VERSION = 1
+SKIP_DIRS = {"shared", "media", "voiceovers", "__pycache__"}
+SCENE_BASES = {
+    "Scene", "ThreeDScene", "MovingCameraScene", "ZoomedScene", "VectorScene",
+    "LinearTransformationScene", "SpecialThreeDScene",
+}
+_BIN_OPS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+            ast.Div: operator.truediv, ast.Pow: operator.pow}
+
+
+@dataclass(frozen=True)
+class SceneInfo:
+    project: str
+    module: str           # path relative to the repo root, e.g. "kalman/main.py"
+    name: str
+    base: str             # manim base class the scene ultimately derives from
+    line: int
+    config: dict
+    narration: Optional[str] = None
+
+
+# ========================== FILE SCAN ==========================
+def _const_eval(node, names: dict):
+    """Evaluate literals, module constants and plain arithmetic; raise ValueError otherwise."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in names:
+        return names[node.id]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_const_eval(node.operand, names)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        return _BIN_OPS[type(node.op)](_const_eval(node.left, names), _const_eval(node.right, names))
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return [_const_eval(elt, names) for elt in node.elts]
+    raise ValueError(ast.dump(node))
+
+
+def scan_file(path: str) -> dict:
+    """Scene classes, config overrides and narration keys of one file, as plain JSON data."""
+    with open(path, encoding="utf-8") as handle:
+        tree = ast.parse(handle.read())
+
+    constants, config, scripts, single_script = {}, {}, None, False
+    classes = {}
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ClassDef):
+            bases = [b.id if isinstance(b, ast.Name) else getattr(b, "attr", "") for b in stmt.bases]
+            narration = None
+            for item in stmt.body:
+                if (isinstance(item, ast.Assign) and isinstance(item.value, ast.Constant)
+                        and any(isinstance(t, ast.Name) and t.id == "narration" for t in item.targets)):
+                    narration = item.value.value
+            classes[stmt.name] = {"bases": bases, "line": stmt.lineno, "narration": narration}
+        elif isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+            target = stmt.targets[0]
+            if isinstance(target, ast.Name):
+                if target.id == "SCRIPTS" and isinstance(stmt.value, ast.Dict):
+                    scripts = [k.value for k in stmt.value.keys if isinstance(k, ast.Constant)]
+                elif target.id == "SCRIPT":
+                    single_script = True
+                try:
+                    constants[target.id] = _const_eval(stmt.value, constants)
+                except (ValueError, TypeError, ZeroDivisionError):
+                    pass
+            elif (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                    and target.value.id == "config"):
+                try:
+                    config[target.attr] = _const_eval(stmt.value, constants)
+                except (ValueError, TypeError, ZeroDivisionError):
+                    config[target.attr] = ast.unparse(stmt.value)
+
+    def root_base(name, seen=()):
+        for base in classes[name]["bases"]:
+            if base in SCENE_BASES:
+                return base
+            if base in classes and base not in seen:
+                found = root_base(base, seen + (name,))
+                if found:
+                    return found
+        return None
+
+    scenes = []
+    for name, info in classes.items():
+        base = root_base(name)
+        if base:
+            scenes.append({"name": name, "base": base, "line": info["line"], "narration": info["narration"]})
+    return {"scenes": scenes, "config": config, "scripts": scripts, "single_script": single_script}
+
+
+class _FileCache:
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self.dirty = False
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            self.entries = data["files"] if data.get("version") == CACHE_VERSION else {}
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+
+    def scan(self, path: str) -> dict:
+        stat = os.stat(path)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        rel = os.path.relpath(path, REPO_ROOT)
+        entry = self.entries.get(rel)
+        if entry and entry["stamp"] == stamp:
+            return entry["data"]
+        data = scan_file(path)
+        self.entries[rel] = {"stamp": stamp, "data": data}
+        self.dirty = True
+        return data
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": CACHE_VERSION, "files": self.entries}, handle)
+        os.replace(tmp_path, self.path)
+
+
+# ========================== REGISTRY ==========================
+def projects(root: str = REPO_ROOT) -> list:
+    return sorted(
+        name for name in os.listdir(root)
+        if os.path.isdir(os.path.join(root, name)) and not name.startswith(".") and name not in SKIP_DIRS
+        and any(f.endswith(".py") for f in os.listdir(os.path.join(root, name)))
+    )
+
+
+def _project_scenes(project: str, cache: _FileCache) -> list:
+    project_dir = os.path.join(REPO_ROOT, project)
+    files = sorted(f for f in os.listdir(project_dir) if f.endswith(".py"))
+    scanned = {f: cache.scan(os.path.join(project_dir, f)) for f in files}
+
+    keys, single = set(), False
+    for data in scanned.values():
+        keys.update(data["scripts"] or ())
+        single = single or data["single_script"]
+    scene_files = [f for f in files if scanned[f]["scenes"]]
+    total_scenes = sum(len(scanned[f]["scenes"]) for f in scene_files)
+
+    result = []
+    for f in scene_files:
+        data = scanned[f]
+        for scene in data["scenes"]:
+            narration = scene["narration"] or (scene["name"] if scene["name"] in keys else None)
+            if narration is None and total_scenes == 1 and (single or len(keys) == 1):
+                # A short with one scene and one narration (dtabase, tumbler-toy).
+                narration = next(iter(keys)) if keys else "SCRIPT"
+            result.append(SceneInfo(project, f"{project}/{f}", scene["name"], scene["base"],
+                                    scene["line"], data["config"], narration))
+    return result
+
+
+def build_registry(selected=None) -> list:
+    """All scenes of the selected projects (default: every project folder)."""
+    cache = _FileCache()
+    scenes = []
+    for project in selected or projects():
+        scenes.extend(_project_scenes(project, cache))
+    cache.save()
+    return scenes
+
+
+def scenes_in(module_path: str) -> list:
+    """Scene names of one file in source order."""
+    return [scene["name"] for scene in sorted(scan_file(module_path)["scenes"], key=lambda s: s["line"])]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="List every renderable scene in the repository.")
+    parser.add_argument("projects", nargs="*", help="project folders (default: all)")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    scenes = build_registry(args.projects or None)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps([asdict(scene) for scene in scenes], indent=2))
+        return 0
+    for scene in scenes:
+        aspect = "9:16" if scene.config.get("pixel_height", 0) > scene.config.get("pixel_width", 1) else "16:9"
+        print(f"{scene.module:<28} {scene.name:<18} {scene.base:<12} {aspect:<5} {scene.narration or '-'}")
+    print(f"\n--- {len(scenes)} scenes in {elapsed * 1000:.1f} ms ---")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""Batch renderer: render every Scene of a project module in a pool of workers.
+
+Usage (from the repository root):
+
+    python -m shared.render kalman/main.py                 # all scenes, one worker per core
+    python -m shared.render ship_radar/main.py Part3 Part9 -q l -j 4
+
+Each worker process imports manim and the scene module once, then renders the
+scenes it is handed one after another. Workers run with the project folder as
+their working directory, exactly like ``manim -pqh main.py Part1`` would.
+
+Scenes whose source (and everything it depends on) is unchanged since the last
+successful render are served from the render cache; pass ``--force`` to ignore it.
+Before the workers start, every MathTex formula of the file is typeset in one
+LaTeX run into the shared tex cache that all workers read from, and every Text is
+looked up in the shared Pango glyph cache before Pango is asked to lay it out.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import Optional
+
+from shared.latex import TEX_CACHE_DIR, collect_formulas, precompile
+from shared.registry import scenes_in
+from shared.render_cache import RenderCache, scene_keys
+from shared.text_cache import install as install_text_cache
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Outcome of rendering one scene."""
+    scene: str
+    exit_code: int
+    output: Optional[str]
+    seconds: float
+    error: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+# ========================== MODULE LOADING ==========================
+def load_module(module_path: str):
+    """Import a scene file the same way the manim CLI does."""
+    module_path = os.path.abspath(module_path)
+    project_dir = os.path.dirname(module_path)
+    if project_dir not in sys.path:
+        sys.path.insert(0, project_dir)
+    name = "".join(os.path.splitext(os.path.relpath(module_path))[0].split(os.sep))
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover_scenes(module_path: str) -> list:
+    """Return the names of all Scene subclasses defined in ``module_path``, in file order.
+
+    Uses the AST registry, so listing scenes does not pay for a manim import.
+    """
+    return scenes_in(module_path)
+
+
+# ========================== WORKER SIDE ==========================
+_worker_module = None
+
+
+def init_worker(module_path: str, quality: str):
+    """Pool initializer: chdir into the project and import manim + the scene module once."""
+    global _worker_module
+    from manim import config
+
+    module_path = os.path.abspath(module_path)
+    os.chdir(os.path.dirname(module_path))
+    config.quality = QUALITIES[quality]
+    config.input_file = module_path
+    config.media_dir = os.path.join(os.path.dirname(module_path), "media")
+    config.tex_dir = TEX_CACHE_DIR
+    install_text_cache()
+    config.disable_caching = False
+    config.verbosity = "WARNING"
+    # Module-level ``config.*`` overrides (9:16 shorts etc.) become the worker's baseline.
+    _worker_module = load_module(module_path)
+
+
+def render_scene(scene_name: str) -> RenderResult:
+    from manim import tempconfig
+
+    start = time.perf_counter()
+    try:
+        scene_cls = getattr(_worker_module, scene_name)
+        with tempconfig({}):
+            scene = scene_cls()
+            scene.render()
+            output = scene.renderer.file_writer.movie_file_path
+        return RenderResult(scene_name, 0, str(output) if output else None, time.perf_counter() - start)
+    except Exception as exc:  # a broken scene must not take the whole batch down
+        return RenderResult(scene_name, 1, None, time.perf_counter() - start, f"{type(exc).__name__}: {exc}")
+
+
+# ========================== PARENT SIDE ==========================
+def render_batch(module_path: str, scenes=None, quality: str = "h", workers=None,
+                 on_result=None, use_cache: bool = True) -> list:
+    """Render ``scenes`` (default: all scenes in the module) and return one RenderResult each.
+
+    ``on_result`` is called with every RenderResult as soon as its scene finishes.
+    With ``use_cache`` unchanged scenes are not rendered again.
+    """
+    if quality not in QUALITIES:
+        raise ValueError(f"Unknown quality {quality!r}, expected one of {sorted(QUALITIES)}")
+    scenes = list(scenes) if scenes else discover_scenes(module_path)
+    if not scenes:
+        return []
+
+    results = {}
+    cache = RenderCache(module_path)
+    keys = scene_keys(module_path, scenes, quality)
+    pending = []
+    for name in scenes:
+        output = cache.lookup(name, quality, keys[name]) if use_cache and name in keys else None
+        if output is None:
+            pending.append(name)
+            continue
+        results[name] = RenderResult(name, 0, output, 0.0, cached=True)
+        if on_result is not None:
+            on_result(results[name])
+    if not pending:
+        return [results[name] for name in scenes]
+
+    if collect_formulas([module_path]):
+        precompile([module_path], TEX_CACHE_DIR)
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=init_worker,
+        initargs=(os.path.abspath(module_path), quality),
+    ) as pool:
+        futures = {pool.submit(render_scene, name): name for name in pending}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:  # worker died (segfault, OOM kill, ...)
+                result = RenderResult(name, 1, None, 0.0, f"{type(exc).__name__}: {exc}")
+            results[name] = result
+            if result.ok and result.output and name in keys:
+                cache.record(name, quality, keys[name], result.output)
+            if on_result is not None:
+                on_result(result)
+    cache.save()
+    return [results[name] for name in scenes]
+
+
+def _print_result(result: RenderResult):
+    status = "HIT " if result.cached else "OK  " if result.ok else "FAIL"
+    detail = result.output if result.ok else result.error
+    print(f"[{status}] {result.scene:<16} {result.seconds:7.1f}s  {detail}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render the scenes of a project module in parallel.")
+    parser.add_argument("module", help="scene file, e.g. kalman/main.py")
+    parser.add_argument("scenes", nargs="*", help="scene names (default: every Scene in the file)")
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITIES))
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: number of CPUs)")
+    parser.add_argument("--force", action="store_true", help="re-render even if the cache is up to date")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = render_batch(args.module, args.scenes, args.quality, args.workers,
+                           on_result=_print_result, use_cache=not args.force)
+    failed = [r.scene for r in results if not r.ok]
+    print(f"\n--- {len(results) - len(failed)}/{len(results)} scenes rendered in "
+          f"{time.perf_counter() - start:.1f}s ---")
+    if failed:
+        print("Failed: " + ", ".join(failed))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""Content-addressed render cache for scene files.
+
+Every scene gets a key that hashes exactly what can change its video:
+
+* the class source itself (helper methods such as ``create_ship`` live inside it),
+* module-level functions, classes and constants it reads, followed transitively
+  (the palette block, ``build_soccer_ball`` in goal/short.py, base classes, ...),
+* the module preamble -- imports, ``config.*`` overrides, monkeypatches,
+* local modules imported by the file (project helpers and ``shared.*``),
+* the narration mp3 + word index of scenes that use ``NarrationTiming``,
+* the render quality and the installed manim version.
+
+The batch renderer skips a scene when its key matches the manifest entry and the
+recorded output file still exists with the same size and SHA-256.
+"""
+
+import ast
+import fcntl
+import hashlib
+import json
+import os
+from importlib import metadata
+
+CACHE_VERSION = 1
+MANIFEST_NAME = "render_cache.json"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _digest(*parts) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode() if isinstance(part, str) else part)
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _manim_version() -> str:
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+# ========================== SOURCE ANALYSIS ==========================
+def _loaded_names(node) -> set:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _assigned_names(stmt) -> list:
+    targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+    return [t.id for t in targets if isinstance(t, ast.Name)]
+
+
+def _split_module(tree, source: str):
+    """Split a module into named top-level definitions and the shared preamble."""
+    # ast.get_source_segment re-splits the whole file per call; slice lines once instead.
+    lines = source.splitlines()
+    definitions, preamble = {}, []
+    for stmt in tree.body:
+        first = stmt.decorator_list[0].lineno if getattr(stmt, "decorator_list", None) else stmt.lineno
+        segment = "\n".join(lines[first - 1:stmt.end_lineno])
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions[stmt.name] = (segment, stmt)
+        elif isinstance(stmt, (ast.Assign, ast.AnnAssign)) and _assigned_names(stmt):
+            for name in _assigned_names(stmt):
+                definitions[name] = (segment, stmt)
+        else:
+            preamble.append(segment)
+    return definitions, preamble
+
+
+def _resolve_local_module(module_name: str, search_dirs) -> str:
+    rel = module_name.replace(".", os.sep)
+    for base in search_dirs:
+        for candidate in (os.path.join(base, rel + ".py"), os.path.join(base, rel, "__init__.py")):
+            if os.path.isfile(candidate):
+                return candidate
+    return ""
+
+
+def _local_imports(tree, search_dirs) -> list:
+    paths = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in names:
+            path = _resolve_local_module(name, search_dirs)
+            if path:
+                paths.append(path)
+    return paths
+
+
+def _dependency_digest(tree, search_dirs, seen=None) -> str:
+    """Hash every local module imported by ``tree``, transitively."""
+    seen = set() if seen is None else seen
+    parts = []
+    for path in _local_imports(tree, search_dirs):
+        path = os.path.abspath(path)
+        if path in seen:
+            continue
+        seen.add(path)
+        with open(path, encoding="utf-8") as handle:
+            source = handle.read()
+        sub_dirs = [os.path.dirname(path)] + list(search_dirs)
+        parts.append(path + ":" + _digest(source, _dependency_digest(ast.parse(source), sub_dirs, seen)))
+    return _digest(*sorted(parts))
+
+
+def dependency_paths(module_path: str) -> list:
+    """Files whose content feeds the keys of ``module_path``'s scenes.
+
+    The module itself, every local module it imports (transitively) and the project's
+    ``voiceovers`` directory with the files in it -- what a watcher has to poll.
+    """
+    module_path = os.path.abspath(module_path)
+    paths, seen = [], {module_path}
+    pending = [(module_path, [os.path.dirname(module_path), REPO_ROOT])]
+    while pending:
+        path, search_dirs = pending.pop()
+        paths.append(path)
+        with open(path, encoding="utf-8") as handle:
+            tree = ast.parse(handle.read())
+        for dependency in _local_imports(tree, search_dirs):
+            dependency = os.path.abspath(dependency)
+            if dependency not in seen:
+                seen.add(dependency)
+                pending.append((dependency, [os.path.dirname(dependency)] + list(search_dirs)))
+    voiceovers = os.path.join(os.path.dirname(module_path), "voiceovers")
+    if os.path.isdir(voiceovers):
+        paths.append(voiceovers)
+        paths.extend(os.path.join(voiceovers, name) for name in sorted(os.listdir(voiceovers))
+                     if name.endswith((".mp3", ".json")))
+    return paths
+
+
+def _class_chain(class_stmt, definitions) -> list:
+    """The class and its base classes defined in the same module, nearest first."""
+    chain, pending = [], [class_stmt]
+    while pending:
+        stmt = pending.pop(0)
+        if stmt in chain:
+            continue
+        chain.append(stmt)
+        for base in stmt.bases:
+            name = base.id if isinstance(base, ast.Name) else None
+            if name in definitions and isinstance(definitions[name][1], ast.ClassDef):
+                pending.append(definitions[name][1])
+    return chain
+
+
+def _narration_digest(project_dir: str, class_stmt, definitions) -> str:
+    """Hash the voiceover a NarrationTiming scene stretches itself to, if any.
+
+    The mixin and the ``narration`` attribute may come from a base class in the same module.
+    """
+    chain = _class_chain(class_stmt, definitions)
+    if not any("NarrationTiming" in _loaded_names(base) for stmt in chain for base in stmt.bases):
+        return ""
+    part = class_stmt.name
+    for stmt in chain:
+        assigned = [s for s in stmt.body if isinstance(s, ast.Assign) and "narration" in _assigned_names(s)
+                    and isinstance(s.value, ast.Constant)]
+        if assigned:
+            part = assigned[-1].value.value
+            break
+    base = os.path.join(project_dir, "voiceovers", part)
+    # The mp3 sets the overall length, the word index (if any) the cue points.
+    return "".join(file_sha256(path) if os.path.isfile(path) else "missing"
+                   for path in (base + ".mp3", base + ".json"))
+
+
+def scene_keys(module_path: str, scenes, quality: str, narration: bool = True) -> dict:
+    """Return ``{scene_name: cache_key}`` for the given scenes of ``module_path``.
+
+    ``narration=False`` leaves the voiceover out, for keys of the scene as written.
+    """
+    module_path = os.path.abspath(module_path)
+    with open(module_path, encoding="utf-8") as handle:
+        source = handle.read()
+    tree = ast.parse(source)
+    definitions, preamble = _split_module(tree, source)
+    search_dirs = [os.path.dirname(module_path), REPO_ROOT]
+    shared = _digest(str(CACHE_VERSION), _manim_version(), quality, *preamble,
+                     _dependency_digest(tree, search_dirs))
+
+    keys = {}
+    for scene in scenes:
+        if scene not in definitions:
+            continue
+        closure, pending = set(), [scene]
+        while pending:
+            name = pending.pop()
+            if name in closure or name not in definitions:
+                continue
+            closure.add(name)
+            pending.extend(_loaded_names(definitions[name][1]))
+        # One statement can define several names; hash each source segment once.
+        segments = sorted({definitions[name][0] for name in closure})
+        voice = (_narration_digest(os.path.dirname(module_path), definitions[scene][1], definitions)
+                 if narration else "")
+        keys[scene] = _digest(shared, voice, *segments)
+    return keys
+
+
+# ========================== MANIFEST ==========================
+class RenderCache:
+    """Manifest of rendered outputs, stored in ``<project>/media/render_cache.json``.
+
+    Several writers (batch renders, the render daemon's jobs) may share a manifest;
+    ``save`` merges this instance's new records into the file under a lock.
+    """
+
+    def __init__(self, module_path: str):
+        self.module_path = os.path.abspath(module_path)
+        self.project_dir = os.path.dirname(self.module_path)
+        self.path = os.path.join(self.project_dir, "media", MANIFEST_NAME)
+        self._module = os.path.splitext(os.path.basename(self.module_path))[0]
+        self._entries = self._load()
+        self._recorded = {}
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _entry_name(self, scene: str, quality: str) -> str:
+        return f"{self._module}:{scene}@{quality}"
+
+    def lookup(self, scene: str, quality: str, key: str):
+        """Return the cached output path if ``key`` matches and the file verifies, else None."""
+        entry = self._entries.get(self._entry_name(scene, quality))
+        if not entry or entry.get("key") != key:
+            return None
+        output = os.path.join(self.project_dir, entry["output"])
+        try:
+            if os.path.getsize(output) != entry["size"]:
+                return None
+        except OSError:
+            return None
+        if file_sha256(output) != entry["sha256"]:
+            return None
+        return output
+
+    def record(self, scene: str, quality: str, key: str, output: str):
+        self._entries[self._entry_name(scene, quality)] = self._recorded[self._entry_name(scene, quality)] = {
+            "key": key,
+            "output": os.path.relpath(output, self.project_dir),
+            "size": os.path.getsize(output),
+            "sha256": file_sha256(output),
+        }
+
+    def save(self):
+        if not self._recorded:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._entries = {**self._load(), **self._recorded}
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(self._entries, handle, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        self._recorded = {}
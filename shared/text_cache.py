@@ -0,0 +1,116 @@
+"""Shared, persistent cache of Pango-rendered Text glyph paths.
+
+manim renders each ``Text`` to an SVG whose name is a hash of the string and its
+style (font, weight, slant, size, line spacing, colour, ...), but keeps those
+files per project under ``media/texts``. ``install()`` points every ``Text`` /
+``MarkupText`` at one repository-wide directory instead, so titles and HUD labels
+such as "RANGE:" or "AZIMUTH:" are rendered by Pango once for all projects and
+all worker processes. Files are rendered into a per-process staging directory
+and published with an atomic rename, so concurrent renders never read a
+half-written SVG; the staging directory is removed again right after.
+
+Hits and misses are counted per process and added to ``stats.json`` on exit
+(or on ``flush()``, for processes that leave through ``os._exit``):
+
+    python -m shared.text_cache          # print the shared counters
+"""
+
+import atexit
+import fcntl
+import json
+import os
+import shutil
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEXT_CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "text")
+STATS_FILE = "stats.json"
+
+hits = 0
+misses = 0
+_installed_dir = None
+
+
+def stats() -> dict:
+    """Counters of this process."""
+    return {"hits": hits, "misses": misses}
+
+
+def flush():
+    """Add this process's counters to the shared ``stats.json`` and reset them."""
+    global hits, misses
+    if _installed_dir is None or not (hits or misses):
+        return
+    path = os.path.join(_installed_dir, STATS_FILE)
+    with open(path + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                total = json.load(handle)
+        except (OSError, ValueError):
+            total = {"hits": 0, "misses": 0}
+        total["hits"] += hits
+        total["misses"] += misses
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(total, handle)
+    hits = misses = 0
+
+
+def _cached(original, directory: str):
+    from manim import config
+
+    def _text2svg(self, color):
+        global hits, misses
+        # Pango lays text out on a canvas the size of the frame, so 9:16 and 16:9 get separate entries.
+        cache_dir = os.path.join(directory, f"{config.pixel_width}x{config.pixel_height}")
+        target = os.path.join(cache_dir, self._text2hash(color) + ".svg")
+        if os.path.exists(target):
+            hits += 1
+            return target
+        misses += 1
+
+        staging = os.path.join(cache_dir, f".staging-{os.getpid()}")
+        os.makedirs(staging, exist_ok=True)
+        previous = config.text_dir
+        config.text_dir = staging
+        try:
+            produced = original(self, color)
+            os.replace(produced, target)
+        finally:
+            config.text_dir = previous
+            # Also covers processes that leave through os._exit, which skips atexit.
+            shutil.rmtree(staging, ignore_errors=True)
+        return target
+
+    return _text2svg
+
+
+def install(directory: str = TEXT_CACHE_DIR):
+    """Route Text and MarkupText SVG rendering through the shared cache (idempotent)."""
+    global _installed_dir
+    from manim import MarkupText, Text
+
+    if _installed_dir is not None:
+        return
+    os.makedirs(directory, exist_ok=True)
+    for cls in (Text, MarkupText):
+        cls._text2svg = _cached(cls._text2svg, directory)
+    _installed_dir = directory
+    atexit.register(flush)
+
+
+def main() -> int:
+    try:
+        with open(os.path.join(TEXT_CACHE_DIR, STATS_FILE), encoding="utf-8") as handle:
+            total = json.load(handle)
+    except (OSError, ValueError):
+        total = {"hits": 0, "misses": 0}
+    files = sum(len([f for f in names if f.endswith(".svg")]) for _, _, names in os.walk(TEXT_CACHE_DIR))
+    lookups = total["hits"] + total["misses"]
+    rate = total["hits"] / lookups if lookups else 0.0
+    print(f"{files} cached texts, {total['hits']} hits / {total['misses']} misses ({rate:.0%} hit rate)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""Narration-driven scene timing.
+
+A scene opts in by mixing in ``NarrationTiming`` and (optionally) naming the
+narration part it is bound to:
+
+    class Part3(NarrationTiming, Scene):
+        narration = "Part3"          # default: the class name
+
+Every ``play`` run_time and ``wait`` duration is scaled by ``voiceovers/<part>.mp3
+duration / planned duration``, so a render lasts exactly as long as its
+narration. The planned (hand-tuned) length is recorded by each full render in
+``media/timing/<Scene>.json`` under the scene's source key, and reused while the
+scene is unchanged. Only when there is no valid record does the scene run
+``construct`` once in a cheap probe pass. That pass applies every animation's
+end state without drawing a frame. It runs between a save and restore of the
+global RNG state, so the real pass draws the same random numbers.
+
+Scenes can also pin a moment to a spoken word with ``self.wait_until_cue("Kalman
+Gain")``. Cues split the timeline into segments; each segment is scaled on its
+own so that it ends exactly when the cue phrase is spoken.
+"""
+
+import inspect
+import json
+import os
+import random
+
+import numpy as np
+from manim import Wait, logger
+
+from shared.cues import CueSheet, index_path
+from shared.media import probe_duration
+from shared.render_cache import scene_keys
+
+_SCENE_PLAY_KWARGS = ("subcaption", "subcaption_duration", "subcaption_offset")
+
+
+class NarrationTiming:
+    """Mixin for Scene / ThreeDScene subclasses whose timeline follows a voiceover."""
+
+    narration = None
+    voiceover_dir = "voiceovers"
+    timing_dir = os.path.join("media", "timing")
+    # Seconds of picture kept after the narrator stops talking.
+    narration_tail = 0.0
+    # Clamp for the stretch factor, so a missing or stale mp3 cannot produce a 10x scene.
+    timing_bounds = (0.25, 4.0)
+
+    timing_scale = 1.0
+    _timing_probe = False
+    _planned_time = 0.0
+    _elapsed = 0.0
+    _cue_sheet = None
+
+    # ========================== SETUP ==========================
+    def narration_path(self) -> str:
+        return os.path.join(self.voiceover_dir, f"{self.narration or type(self).__name__}.mp3")
+
+    def cues(self):
+        """The word timing index of the bound narration, or None if it was not generated."""
+        if self._cue_sheet is None and os.path.exists(index_path(self.narration_path())):
+            self._cue_sheet = CueSheet.load(self.narration_path())
+        return self._cue_sheet
+
+    def plan_path(self) -> str:
+        return os.path.join(self.timing_dir, f"{type(self).__name__}.json")
+
+    def setup(self):
+        super().setup()
+        self._sync_points = []
+        self._planned_time = 0.0
+        self._elapsed = 0.0
+        self._segment_scales = [1.0]
+        self._segment = 0
+        if not self._timing_probe:
+            self._segment_scales = self._compute_segment_scales()
+            self.timing_scale = self._segment_scales[0]
+
+    def tear_down(self):
+        super().tear_down()
+        if not self._timing_probe:
+            self._save_plan()
+
+    # ========================== PLAN ==========================
+    def _plan_key(self):
+        """Source key of the scene (class, module, local imports), without the narration."""
+        try:
+            module_path = inspect.getsourcefile(type(self))
+        except TypeError:
+            return None
+        if not module_path:
+            return None
+        name = type(self).__name__
+        return scene_keys(module_path, [name], "plan", narration=False).get(name)
+
+    def _recorded_plan(self):
+        try:
+            with open(self.plan_path(), encoding="utf-8") as handle:
+                record = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        key = self._plan_key()
+        if key is None or record.get("key") != key:
+            return None
+        sync_points = [tuple(point) for point in record.get("sync_points", [])]
+        if any(len(point) != 3 for point in sync_points):
+            return None                                 # written before cues were kept by phrase
+        return record["planned"], sync_points
+
+    def _save_plan(self):
+        key = self._plan_key()
+        if key is None:
+            return
+        record = {"key": key, "planned": self._planned_time, "sync_points": self._sync_points}
+        os.makedirs(self.timing_dir, exist_ok=True)
+        tmp_path = f"{self.plan_path()}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(record, handle)
+        os.replace(tmp_path, self.plan_path())
+
+    def _probe(self):
+        """Run ``construct`` without rendering; returns (planned length, cue sync points).
+
+        The global RNG states are restored afterwards, so the real pass draws the same numbers.
+        """
+        states = random.getstate(), np.random.get_state()
+        try:
+            probe = type(self)()
+            probe._timing_probe = True
+            probe.setup()
+            probe.construct()
+        finally:
+            random.setstate(states[0])
+            np.random.set_state(states[1])
+        return probe._planned_time, probe._sync_points
+
+    def plan(self):
+        """(planned length, cue sync points): recorded by the last full render, else probed.
+
+        Sync points are ``(phrase, occurrence, planned time)``; the plan is keyed on the scene as
+        written, so when the cue is spoken is looked up in the current narration, not stored.
+        """
+        return self._recorded_plan() or self._probe()
+
+    def _cue_times(self, sync_points) -> list:
+        """``(spoken time, planned time)`` of every sync point in the current narration's word index."""
+        cues = self.cues()
+        if cues is None:
+            return []                                   # wait_until_cue will not hold either
+        return [(cues.time(phrase, occurrence), planned_at) for phrase, occurrence, planned_at in sync_points]
+
+    def planned_duration(self) -> float:
+        """Length of the scene as written."""
+        return self.plan()[0]
+
+    def _compute_segment_scales(self) -> list:
+        path = self.narration_path()
+        if not os.path.exists(path):
+            logger.warning(f"{type(self).__name__}: no narration at {path}, keeping hand-tuned timing")
+            return [1.0]
+        planned, sync_points = self.plan()
+        target = probe_duration(path) + self.narration_tail
+        low, high = self.timing_bounds
+
+        scales, prev_actual, prev_planned = [], 0.0, 0.0
+        for actual, planned_at in self._cue_times(sync_points) + [(target, planned)]:
+            span = planned_at - prev_planned
+            scales.append(min(max((actual - prev_actual) / span, low), high) if span > 0 else 1.0)
+            prev_actual, prev_planned = actual, planned_at
+        logger.info(f"{type(self).__name__}: planned {planned:.2f}s, narration {target:.2f}s, "
+                    f"segment scales {', '.join(f'{s:.3f}' for s in scales)}")
+        return scales
+
+    # ========================== TIMELINE ==========================
+    # Scene.wait is a play(Wait(...)), so waits are timed here too.
+    def play(self, *args, **kwargs):
+        scene_kwargs = {key: kwargs.pop(key) for key in _SCENE_PLAY_KWARGS if key in kwargs}
+        animations = self.compile_animations(*args, **kwargs)
+        planned = self.get_run_time(animations)
+        if self._timing_probe:
+            # A wait with a stop condition counts in full here; the next real render records its length.
+            self._planned_time += planned
+            for animation in animations:
+                animation._setup_scene(self)
+                animation.begin()
+                animation.finish()
+                animation.clean_up_from_scene(self)
+            return
+        for animation in animations:
+            animation.run_time *= self.timing_scale
+        start = self.renderer.time
+        super().play(*animations, **scene_kwargs)
+        measured = self.renderer.time - start
+        if measured > 0 and any(getattr(animation, "stop_condition", None) for animation in animations):
+            planned = measured / self.timing_scale
+        self._planned_time += planned
+        self._elapsed += planned * self.timing_scale
+
+    def wait_until_cue(self, phrase: str, occurrence: int = 1):
+        """Hold until the narrator starts saying ``phrase``; the next animation starts on the word."""
+        self._sync_points.append((phrase, occurrence, self._planned_time))
+        if self._timing_probe:
+            return
+        cues = self.cues()
+        if cues is None:
+            logger.warning(f"{type(self).__name__}: no timing index for cue {phrase!r}, ignoring")
+            return
+        cue_time = cues.time(phrase, occurrence)
+        remaining = cue_time - self._elapsed
+        if remaining > 1e-3:
+            super().play(Wait(run_time=remaining))      # unscaled, and not part of the plan
+            self._elapsed += remaining
+        self._segment = min(self._segment + 1, len(self._segment_scales) - 1)
+        self.timing_scale = self._segment_scales[self._segment]
@@ -0,0 +1,174 @@
+"""Concurrent, rate-limited text-to-speech synthesis.
+
+All parts of a narration are synthesized at the same time, limited by a
+semaphore so the TTS service is not hammered. A failed part is retried with
+exponential backoff; the other parts keep going.
+
+The synthesis itself is delegated to a backend object with a single coroutine,
+``synthesize(text, voice, path, rate, pitch)``. It may return the word
+boundaries of the audio as ``[(start_s, end_s, word), ...]``; they are saved as a
+timing index next to the mp3 (see ``shared.cues``). ``EdgeTTSBackend`` talks to
+Microsoft Edge TTS; ``HttpBackend`` posts to any local HTTP server, which is how
+a fake TTS server stands in for the real one.
+
+Finished parts go into the shared ``TtsCache``; parts whose text, voice,
+prosody and backend are unchanged are copied from it instead of being
+synthesized again. A backend names itself for the cache key with ``identity``.
+
+Project voice.py files go through ``shared.narration`` rather than calling this
+module directly.
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import random
+import time
+import urllib.request
+from dataclasses import dataclass
+from typing import Optional
+
+from shared.cues import index_path, write_index
+from shared.tts_cache import TtsCache
+
+DEFAULT_VOICE = "en-US-GuyNeural"
+DEFAULT_RATE = "+0%"
+DEFAULT_PITCH = "+0Hz"
+
+
+@dataclass(frozen=True)
+class PartResult:
+    """Outcome of synthesizing one narration part."""
+    part: str
+    path: str
+    seconds: float
+    attempts: int
+    error: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# ========================== BACKENDS ==========================
+class EdgeTTSBackend:
+    """Microsoft Edge online TTS through the ``edge_tts`` package, keeping its WordBoundary events."""
+
+    identity = "EdgeTTSBackend"
+
+    async def synthesize(self, text: str, voice: str, path: str, rate: str, pitch: str):
+        import edge_tts
+
+        kwargs = {"rate": rate, "pitch": pitch}
+        # edge_tts >= 7 emits sentence boundaries unless asked for words.
+        if "boundary" in inspect.signature(edge_tts.Communicate).parameters:
+            kwargs["boundary"] = "WordBoundary"
+        communicate = edge_tts.Communicate(text, voice, **kwargs)
+
+        words = []
+        with open(path, "wb") as handle:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    handle.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    # Offsets are in 100 ns ticks.
+                    start = chunk["offset"] / 1e7
+                    words.append((start, start + chunk["duration"] / 1e7, chunk["text"]))
+        return words
+
+
+class HttpBackend:
+    """POST ``{"text", "voice", "rate", "pitch"}`` as JSON and save the response body as audio."""
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        self.url = url
+        self.timeout = timeout
+
+    @property
+    def identity(self) -> str:
+        return f"HttpBackend:{self.url}"
+
+    def _fetch(self, payload: dict) -> bytes:
+        request = urllib.request.Request(
+            self.url, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+
+    async def synthesize(self, text: str, voice: str, path: str, rate: str, pitch: str):
+        audio = await asyncio.to_thread(
+            self._fetch, {"text": text, "voice": voice, "rate": rate, "pitch": pitch}
+        )
+        with open(path, "wb") as handle:
+            handle.write(audio)
+        return None
+
+
+def backend_identity(backend) -> str:
+    """Cache-key name of a backend: its ``identity``, else its class."""
+    return getattr(backend, "identity", None) or type(backend).__qualname__
+
+
+# ========================== RUNNER ==========================
+async def _synthesize_part(backend, semaphore, cache, part, text, path, voice, rate, pitch,
+                           retries, backoff) -> PartResult:
+    start = time.perf_counter()
+    key = cache.key(text, voice, rate, pitch, backend_identity(backend)) if cache is not None else None
+    if cache is not None and cache.get(key, path):
+        return PartResult(part, path, time.perf_counter() - start, 0, cached=True)
+
+    tmp_path = f"{path}.{os.getpid()}.part"
+    attempt = 0
+    while True:
+        attempt += 1
+        async with semaphore:
+            try:
+                words = await backend.synthesize(text, voice, tmp_path, rate, pitch)
+                # Never leave a half-written mp3 under the final name.
+                os.replace(tmp_path, path)
+                if words is not None:
+                    write_index(path, words, text)
+                elif os.path.exists(index_path(path)):
+                    os.remove(index_path(path))  # stale index from an earlier synthesis
+                if cache is not None:
+                    cache.put(key, path)
+                return PartResult(part, path, time.perf_counter() - start, attempt)
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        if attempt > retries:
+            return PartResult(part, path, time.perf_counter() - start, attempt, error)
+        # Exponential backoff with jitter, outside the semaphore so other parts can proceed.
+        await asyncio.sleep(backoff * 2 ** (attempt - 1) * (0.5 + random.random()))
+
+
+async def synthesize_all(scripts: dict, output_dir: str = "voiceovers", voice: str = DEFAULT_VOICE,
+                         backend=None, concurrency: int = 4, retries: int = 3, backoff: float = 1.0,
+                         rate: str = DEFAULT_RATE, pitch: str = DEFAULT_PITCH, on_result=None,
+                         cache: Optional[TtsCache] = None) -> list:
+    """Synthesize ``{part: text}`` into ``output_dir/<part>.mp3`` concurrently.
+
+    Returns one PartResult per part, in the order of ``scripts``. ``on_result`` is
+    called with each PartResult as soon as that part finishes. Pass a ``TtsCache``
+    to reuse audio from earlier runs.
+    """
+    backend = backend or EdgeTTSBackend()
+    os.makedirs(output_dir, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(part, text):
+        result = await _synthesize_part(
+            backend, semaphore, cache, part, text, os.path.join(output_dir, f"{part}.mp3"),
+            voice, rate, pitch, retries, backoff,
+        )
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    results = await asyncio.gather(*(run(part, text) for part, text in scripts.items()))
+    if cache is not None:
+        cache.evict()
+    return results
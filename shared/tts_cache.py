@@ -0,0 +1,105 @@
+"""Persistent, content-addressed cache of synthesized narration audio.
+
+An entry is keyed by the SHA-256 of the whitespace-normalized script text, the
+voice, the prosody settings and the backend that produced it (so audio from a
+fake test server never stands in for a real synthesis), so re-running a voice.py only calls the TTS
+service for parts whose text actually changed. The cache directory is shared by
+all projects and kept under a size cap by evicting the least recently used
+entries (a hit refreshes the entry's mtime). The word timing index written next
+to an mp3 (``shared.cues``) is cached alongside it as ``<key>.json``; the pair
+is one entry and is evicted together.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+from shared.cues import index_path
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.environ.get("TTS_CACHE_DIR") or os.path.join(REPO_ROOT, ".cache", "tts")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def normalize_text(text: str) -> str:
+    """Collapse all whitespace runs so re-indenting a script does not invalidate it."""
+    return " ".join(text.split())
+
+
+def _atomic_copy(src: str, dest: str):
+    # rename() is a no-op between two links to the same inode; nothing to do anyway.
+    if os.path.exists(dest) and os.path.samefile(src, dest):
+        return
+    tmp_path = f"{dest}.{os.getpid()}.tmp"
+    try:
+        os.link(src, tmp_path)
+    except OSError:  # cross-device or filesystem without hard links
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dest)
+
+
+class TtsCache:
+    """Size-capped LRU directory of ``<key>.mp3`` files."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(text: str, voice: str, rate: str, pitch: str, backend: str) -> str:
+        payload = json.dumps([normalize_text(text), voice, rate, pitch, backend])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.mp3")
+
+    def get(self, key: str, dest: str) -> bool:
+        """Materialize the cached audio (and timing index) for ``key`` at ``dest``; False on a miss."""
+        entry = self.path(key)
+        try:
+            os.utime(entry)
+            _atomic_copy(entry, dest)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        if os.path.exists(index_path(entry)):
+            os.utime(index_path(entry))
+            _atomic_copy(index_path(entry), index_path(dest))
+        elif os.path.exists(index_path(dest)):
+            os.remove(index_path(dest))  # belongs to whatever audio dest held before
+        self.hits += 1
+        return True
+
+    def put(self, key: str, src: str):
+        _atomic_copy(src, self.path(key))
+        if os.path.exists(index_path(src)):
+            _atomic_copy(index_path(src), index_path(self.path(key)))
+
+    def evict(self):
+        """Delete least recently used entries until the directory fits in ``max_bytes``.
+
+        An entry is everything named ``<key>.*``: the mp3, its index and any leftover temp file.
+        """
+        entries = {}
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # removed by a concurrent run
+                continue
+            mtime, size, paths = entries.get(name.split(".")[0], (0.0, 0, []))
+            entries[name.split(".")[0]] = (max(mtime, stat.st_mtime), size + stat.st_size, paths + [path])
+        total = sum(size for _, size, _ in entries.values())
+        for _, size, paths in sorted(entries.values()):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
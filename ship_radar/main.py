@@ -1,5 +1,16 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.array_factor import BeamPattern, PlanarArray
+from shared.live_curve import LiveCurve, axes_map
+from shared.ppi import PPIDisplay
+
+from radar_dsp import ScanConfig, ScanStream, Target, WeatherCell, display
+from tracking import Track, TrackingDriver
 
 # ========================== COLOR PALETTE ==========================
 DEEP_NAVY = "#020B1F"
@@ -184,12 +195,20 @@ class Part3(Scene):
                                fill_color=SUBTLE_NAVY, fill_opacity=1,
                                stroke_color=TECH_CYAN, stroke_width=2)
                 element.move_to([
-                    (i - grid_size/2 + 0.5) * (element_size + 0.1),
+                    (i - grid_size/2 + 0.5) * (element_size + 0.1) - 3,
                     (j - grid_size/2 + 0.5) * (element_size + 0.1) - 0.5,
                     0
                 ])
                 antenna_grid.add(element)
         
+        # Radiation pattern of the same 8x8 array (Taylor taper), re-evaluated as the beam steers
+        array = PlanarArray(nx=grid_size, ny=grid_size, taper="taylor")
+        steer = ValueTracker(0)
+        beam = BeamPattern(array, steer=steer, radius=2.6, floor_db=-30, center=RIGHT*3 + DOWN*2.2,
+                           color=TECH_CYAN, stroke_width=3, fill_color=TECH_CYAN, fill_opacity=0.15)
+        beam_base = Line(RIGHT*0.2 + DOWN*2.2, RIGHT*5.8 + DOWN*2.2, color=SUBTLE_NAVY, stroke_width=2)
+        beam_label = Text("Beam Pattern", font_size=22, color=TECH_CYAN).next_to(beam_base, UP, buff=0.1).align_to(beam_base, LEFT)
+        
         # Explanation
         explanation = VGroup(
             Text("Each element transmits with", font_size=24, color=TEXT_WHITE),
@@ -211,42 +230,35 @@ class Part3(Scene):
         
         self.wait(1)
         
+        self.play(Create(beam_base), FadeIn(beam), Write(beam_label), run_time=1)
+        
         # Animate beam steering - elements light up in wave pattern
         for angle in [0, 30, -30, 15]:
-            self.animate_beam_steering(antenna_grid, grid_size, angle)
+            self.animate_beam_steering(antenna_grid, array, steer, angle)
         
         self.play(Write(explanation), run_time=1.5)
         self.wait(3)
     
-    def animate_beam_steering(self, grid, size, angle_deg):
-        angle_rad = angle_deg * DEGREES
-        
-        # Calculate phase delays based on angle and ensure non-negative
-        for idx, elem in enumerate(grid):
-            i = idx // size
-            j = idx % size
-            # Normalize delay to be between 0 and 1
-            delay = abs((i * np.sin(angle_rad) + j * np.cos(angle_rad)) / size)
-            elem.delay = delay
-        
-        # Sort by delay and animate in sequence
-        sorted_elems = sorted(grid, key=lambda e: e.delay)
+    def animate_beam_steering(self, grid, array, steer, angle_deg):
+        # Phase delay of each element for this steering angle, normalized to 0..1
+        # (grid and phases are both column-major, i * size + j)
+        phases = array.phases(angle_deg * DEGREES).ravel()
+        delays = (phases.max() - phases) / max(np.ptp(phases), 1e-9)
         
-        # Animate elements lighting up
+        # Elements light up in phase order while the pattern swings to the new angle
         self.play(
-            LaggedStart(*[
-                elem.animate.set_fill(TECH_CYAN, opacity=0.8).set_stroke(NEON_PINK)
-                for elem in sorted_elems
-            ], lag_ratio=0.05),
+            steer.animate.set_value(angle_deg),
+            *[
+                elem.animate(rate_func=squish_rate_func(smooth, 0.5 * d, 0.5 * d + 0.5))
+                .set_fill(TECH_CYAN, opacity=0.8).set_stroke(NEON_PINK)
+                for elem, d in zip(grid, delays)
+            ],
             run_time=1
         )
         
         # Reset elements
         self.play(
-            LaggedStart(*[
-                elem.animate.set_fill(SUBTLE_NAVY, opacity=1).set_stroke(TECH_CYAN)
-                for elem in sorted_elems
-            ], lag_ratio=0.02),
+            *[elem.animate.set_fill(SUBTLE_NAVY, opacity=1).set_stroke(TECH_CYAN) for elem in grid],
             run_time=0.5
         )
 
@@ -589,21 +601,18 @@ class Part6(ThreeDScene):
         # Create EM wave (E and B fields)
         t_tracker = ValueTracker(0)
         
-        def e_field_wave(u):
-            return axes.c2p(u, np.sin(u - t_tracker.get_value()), 0)
+        def e_field_wave(u, t):
+            return np.column_stack([u, np.sin(u - t), np.zeros_like(u)])
         
-        def b_field_wave(u):
-            return axes.c2p(u, 0, np.sin(u - t_tracker.get_value()))
+        def b_field_wave(u, t):
+            return np.column_stack([u, np.zeros_like(u), np.sin(u - t)])
         
-        e_wave = always_redraw(lambda: ParametricFunction(
-            e_field_wave, t_range=[-4, 4, 0.1],
-            color=TECH_CYAN, stroke_width=4
-        ))
+        # Fixed u grid, points rewritten in place each frame
+        e_wave = LiveCurve(e_field_wave, u_range=(-4, 4), samples=81, time=t_tracker,
+                           coords=axes_map(axes), color=TECH_CYAN, stroke_width=4)
         
-        b_wave = always_redraw(lambda: ParametricFunction(
-            b_field_wave, t_range=[-4, 4, 0.1],
-            color=NEON_PINK, stroke_width=4
-        ))
+        b_wave = LiveCurve(b_field_wave, u_range=(-4, 4), samples=81, time=t_tracker,
+                           coords=axes_map(axes), color=NEON_PINK, stroke_width=4)
         
         # Labels for E and B
         e_label = Text("E-Field", font_size=24, color=TECH_CYAN)
@@ -1361,11 +1370,6 @@ class Part12(ThreeDScene):
         title = Text("3D TARGET TRACKING", font_size=40, color=TECH_CYAN)
         title.to_edge(UP, buff=0.3)
         
-        # Value Trackers
-        range_val = ValueTracker(0)
-        azimuth_val = ValueTracker(0)
-        elev_val = ValueTracker(0)
-        
         # Coordinate display with values
         # Sea Surface Grid (XY Plane)
         sea_grid = NumberPlane(
@@ -1392,19 +1396,16 @@ class Part12(ThreeDScene):
         r_label = Text("RANGE:", font_size=16, color=TECH_CYAN, font="Monospace").move_to(start_pos, aligned_edge=LEFT)
         r_num = DecimalNumber(0, num_decimal_places=2, unit=" km", font_size=16, color=TECH_CYAN)
         r_num.next_to(r_label, RIGHT, buff=0.5)
-        r_num.add_updater(lambda d: d.set_value(range_val.get_value()))
         
         # Azimuth
         az_label = Text("AZIMUTH:", font_size=16, color=NEON_PINK, font="Monospace").next_to(r_label, DOWN, buff=0.3, aligned_edge=LEFT)
         az_num = DecimalNumber(0, num_decimal_places=1, unit="^\\circ", font_size=16, color=NEON_PINK)
         az_num.next_to(az_label, RIGHT, buff=0.5)
-        az_num.add_updater(lambda d: d.set_value(azimuth_val.get_value()))
         
         # Elevation
         el_label = Text("ELEVATION:", font_size=16, color=VIBRANT_ORANGE, font="Monospace").next_to(az_label, DOWN, buff=0.3, aligned_edge=LEFT)
         el_num = DecimalNumber(0, num_decimal_places=1, unit="^\\circ", font_size=16, color=VIBRANT_ORANGE)
         el_num.next_to(el_label, RIGHT, buff=0.5)
-        el_num.add_updater(lambda d: d.set_value(elev_val.get_value()))
         
         coord_group = VGroup(coord_box, coord_title, r_label, r_num, az_label, az_num, el_label, el_num)
         
@@ -1426,42 +1427,37 @@ class Part12(ThreeDScene):
         # Let's just use a simple 3D shape for ship
         ship_cone = Cone(base_radius=0.2, height=0.5, direction=UP, show_base=True, fill_color=SUBTLE_NAVY, fill_opacity=0.8, stroke_color=TECH_CYAN)
         
-        # Target
+        # Target moves along a spiral path, precomputed once per frame with its range / azimuth / elevation
+        run_time = 8
+        track = Track.from_function(
+            lambda t: np.column_stack([-4 + t*0.8, -2 + t*0.5 + np.sin(t*2), 2 + t*0.2 + np.cos(t)]),
+            t_range=(0, 10), samples=int(run_time * config.frame_rate) + 1,
+        )
+        ground = track.positions * [1, 1, 0]
+        
         # Initial position
-        init_pos = np.array([-4, -2, 2])
+        init_pos = track.positions[0]
         target = Dot3D(point=init_pos, color=NEON_PINK, radius=0.15)
         target.set_z_index(10) # Ensure it's on top
         
         # Trail
         trail = TracedPath(target.get_center, dissipating_time=2, stroke_opacity=[0, 1], stroke_color=NEON_PINK, stroke_width=2)
         
-        # Tracking visualizers (Lines)
-        # UPDATER FUNCTION
-        def update_tracking(mob):
-            pos = target.get_center()
-            x, y, z = pos[0], pos[1], pos[2]
-            
-            # Update Trackers
-            r = np.sqrt(x**2 + y**2 + z**2)
-            az = np.degrees(np.arctan2(y, x))
-            if az < 0: az += 360
-            el = np.degrees(np.arcsin(z / r)) if r > 0 else 0
-            
-            range_val.set_value(r * 2.5) # Scale for realistic km
-            azimuth_val.set_value(az)
-            elev_val.set_value(el)
+        # One driver updater moves the target, the lines and the readouts from the arrays
+        driver = TrackingDriver(track)
+        driver.follow(target)
+        driver.readout(r_num, "range", scale=2.5)  # Scale for realistic km
+        driver.readout(az_num, "azimuth")
+        driver.readout(el_num, "elevation")
 
         # Use Line for updaters as it is more robust than Line3D for continuous updates
         dynamic_range = Line(ORIGIN, init_pos, color=TECH_CYAN, stroke_opacity=0.6)
         dynamic_proj = Line(ORIGIN, [init_pos[0], init_pos[1], 0], color=NEON_PINK, stroke_opacity=0.3)
         dynamic_height = Line([init_pos[0], init_pos[1], 0], init_pos, color=VIBRANT_ORANGE, stroke_opacity=0.8)
         
-        dynamic_range.add_updater(lambda m: m.put_start_and_end_on(ORIGIN, target.get_center()))
-        dynamic_proj.add_updater(lambda m: m.put_start_and_end_on(ORIGIN, [target.get_center()[0], target.get_center()[1], 0]))
-        dynamic_height.add_updater(lambda m: m.put_start_and_end_on([target.get_center()[0], target.get_center()[1], 0], target.get_center()))
-        
-        # Add target updater
-        target.add_updater(lambda m: update_tracking(m))
+        driver.bind(dynamic_range, lambda m, tr, i: m.put_start_and_end_on(ORIGIN, tr.positions[i]))
+        driver.bind(dynamic_proj, lambda m, tr, i: m.put_start_and_end_on(ORIGIN, ground[i]))
+        driver.bind(dynamic_height, lambda m, tr, i: m.put_start_and_end_on(ground[i], tr.positions[i]))
 
         # Animations
         self.play(Write(title), run_time=1)
@@ -1474,26 +1470,15 @@ class Part12(ThreeDScene):
         # But 'add_fixed...' puts them on screen. 
         # Let's try simpler formatting: just add them, assume user wants to see them.
         
-        self.add(target, trail, dynamic_range, dynamic_proj, dynamic_height)
+        # The driver goes first so the trail traces the target's new position each frame
+        self.add(driver, target, trail, dynamic_range, dynamic_proj, dynamic_height)
         self.play(FadeIn(target), run_time=0.5)
         
-        # Move target along a spiral path
-        path_points = [
-            np.array([-4 + t*0.8, -2 + t*0.5 + np.sin(t*2), 2 + t*0.2 + np.cos(t)])
-            for t in np.linspace(0, 10, 300)
-        ]
-        
-        path_mobj = VMobject()
-        path_mobj.set_points_smoothly(path_points)
-        
         # Camera rotation
         self.begin_ambient_camera_rotation(rate=0.1)
         
-        self.play(
-            MoveAlongPath(target, path_mobj),
-            run_time=8,
-            rate_func=linear
-        )
+        # Move target along the spiral path
+        self.play(driver.run(), run_time=run_time, rate_func=linear)
         
         self.wait(1)
 
@@ -1672,38 +1657,46 @@ class Part15(Scene):
         subtitle = Text("Separating targets from environmental noise", font_size=28, color=TEXT_WHITE)
         subtitle.next_to(title, DOWN, buff=0.2)
         
-        # PPI scope display (circular radar display)
+        # PPI scope display (circular radar display): range rings, bearings, sweep and
+        # returns are all one raster image updated per frame
         ppi_radius = 2.5
-        ppi_circle = Circle(radius=ppi_radius, stroke_color=TECH_CYAN, stroke_width=3)
-        ppi_center = Dot(ORIGIN, color=TECH_CYAN, radius=0.08)
-        
-        # Range rings
-        range_rings = VGroup(*[
-            Circle(radius=r, stroke_color=SUBTLE_NAVY, stroke_width=1)
-            for r in [0.5, 1, 1.5, 2, 2.5]
-        ])
+        ppi = PPIDisplay(radius=ppi_radius, rings=[0.5, 1, 1.5, 2, 2.5], ring_units="scene", color=TECH_CYAN)
         
         ppi_label = Text("PPI Display", font_size=22, color=TECH_CYAN)
-        ppi_label.next_to(ppi_circle, DOWN, buff=0.3)
-        
-        # Clutter (random dots representing sea clutter, weather)
-        np.random.seed(42)
-        clutter = VGroup()
-        for _ in range(80):
-            r = np.random.uniform(0.3, ppi_radius)
-            theta = np.random.uniform(0, 2*PI)
-            size = np.random.uniform(0.02, 0.08)
-            dot = Dot(point=[r*np.cos(theta), r*np.sin(theta), 0],
-                     color=NEON_PINK, radius=size)
-            dot.set_opacity(np.random.uniform(0.3, 0.7))
-            clutter.add(dot)
-        
-        # Real targets (distinct returns)
-        targets = VGroup(
-            Dot(point=[1.5, 0.8, 0], color=VIBRANT_ORANGE, radius=0.12),
-            Dot(point=[-1, 1.5, 0], color=VIBRANT_ORANGE, radius=0.12),
-            Dot(point=[0.5, -1.8, 0], color=VIBRANT_ORANGE, radius=0.12),
-        )
+        ppi_label.next_to(ppi, DOWN, buff=0.3)
+        
+        # A coherent scan: spiky sea clutter fading with range, two rain cells and three
+        # moving targets, all buried in receiver noise
+        scan = ScanConfig(max_range=ppi_radius)
+        stream = ScanStream(
+            scan,
+            targets=[Target(1.5, 0.8, doppler=0.25, snr=25), Target(-1, 1.5, doppler=-0.3, snr=22),
+                     Target(0.5, -1.8, doppler=0.35, snr=24)],
+            weather=[WeatherCell(-1.3, -0.9, radius=0.8, cnr=30), WeatherCell(1.4, -0.6, radius=0.5)],
+            seed=0, start_angle=ppi.sweep_angle,
+        ).fill()
+        
+        # Before: raw echo power. After: 3-pulse MTI, Doppler filtering and CA-CFAR
+        ppi.set_polar("clutter", display(stream.raw))
+        ppi.set_polar("filtered", display(stream.output.max(axis=1), floor=0, span=20))
+        clutter_gain = ppi.gain("clutter").set_value(0)
+        filtered_gain = ppi.gain("filtered").set_value(0)
+        
+        # Every frame the beams under the sweep get a fresh dwell, processed on the spot
+        def live_scan(m, dt):
+            swept = stream.advance(m.sweep_rate * dt)
+            if len(swept):
+                m.set_polar("clutter", display(stream.raw), beams=swept)
+                m.set_polar("filtered", display(stream.output.max(axis=1), floor=0, span=20), beams=swept)
+        ppi.add_updater(live_scan)
+        
+        # Target markers sit on what CFAR reports well clear of its threshold (true targets
+        # come in near 20 dB over it, false alarms within a few dB)
+        found = stream.detections(min_power=10)
+        targets = VGroup(*[
+            Dot(point=[x, y, 0], color=VIBRANT_ORANGE, radius=0.12)
+            for x, y in found.xy
+        ])
         
         # Before/After labels
         before_label = Text("BEFORE FILTERING", font_size=24, color=NEON_PINK, weight=BOLD)
@@ -1725,13 +1718,13 @@ class Part15(Scene):
         self.play(Write(title), run_time=1)
         self.play(FadeIn(subtitle), run_time=0.8)
         
-        # Build PPI display
-        self.play(Create(ppi_circle), Create(range_rings), FadeIn(ppi_center), run_time=1)
+        # Build PPI display; the sweep keeps running from here on
+        self.play(FadeIn(ppi.start_sweep()), run_time=1)
         self.play(Write(ppi_label), run_time=0.5)
         
         # Show cluttered display
         self.play(Write(before_label), run_time=0.5)
-        self.play(FadeIn(clutter), run_time=1.5)
+        self.play(clutter_gain.animate.set_value(1), run_time=1.5)
         self.play(FadeIn(targets), run_time=0.5)
         
         self.wait(1)
@@ -1741,10 +1734,11 @@ class Part15(Scene):
         
         self.wait(1)
         
-        # Apply filtering - fade out clutter, keep targets
+        # Apply filtering - raw video gives way to the CFAR output, targets stay
         self.play(
             ReplacementTransform(before_label, after_label),
-            clutter.animate.set_opacity(0.05),
+            clutter_gain.animate.set_value(0),
+            filtered_gain.animate.set_value(1),
             targets.animate.set_color(TECH_CYAN).scale(1.3),
             run_time=2
         )
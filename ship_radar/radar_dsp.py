@@ -0,0 +1,307 @@
+"""Coherent radar processing for the clutter scenes: returns, MTI, Doppler and CA-CFAR.
+
+A scan is a complex pulse cube ``(beams, pulses, range_bins)``: for every beam
+position a burst of pulses, each sampled in range. Sea and weather clutter sit
+near zero Doppler, targets move. Every stage works on the whole cube at once:
+
+* ``mti`` is a pulse canceller -- a short FIR sliding along the pulse axis;
+* ``range_doppler`` windows and FFTs the pulses of every beam and range cell;
+* ``ca_cfar`` estimates the local noise of every cell from summed-area tables,
+  so the guard/training window costs four lookups per cell whatever its size.
+
+Every beam position draws its own random numbers and, with the default CFAR
+window (range only, per Doppler filter), is processed independently of its
+neighbours. ``ScanStream`` uses that to follow an animated sweep: each frame it
+simulates and processes only the beams swept since the last one, a fraction
+of a millisecond per beam, and a full revolution costs about as much as one
+whole-scan pass spread over the sweep period.
+
+    scan = ScanConfig(max_range=2.5)
+    stream = ScanStream(scan, [Target(1.5, 0.8, doppler=0.25)], seed=42).fill()
+    found = stream.detections(min_power=6)          # found.xy -> scene units
+    beams = stream.advance(sweep_rate * dt)         # per frame: the beams just refreshed
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+MTI_TWO_PULSE = (1.0, -1.0)
+MTI_THREE_PULSE = (1.0, -2.0, 1.0)
+
+
+@dataclass(frozen=True)
+class ScanConfig:
+    max_range: float = 2.5          # scene units at the last range bin
+    beams: int = 256                # azimuth positions per revolution
+    pulses: int = 16                # coherent pulses per beam
+    range_bins: int = 128
+    beamwidth: float = 2.0          # two-way -3 dB beamwidth, in beams
+    noise: float = 1.0              # receiver noise power per sample
+
+    @property
+    def ranges(self) -> np.ndarray:
+        """Range-bin centres in scene units."""
+        return (np.arange(self.range_bins) + 0.5) * self.max_range / self.range_bins
+
+    @property
+    def azimuths(self) -> np.ndarray:
+        """Beam centres in radians, CCW from +x (the PPI convention)."""
+        return (np.arange(self.beams) + 0.5) * 2 * np.pi / self.beams
+
+
+@dataclass(frozen=True)
+class Target:
+    x: float
+    y: float
+    doppler: float = 0.25           # cycles per pulse, in (-0.5, 0.5)
+    snr: float = 30.0               # peak single-pulse SNR in dB
+
+
+@dataclass(frozen=True)
+class WeatherCell:
+    x: float
+    y: float
+    radius: float
+    cnr: float = 25.0               # clutter-to-noise ratio in dB at the centre
+    doppler: float = 0.02           # mean wind drift, cycles per pulse
+
+
+@dataclass(frozen=True)
+class Detections:
+    beam: np.ndarray
+    bin: np.ndarray
+    doppler: np.ndarray             # Doppler bin of the peak, 0 = zero velocity
+    power: np.ndarray               # peak power in dB (over the CFAR threshold when given)
+    xy: np.ndarray                  # (K, 2) scene coordinates
+
+    def __len__(self) -> int:
+        return len(self.beam)
+
+    def take(self, index) -> "Detections":
+        return Detections(self.beam[index], self.bin[index], self.doppler[index], self.power[index], self.xy[index])
+
+
+# ========================== RETURNS ==========================
+def _polar(scan: ScanConfig, x, y):
+    """Fractional beam and range-bin index of scene points."""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    beam = (np.arctan2(y, x) % (2 * np.pi)) * scan.beams / (2 * np.pi) - 0.5
+    return beam, np.hypot(x, y) * scan.range_bins / scan.max_range - 0.5
+
+
+def _beam_pattern(scan: ScanConfig, beams: np.ndarray, beam: np.ndarray) -> np.ndarray:
+    """Two-way gain of beam positions ``beams`` towards targets at fractional ``beam``, ``(len(beams), K)``."""
+    offset = (beams[:, None] - beam[None] + scan.beams / 2) % scan.beams - scan.beams / 2
+    return np.exp(-4 * np.log(2) * (offset / scan.beamwidth) ** 2)
+
+
+def _complex_noise(rng, shape, power=1.0) -> np.ndarray:
+    return (rng.standard_normal(shape) + 1j * rng.standard_normal(shape)) * np.sqrt(power / 2)
+
+
+def _beam_draws(rng, scan: ScanConfig, n_targets: int) -> tuple:
+    """All random numbers of one beam position: noise, clutter texture, amplitude and jitter, target phases."""
+    return (_complex_noise(rng, (scan.pulses, scan.range_bins), scan.noise),
+            rng.gamma(0.7, 1 / 0.7, scan.range_bins),
+            _complex_noise(rng, scan.range_bins),
+            rng.standard_normal(scan.range_bins),
+            rng.uniform(size=n_targets))
+
+
+def simulate_scan(scan: ScanConfig, targets=(), weather=(), sea_cnr: float = 35.0, sea_falloff: float = 0.15,
+                  spread: float = 0.01, seed=None, beams=None, revolution=0) -> np.ndarray:
+    """Complex returns ``(beams, pulses, range_bins)``: noise, sea clutter, weather and point targets.
+
+    Sea clutter is spiky (gamma-textured, K-distributed amplitude) and falls off with range over
+    ``sea_falloff`` of the maximum range; all clutter decorrelates slowly from pulse to pulse with a
+    Doppler spread of ``spread`` cycles per pulse.
+
+    ``beams`` (default: all) and ``revolution`` (one value or one per beam) pick which beam positions
+    of which antenna turn to simulate. Every (seed, revolution, beam) has its own random stream, so a
+    scan simulated a few beams at a time equals the same scan simulated at once.
+    """
+    beams = np.arange(scan.beams) if beams is None else np.asarray(beams, dtype=int).reshape(-1)
+    revolution = np.broadcast_to(np.asarray(revolution, dtype=int), beams.shape)
+    seed = np.random.SeedSequence(seed).entropy
+    draws = [_beam_draws(np.random.default_rng([seed, int(r), int(b)]), scan, len(targets))
+             for b, r in zip(beams, revolution)]
+    cube, texture, amplitude, jitter, phases = (np.stack(x) for x in zip(*draws))
+    n = np.arange(scan.pulses)[None, :, None]
+
+    # Clutter: one reflectivity per (beam, range) cell, drifting slowly across the burst.
+    ranges = scan.ranges / scan.max_range
+    power = 10 ** (sea_cnr / 10) * np.exp(-ranges / sea_falloff) * texture
+    drift = np.zeros((len(beams), scan.range_bins))
+    if weather:
+        azimuths = scan.azimuths[beams]
+        xs = scan.ranges[None] * np.cos(azimuths)[:, None]
+        ys = scan.ranges[None] * np.sin(azimuths)[:, None]
+        for cell in weather:
+            footprint = np.exp(-((xs - cell.x) ** 2 + (ys - cell.y) ** 2) / (2 * (cell.radius / 2) ** 2))
+            rain = 10 ** (cell.cnr / 10) * footprint
+            drift = np.where(rain > power, cell.doppler, drift)
+            power = power + rain
+    amplitude = amplitude[:, None] * np.sqrt(power)[:, None]
+    frequency = drift[:, None] + spread * jitter[:, None]
+    cube += amplitude * np.exp(2j * np.pi * frequency * n)
+
+    # Point targets: beam-pattern weighted, one Doppler line each, nearest range bin.
+    if targets:
+        tx = np.array([[t.x, t.y, t.doppler, t.snr] for t in targets], dtype=float)
+        beam, rbin = _polar(scan, tx[:, 0], tx[:, 1])
+        gain = _beam_pattern(scan, beams, beam) * np.sqrt(10 ** (tx[:, 3] / 10))     # (beams, K)
+        phase = np.exp(2j * np.pi * (tx[:, 2] * np.arange(scan.pulses)[:, None] + phases[:, None]))
+        bins = np.clip(np.round(rbin).astype(int), 0, scan.range_bins - 1)
+        np.add.at(cube.transpose(2, 0, 1), bins, (gain[:, None] * phase).transpose(2, 0, 1))
+    return cube
+
+
+# ========================== FILTERING ==========================
+def mti(cube: np.ndarray, taps=MTI_THREE_PULSE) -> np.ndarray:
+    """Pulse canceller: ``taps`` slid along the pulse axis (valid part), notching zero Doppler."""
+    taps = np.asarray(taps, dtype=float)
+    out_len = cube.shape[1] - len(taps) + 1
+    out = taps[0] * cube[:, :out_len]
+    for k, tap in enumerate(taps[1:], start=1):
+        out = out + tap * cube[:, k:k + out_len]
+    return out
+
+
+def range_doppler(cube: np.ndarray) -> np.ndarray:
+    """Hann-windowed Doppler power ``(beams, doppler_bins, range_bins)``, zero Doppler centred."""
+    window = np.hanning(cube.shape[1] + 2)[1:-1]
+    spectrum = np.fft.fft(cube * window[None, :, None], axis=1)
+    return np.fft.fftshift(np.abs(spectrum) ** 2, axes=1) / np.sum(window ** 2)
+
+
+def _box_sums(table: np.ndarray, pad: tuple, half: tuple, shape: tuple) -> np.ndarray:
+    """Window sums of half-size ``half`` around every cell, read from a zero-led summed-area table."""
+    (pa, pb), (h, w), (rows, cols) = pad, half, shape
+    r0, r1 = slice(pa - h, pa - h + rows), slice(pa + h + 1, pa + h + 1 + rows)
+    c0, c1 = slice(pb - w, pb - w + cols), slice(pb + w + 1, pb + w + 1 + cols)
+    return table[..., r1, c1] - table[..., r0, c1] - table[..., r1, c0] + table[..., r0, c0]
+
+
+def ca_cfar(power: np.ndarray, guard=(0, 2), train=(0, 12), pfa: float = 1e-6):
+    """Cell-averaging CFAR over the last two axes (Doppler, range) of every map at once.
+
+    The noise estimate of each cell is the mean of its training ring -- a ``(2(g+t)+1)`` box minus
+    the ``(2g+1)`` guard box around it. Doppler wraps around; range edges are mirrored. Returns the
+    detection mask and the threshold map. The default trains along range only, per Doppler filter:
+    after MTI the noise floor is far from flat across Doppler, so averaging over it misleads.
+    """
+    (gd, gr), (td, tr) = guard, train
+    pad = (gd + td, gr + tr)
+    rows, cols = power.shape[-2:]
+    lead = [(0, 0)] * (power.ndim - 2)
+    padded = np.pad(power, lead + [pad[:1] * 2, (0, 0)], mode="wrap")
+    padded = np.pad(padded, lead + [(0, 0), pad[1:] * 2], mode="reflect")
+    table = np.zeros(padded.shape[:-2] + (padded.shape[-2] + 1, padded.shape[-1] + 1))
+    np.cumsum(np.cumsum(padded, axis=-2), axis=-1, out=table[..., 1:, 1:])
+
+    cells = (2 * pad[0] + 1) * (2 * pad[1] + 1) - (2 * gd + 1) * (2 * gr + 1)
+    ring = _box_sums(table, pad, pad, (rows, cols)) - _box_sums(table, pad, (gd, gr), (rows, cols))
+    alpha = cells * (pfa ** (-1 / cells) - 1)
+    threshold = alpha * ring / cells
+    return power > threshold, threshold
+
+
+# ========================== DETECTIONS ==========================
+def cfar_output(hits: np.ndarray, power: np.ndarray, threshold: np.ndarray = None, blind: int = 1) -> np.ndarray:
+    """Power of every CFAR hit (over its threshold, if given), zero elsewhere.
+
+    Doppler bins within ``blind`` of zero -- the MTI notch, where only clutter residue lives -- are
+    dropped.
+    """
+    hits = hits.copy()
+    zero = power.shape[1] // 2
+    hits[:, zero - blind:zero + blind + 1] = False
+    out = np.zeros(power.shape)
+    np.divide(power, 1.0 if threshold is None else threshold, out=out, where=hits)
+    return out
+
+
+def detections(output: np.ndarray, scan: ScanConfig) -> Detections:
+    """Collapse a ``cfar_output`` map to one detection per local peak in the (beam, range) plane.
+
+    A cell survives if it beats its eight neighbours (beams wrap around), so a target smeared over
+    the beamwidth reports once.
+    """
+    peak_doppler = output.argmax(axis=1)
+    best = np.take_along_axis(output, peak_doppler[:, None], axis=1)[:, 0]       # (beams, range_bins)
+    padded = np.pad(best, [(0, 0), (1, 1)])
+    local_max = best > 0
+    for db in (-1, 0, 1):
+        rolled = np.roll(padded, db, axis=0)
+        for dr in (-1, 0, 1):
+            if db or dr:
+                neighbour = rolled[:, 1 + dr:1 + dr + scan.range_bins]
+                local_max &= best > neighbour if (db, dr) < (0, 0) else best >= neighbour
+    beam, rbin = np.nonzero(local_max)
+    azimuth, rng = scan.azimuths[beam], scan.ranges[rbin]
+    return Detections(
+        beam=beam,
+        bin=rbin,
+        doppler=peak_doppler[beam, rbin] - output.shape[1] // 2,
+        power=10 * np.log10(best[beam, rbin]),
+        xy=np.column_stack([rng * np.cos(azimuth), rng * np.sin(azimuth)]),
+    )
+
+
+def display(power: np.ndarray, floor: float = 3.0, span: float = 40.0) -> np.ndarray:
+    """Log-compress a ``(beams, range_bins)`` power map (noise = 0 dB) to 0..1 scope brightness."""
+    return np.clip((10 * np.log10(np.maximum(power, 1e-12)) - floor) / span, 0, 1)
+
+
+# ========================== SWEEP ==========================
+class ScanStream:
+    """A scan simulated and processed beam by beam, following the antenna as it sweeps.
+
+    ``raw`` holds the mean echo power and ``output`` the CFAR output of the latest dwell at every
+    beam position; ``advance`` refreshes the beams swept since the last call from a new revolution.
+    """
+
+    def __init__(self, scan: ScanConfig, targets=(), weather=(), seed=0, start_angle: float = 0.0,
+                 taps=MTI_THREE_PULSE, **clutter):
+        self.scan = scan
+        self.targets = tuple(targets)
+        self.weather = tuple(weather)
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.taps = taps
+        self.clutter = clutter                      # sea_cnr, sea_falloff, spread for simulate_scan
+        doppler_bins = scan.pulses - len(taps) + 1
+        self.raw = np.zeros((scan.beams, scan.range_bins))
+        self.output = np.zeros((scan.beams, doppler_bins, scan.range_bins))
+        # Beams swept so far, counted from beam 0 of revolution 0; the first sweep is revolution 1.
+        self.position = scan.beams + (start_angle % (2 * np.pi)) * scan.beams / (2 * np.pi)
+
+    def process(self, beams, revolution=0):
+        """Simulate and process ``beams`` of one revolution (or one revolution per beam)."""
+        beams = np.asarray(beams, dtype=int).reshape(-1)
+        if not len(beams):
+            return self
+        cube = simulate_scan(self.scan, self.targets, self.weather, seed=self.seed, beams=beams,
+                             revolution=revolution, **self.clutter)
+        power = range_doppler(mti(cube, self.taps))
+        hits, threshold = ca_cfar(power)
+        self.raw[beams] = np.mean(np.abs(cube) ** 2, axis=1)
+        self.output[beams] = cfar_output(hits, power, threshold)
+        return self
+
+    def fill(self):
+        """Process a whole revolution (revolution 0) at once, so the maps start complete."""
+        return self.process(np.arange(self.scan.beams))
+
+    def advance(self, angle: float) -> np.ndarray:
+        """Sweep on by ``angle`` radians; returns the beam indices that were refreshed."""
+        start = int(self.position)
+        self.position += max(angle, 0.0) * self.scan.beams / (2 * np.pi)
+        swept = np.arange(start, int(self.position))[-self.scan.beams:]
+        self.process(swept % self.scan.beams, swept // self.scan.beams)
+        return swept % self.scan.beams
+
+    def detections(self, min_power: float = 0.0) -> Detections:
+        """Current detections at least ``min_power`` dB over their CFAR threshold."""
+        found = detections(self.output, self.scan)
+        return found.take(found.power >= min_power)
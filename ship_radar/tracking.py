@@ -0,0 +1,102 @@
+"""Trajectory-driven tracking: precomputed target paths driving HUD mobjects by index.
+
+A ``Track`` holds a target path resampled to one point per frame together with
+its range / azimuth / elevation, all computed up front as arrays. A
+``TrackingDriver`` owns a single progress tracker and a single updater: each
+frame it turns progress into a sample index once and hands that index to every
+bound mobject, which reads its state straight from the arrays -- no
+``get_center()`` round trips and no per-mobject trigonometry.
+
+    track = Track.from_function(path, t_range=(0, 10), samples=241)
+    driver = TrackingDriver(track)
+    driver.follow(target)
+    driver.readout(r_num, "range", scale=2.5)
+    self.add(driver, target)
+    self.play(driver.run(), run_time=8, rate_func=linear)
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from manim import ORIGIN, Mobject, ValueTracker
+
+
+def spherical(positions: np.ndarray, origin=ORIGIN):
+    """Range, azimuth in [0, 360) degrees and elevation in degrees of ``(F, 3)`` positions."""
+    rel = np.asarray(positions, dtype=float) - origin
+    rng = np.linalg.norm(rel, axis=1)
+    azimuth = np.degrees(np.arctan2(rel[:, 1], rel[:, 0])) % 360
+    with np.errstate(invalid="ignore", divide="ignore"):
+        elevation = np.where(rng > 0, np.degrees(np.arcsin(rel[:, 2] / rng)), 0.0)
+    return rng, azimuth, elevation
+
+
+def resample_by_arclength(points: np.ndarray, samples: int) -> np.ndarray:
+    """``samples`` points evenly spaced along a polyline, like MoveAlongPath at a linear rate."""
+    points = np.asarray(points, dtype=float)
+    lengths = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))])
+    targets = np.linspace(0, lengths[-1], samples)
+    return np.column_stack([np.interp(targets, lengths, points[:, k]) for k in range(points.shape[1])])
+
+
+@dataclass(frozen=True)
+class Track:
+    positions: np.ndarray     # (F, 3)
+    range: np.ndarray         # (F,)
+    azimuth: np.ndarray       # (F,) degrees
+    elevation: np.ndarray     # (F,) degrees
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def from_positions(cls, positions, origin=ORIGIN) -> "Track":
+        positions = np.asarray(positions, dtype=float)
+        return cls(positions, *spherical(positions, origin))
+
+    @classmethod
+    def from_function(cls, func, t_range=(0.0, 1.0), samples: int = 241, oversample: int = 8,
+                      origin=ORIGIN) -> "Track":
+        """Sample a vectorized ``func(t) -> (len(t), 3)`` and space the samples evenly along the path."""
+        t = np.linspace(*t_range, samples * oversample)
+        return cls.from_positions(resample_by_arclength(func(t), samples), origin)
+
+
+class TrackingDriver(Mobject):
+    """Invisible mobject whose one updater moves everything bound to its tracks."""
+
+    def __init__(self, *tracks: Track, **kwargs):
+        super().__init__(**kwargs)
+        self.tracks = tracks
+        self.progress = ValueTracker(0)
+        self.bindings = []       # (mobject, func(mobject, track, i), track)
+        self._synced = None
+        self.add_updater(lambda m: m.sync())
+
+    def bind(self, mobject, func, track: int = 0):
+        """Call ``func(mobject, track, i)`` whenever the frame index changes."""
+        self.bindings.append((mobject, func, self.tracks[track]))
+        return mobject
+
+    def follow(self, mobject, track: int = 0):
+        return self.bind(mobject, lambda m, tr, i: m.move_to(tr.positions[i]), track)
+
+    def readout(self, number, column: str, scale: float = 1.0, track: int = 0):
+        """Keep a DecimalNumber on ``range`` / ``azimuth`` / ``elevation`` of the track."""
+        return self.bind(number, lambda m, tr, i: m.set_value(getattr(tr, column)[i] * scale), track)
+
+    def sync(self):
+        alpha = float(np.clip(self.progress.get_value(), 0, 1))
+        if alpha == self._synced:
+            return
+        self._synced = alpha
+        indices = {}
+        for mobject, func, track in self.bindings:
+            i = indices.get(id(track))
+            if i is None:
+                i = indices[id(track)] = int(round(alpha * (len(track) - 1)))
+            func(mobject, track, i)
+
+    def run(self, to: float = 1.0):
+        """Animation advancing the tracks; pass run_time / rate_func to ``play``."""
+        return self.progress.animate.set_value(to)